@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_remove_article_image_article_image_file'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='published',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_alter_article_published'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['article', 'published'], name='comment_article_pub_idx'),
+        ),
+    ]
@@ -7,7 +7,7 @@ class Article(models.Model):
     title = models.TextField(blank=True)
     author = models.TextField(blank=True)
     text = models.TextField(blank=True)
-    published = models.DateTimeField(auto_now=True)
+    published = models.DateTimeField(auto_now=True, db_index=True)
     # image = models.URLField(blank=True)
     image_file = models.ImageField(blank=True)
 
@@ -18,7 +18,8 @@ class Article(models.Model):
         return reverse('article', kwargs={'pk': self.pk})
     
     def get_all_comments(self):
-        return Comment.objects.filter(article=self)
+        # Uses the comments prefetched by ArticleView, if any
+        return self.comment_set.all()
     
 class Comment(models.Model):
     '''Model representing a comment on an article.'''
@@ -27,5 +28,11 @@ class Comment(models.Model):
     text = models.TextField(blank=False)
     published = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # An article's comments, in the order they are shown
+            models.Index(fields=['article', 'published'], name='comment_article_pub_idx'),
+        ]
+
     def __str__(self):
         return f'{self.text}'
\ No newline at end of file
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from .models import *
+from cs412.serializers import SparseFieldsetMixin
  
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
   '''
   A serializer for the Article model.
   Specify which model/fields to send in the API.
@@ -0,0 +1,20 @@
+# File: blog/signals.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Signal receivers for the blog application.
+
+from django.db.models.signals import post_save, post_delete
+from cs412.sampling import invalidate_sampled_ids
+from cs412.api_cache import bump_model_version
+from cs412.caching import connect_cache_invalidation
+from .models import Article, Comment
+
+# Keep the cached id list used for random articles in step with the table
+post_save.connect(invalidate_sampled_ids, sender=Article)
+post_delete.connect(invalidate_sampled_ids, sender=Article)
+
+# New API response versions (ETags) whenever an article changes
+post_save.connect(bump_model_version, sender=Article)
+post_delete.connect(bump_model_version, sender=Article)
+
+# Cached pages showing comment counts
+connect_cache_invalidation(Comment)
@@ -1,3 +1,56 @@
+# File: blog/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for the blog pages' comment counts and lists.
+
+from django.core.cache import caches
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from .models import Article, Comment
+
+
+class CommentQueryTests(TestCase):
+    '''Comment counts and lists are loaded in a fixed number of queries, and
+    cached pages pick up new comments right away.'''
+
+    def setUp(self):
+        for alias in ['default', 'versions']:
+            caches[alias].clear()
+
+    def add_articles(self, count, comments=2):
+        for i in range(count):
+            article = Article.objects.create(title=f'Article {i}', author='Author', text='Text')
+            for j in range(comments):
+                Comment.objects.create(article=article, author='Reader', text=f'Comment {j}')
+        caches['default'].clear()
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_show_all_queries_dont_grow_with_articles(self):
+        self.add_articles(2)
+        few = self.count_queries('/blog/show_all')
+        self.add_articles(8)
+        self.assertEqual(self.count_queries('/blog/show_all'), few)
+
+    def test_show_all_counts_comments(self):
+        self.add_articles(1, comments=3)
+        self.assertContains(self.client.get('/blog/show_all'), '3 comments')
+
+    def test_article_queries_dont_grow_with_comments(self):
+        self.add_articles(1, comments=1)
+        article = Article.objects.get()
+        few = self.count_queries(reverse('article', kwargs={'pk': article.pk}))
+        for i in range(10):
+            Comment.objects.create(article=article, author='Reader', text=f'More {i}')
+        self.assertEqual(self.count_queries(reverse('article', kwargs={'pk': article.pk})), few)
 
-# Create your tests here.
+    def test_new_comment_updates_cached_page(self):
+        self.add_articles(1, comments=1)
+        self.assertContains(self.client.get('/blog/show_all'), '1 comment')
+        Comment.objects.create(article=Article.objects.get(), author='Reader', text='Another')
+        self.assertContains(self.client.get('/blog/show_all'), '2 comments')
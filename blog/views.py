@@ -1,8 +1,14 @@
-from django.shortcuts import render
+from django.shortcuts import render, get_object_or_404
+from django.db.models import Count, Prefetch
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from .models import Article, Comment
 from .forms import CreateArticleForm, CreateCommentForm, UpdateArticleForm
-import random
+from cs412.sampling import random_instance
+from cs412.api_cache import CachedResponseMixin
+from cs412.caching import cached_page
+from django.utils.decorators import method_decorator
+from cs412.pagination import PublishedCursorPagination
+from django.http import Http404
 from django.urls import reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.forms import UserCreationForm
@@ -13,16 +19,26 @@ from .serializers import *
 
 
 # Create your views here.
+@method_decorator(cached_page(models=[Article, Comment]), name='dispatch')
 class ShowAllView(ListView):
     model = Article
     template_name = 'blog/show_all.html'
     context_object_name = 'articles'
+    paginate_by = 12
+
+    def get_queryset(self):
+        # Count comments in the same query instead of one query per article
+        return Article.objects.annotate(comment_count=Count('comment')).order_by('-published', '-pk')
 
 
 class ArticleView(DetailView):
     model = Article
     template_name = 'blog/article.html'
     context_object_name = 'article'
+    # Load all the comments in one extra query, oldest first
+    queryset = Article.objects.prefetch_related(
+        Prefetch('comment_set', queryset=Comment.objects.order_by('published', 'pk'))
+    )
 
 class RandomArticleView(DetailView):
     model = Article
@@ -30,8 +46,10 @@ class RandomArticleView(DetailView):
     context_object_name = 'article'
 
     def get_object(self):
-        articles = list(Article.objects.all())
-        return random.choice(articles)
+        article = random_instance(Article)
+        if article is None:
+            raise Http404('No articles yet.')
+        return article
 
 class CreateArticleView(LoginRequiredMixin, CreateView):
     form_class = CreateArticleForm
@@ -54,16 +72,20 @@ class CreateCommentView(CreateView):
     def get_success_url(self):
         pk = self.kwargs['pk']
         return reverse('article', kwargs={'pk': pk})
+
+    def get_article(self):
+        # Look the article up once per request
+        if not hasattr(self, 'article'):
+            self.article = get_object_or_404(Article, pk=self.kwargs['pk'])
+        return self.article
     
     def get_context_data(self):
         context = super().get_context_data()
-        context['article'] = Article.objects.get(pk=self.kwargs['pk'])
+        context['article'] = self.get_article()
         return context
 
     def form_valid(self, form):
-        pk = self.kwargs['pk']
-        article = Article.objects.get(pk=pk)
-        form.instance.article = article
+        form.instance.article = self.get_article()
         return super().form_valid(form)
     
 class UpdateArticleView(UpdateView):
@@ -76,10 +98,8 @@ class DeleteCommentView(DeleteView):
     template_name = 'blog/delete_comment_form.html'
     
     def get_success_url(self):
-        pk = self.kwargs['pk']
-        comment = Comment.objects.get(pk=pk)
-        article = comment.article
-        return reverse('article', kwargs={'pk': article.pk})
+        # self.object is the comment being deleted
+        return reverse('article', kwargs={'pk': self.object.article_id})
     
 class UserRegistrationView(CreateView):
     form_class = UserCreationForm
@@ -89,13 +109,14 @@ class UserRegistrationView(CreateView):
     def get_success_url(self):
         return reverse('login')
 
-class ArticleListAPIView(generics.ListCreateAPIView):
+class ArticleListAPIView(CachedResponseMixin, generics.ListCreateAPIView):
   '''
   An API view to return a listing of Articles 
   and to create an Article.
   '''
   queryset = Article.objects.all()
   serializer_class = ArticleSerializer
+  pagination_class = PublishedCursorPagination
  
 class ArticleDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
   queryset = Article.objects.all()
@@ -0,0 +1,109 @@
+# File: cs412/api_cache.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Response caching for read-mostly REST API views. Each model has
+# a version in a cache shared by all processes that is bumped on save/delete;
+# responses are keyed on the versions they depend on, so writes (in any
+# worker, or a loader command) invalidate them without a scan.
+
+import hashlib
+import time
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+# How long (in seconds) a rendered response is kept. Writes change the key, so
+# this only bounds how long unused entries sit in the cache.
+API_CACHE_TTL = 60 * 60
+
+# Cache holding the model versions. It must be shared between processes
+# (settings.CACHES['versions'] is file based), or a write would only
+# invalidate the cached responses of the worker that made it.
+MODEL_VERSION_CACHE = 'versions'
+
+# Model versions outlive the responses keyed on them. An expired version is
+# simply replaced, costing one cache miss per page.
+MODEL_VERSION_TTL = 24 * 60 * 60
+
+
+def model_version_cache_key(model):
+    '''Return the cache key holding the version of the given model.'''
+    return f'model_version:{model._meta.label_lower}'
+
+
+def new_model_version():
+    '''Return a fresh (version, last modified timestamp) pair.'''
+    now = time.time_ns()
+    return f'{now:x}', now // 10**9
+
+
+def get_model_version(model):
+    '''Return the (version, last modified timestamp) of the model. A version
+    that fell out of the cache is replaced by a new one, which only costs a
+    cache miss on the next request.'''
+    versions = caches[MODEL_VERSION_CACHE]
+    key = model_version_cache_key(model)
+    version = versions.get(key)
+    if version is None:
+        version = new_model_version()
+        if not versions.add(key, version, MODEL_VERSION_TTL):
+            version = versions.get(key) or version
+    return version
+
+
+def bump_model_version(sender, **kwargs):
+    '''Signal receiver: give the model a new version when a row is saved or
+    deleted. Connect to post_save and post_delete. Bulk writes that skip
+    signals (update(), bulk_create()) must call this themselves.'''
+    caches[MODEL_VERSION_CACHE].set(model_version_cache_key(sender), new_model_version(), MODEL_VERSION_TTL)
+
+
+class CachedResponseMixin:
+    '''Mixin for DRF views that serves GETs from rendered JSON in the cache.
+    Responses carry an ETag and Last-Modified derived from the versions of
+    `cache_models` (the view's model by default), and conditional GETs are
+    answered with 304 before any query or serializer runs.'''
+
+    cache_models = None
+    cache_timeout = API_CACHE_TTL
+
+    def get_cache_models(self):
+        if self.cache_models is not None:
+            return self.cache_models
+        return [self.queryset.model]
+
+    def get(self, request, *args, **kwargs):
+        versions = [get_model_version(model) for model in self.get_cache_models()]
+        media_type = request.accepted_media_type
+        fingerprint = '|'.join([
+            type(self).__module__, type(self).__qualname__,
+            request.get_full_path(), media_type,
+            *(version for version, _ in versions),
+        ])
+        etag = '"{}"'.format(hashlib.md5(fingerprint.encode()).hexdigest())
+        last_modified = max(modified for _, modified in versions)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            # Only JSON is cached; the browsable API is rendered every time
+            cacheable = request.accepted_renderer.format == 'json'
+            key = f'api_response:{etag}'
+            cached = cache.get(key) if cacheable else None
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+            else:
+                response = super().get(request, *args, **kwargs)
+                if not (cacheable and response.status_code == 200):
+                    return response
+                response.accepted_renderer = request.accepted_renderer
+                response.accepted_media_type = media_type
+                response.renderer_context = self.get_renderer_context()
+                response.render()
+                cache.set(key, (response.content, response['Content-Type']), self.cache_timeout)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Let clients keep a copy but revalidate it on every use
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
@@ -0,0 +1,17 @@
+# File: cs412/apps.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: App config for the cs412 project package, so project-wide
+# hooks and management commands have somewhere to live.
+
+from django.apps import AppConfig
+
+
+class Cs412Config(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'cs412'
+
+    def ready(self):
+        # Tune every new SQLite connection (see cs412/db.py)
+        from django.db.backends.signals import connection_created
+        from .db import tune_sqlite_connection
+        connection_created.connect(tune_sqlite_connection, dispatch_uid='cs412.tune_sqlite_connection')
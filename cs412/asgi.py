@@ -5,6 +5,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+Live meal chat (project.views.meal_chat_stream) is an async streaming view,
+so serve the site through this module (e.g. `uvicorn cs412.asgi:application`)
+to keep idle chat connections off the worker threads.
 """
 
 import os
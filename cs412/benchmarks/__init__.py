@@ -0,0 +1,4 @@
+# File: cs412/benchmarks/__init__.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Benchmark suite for the hot views, run with
+# `python manage.py benchmark` (see cs412/management/commands/benchmark.py).
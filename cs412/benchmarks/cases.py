@@ -0,0 +1,67 @@
+# File: cs412/benchmarks/cases.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: The hot endpoints timed by `manage.py benchmark`. Each case
+# resolves its URL against the generated data, so ids don't need to be known.
+
+from django.db.models import Count
+from django.urls import reverse
+from marathon_analytics.models import Result
+from mini_insta.models import Profile
+from project.models import MealPost
+
+
+class Case:
+    '''One benchmarked request: a name, a group, a function returning the
+    URL and the username to log in as (or None for anonymous).'''
+
+    def __init__(self, name, group, url, login=None):
+        self.name = name
+        self.group = group
+        self.url = url
+        self.login = login
+
+
+def busiest_follower():
+    '''Username of the insta profile following the most profiles.'''
+    # Follow.follower_profile's related_name is 'follower_profile', so this
+    # counts the follows where the profile is the follower
+    profile = (Profile.objects.annotate(following=Count('follower_profile'))
+               .order_by('-following', 'pk').first())
+    return profile.username
+
+
+def median_result_url():
+    '''A runner in the middle of the field (the most passes to count).'''
+    count = Result.objects.count()
+    result = Result.objects.order_by('place_overall').values_list('pk', flat=True)[count // 2]
+    return reverse('result_detail', kwargs={'pk': result})
+
+
+def busy_meal():
+    '''The upcoming meal with the most guests, and its host's username.'''
+    return (MealPost.objects.filter(status__in=['open', 'full'])
+            .select_related('host__user').order_by('-accepted_count', 'pk').first())
+
+
+CASES = [
+    Case('voter_list', 'voter_analytics', lambda: reverse('voters')),
+    Case('voter_list_filtered', 'voter_analytics',
+         lambda: reverse('voters') + '?party=D&min_dob=1960&max_dob=1990&voter_score=3&v22general=on'),
+    Case('voter_export', 'voter_analytics', lambda: reverse('voters_export') + '?party=D&gzip=1'),
+    Case('voter_graphs', 'voter_analytics', lambda: reverse('graphs') + '?party=R'),
+    Case('results_list', 'marathon_analytics', lambda: reverse('results_list')),
+    Case('result_detail', 'marathon_analytics', median_result_url),
+    Case('insta_profiles', 'mini_insta', lambda: reverse('show_all_profiles')),
+    Case('insta_feed', 'mini_insta', lambda: reverse('show_feed'), login=busiest_follower),
+    Case('insta_search', 'mini_insta', lambda: reverse('search') + '?query=sunset', login=busiest_follower),
+    Case('meal_list', 'project', lambda: reverse('meal_list')),
+    Case('meal_search', 'project', lambda: reverse('meal_search') + '?q=pizza&status=open'),
+    Case('meal_detail', 'project', lambda: reverse('meal_detail', kwargs={'pk': busy_meal().pk}),
+         login=lambda: busy_meal().host.user.username),
+    Case('find_matches', 'project', lambda: reverse('find_matches'), login=lambda: 'meal0'),
+    Case('find_meal_matches', 'project', lambda: reverse('find_matches') + '?mode=meals', login=lambda: 'meal0'),
+    Case('random_joke', 'dadjokes', lambda: '/dadjokes/random'),
+    Case('random_joke_api', 'dadjokes', lambda: '/dadjokes/api/random'),
+    Case('joke_list_api', 'dadjokes', lambda: '/dadjokes/api/jokes'),
+    Case('blog_show_all', 'blog', lambda: '/blog/show_all'),
+]
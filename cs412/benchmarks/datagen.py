@@ -0,0 +1,225 @@
+# File: cs412/benchmarks/datagen.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Generates realistic volumes of data for every app with
+# bulk_create, from a fixed seed so runs on different commits see the same data.
+
+import random
+from datetime import datetime, time, timedelta
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from blog.models import Article, Comment as ArticleComment
+from cs412.api_cache import bump_model_version
+from cs412.routers import ANALYTICS_DB
+from dadjokes.models import Joke, Picture
+from marathon_analytics.models import Result
+from mini_insta.models import Profile, Post, Photo, Follow, Comment, Like
+from project.models import DiningLocation, UserProfile, MealPost, JoinRequest, MealMessage
+from project.occupancy import rebuild_occupancy
+from voter_analytics.models import Voter
+
+# Row counts at scale 1.0
+VOLUMES = {
+    'voters': 50000,
+    'results': 48000,
+    'insta_profiles': 10000,
+    'follows_per_profile': 15,
+    'posts_per_profile': 2,
+    'likes_per_post': 2,
+    'comments_per_post': 1,
+    'meal_profiles': 2000,
+    'locations': 12,
+    'meals': 5000,
+    'join_requests': 20000,
+    'messages': 10000,
+    'jokes': 1000,
+    'pictures': 200,
+    'articles': 300,
+    'comments_per_article': 5,
+}
+
+# Password of every generated user
+PASSWORD = 'benchmark'
+
+BATCH_SIZE = 2000
+
+WORDS = ['sunset', 'coffee', 'campus', 'study', 'pizza', 'river', 'concert', 'snow', 'game', 'library',
+         'ramen', 'beach', 'friends', 'lab', 'run', 'brunch', 'museum', 'city', 'night', 'spring']
+
+
+def choices(model, field):
+    '''Return the stored values of a model field's choices.'''
+    return [value for value, _ in model._meta.get_field(field).choices]
+
+
+def sentence(rng, words=6):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def scaled(name, scale):
+    return max(1, int(VOLUMES[name] * scale))
+
+
+def bulk(model, objects, using=None):
+    '''bulk_create in batches and return the created objects (with pks).'''
+    return model.objects.using(using).bulk_create(objects, batch_size=BATCH_SIZE)
+
+
+def make_users(prefix, count, password):
+    return bulk(User, [User(username=f'{prefix}{i}', password=password) for i in range(count)])
+
+
+def generate_analytics(rng, scale):
+    '''Voters and marathon results, written to the analytics database.'''
+    parties = ['D', 'R', 'U', 'L', 'J', 'G', 'CC', 'X']
+    with transaction.atomic(using=ANALYTICS_DB):
+        bulk(Voter, [Voter(
+            last_name=f'Last{rng.randrange(8000)}', first_name=f'First{rng.randrange(3000)}',
+            street_number=str(rng.randrange(1, 400)), street_name=f'{rng.choice(WORDS).title()} St',
+            zip_code=rng.choice(['02458', '02459', '02460', '02461', '02462']),
+            date_of_birth=f'{rng.randrange(1930, 2005)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}',
+            date_of_registration=f'{rng.randrange(1960, 2023)}-01-01',
+            party=rng.choice(parties), precinct=str(rng.randrange(1, 9)),
+            v20state=rng.randrange(2), v21town=rng.randrange(2), v21primary=rng.randrange(2),
+            v22general=rng.randrange(2), v23town=rng.randrange(2), voter_score=rng.randrange(6),
+        ) for _ in range(scaled('voters', scale))], using=ANALYTICS_DB)
+
+        results = []
+        count = scaled('results', scale)
+        for i in range(count):
+            start = 7 * 3600 + 30 * 60 + rng.randrange(3600)
+            half1 = rng.randrange(3600 + 1200, 3 * 3600)
+            half2 = int(half1 * rng.uniform(0.95, 1.2))
+            finish = half1 + half2
+            results.append(Result(
+                bib=i + 1, first_name=f'First{rng.randrange(3000)}', last_name=f'Last{rng.randrange(8000)}',
+                ctz='USA', city=rng.choice(['Chicago', 'Boston', 'Denver', 'Austin']), state=rng.choice(['IL', 'MA', 'CO', 'TX']),
+                gender=rng.choice(['M', 'F']), division=rng.choice(['20-24', '25-29', '30-34', '35-39', '40-44']),
+                place_overall=0, place_gender=0, place_division=0,
+                start_time_of_day=seconds_to_time(start), finish_time_of_day=seconds_to_time(start + finish),
+                time_finish=seconds_to_time(finish), time_half1=seconds_to_time(half1), time_half2=seconds_to_time(half2),
+            ))
+        results.sort(key=lambda result: result.time_finish)
+        for place, result in enumerate(results, start=1):
+            result.place_overall = result.place_gender = result.place_division = place
+        bulk(Result, results, using=ANALYTICS_DB)
+
+
+def seconds_to_time(seconds):
+    seconds %= 24 * 3600
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def generate_mini_insta(rng, scale, password):
+    '''Profiles with a random follow graph, posts, photos, likes and comments.'''
+    count = scaled('insta_profiles', scale)
+    users = make_users('insta', count, password)
+    profiles = bulk(Profile, [Profile(
+        user=user, username=user.username, display_name=f'Insta User {i}',
+        profile_image_url=f'https://picsum.photos/seed/{i}/200', bio_text=sentence(rng, 10),
+    ) for i, user in enumerate(users)])
+
+    follows = []
+    for profile in profiles:
+        for followed in rng.sample(profiles, min(VOLUMES['follows_per_profile'], count - 1)):
+            if followed.pk != profile.pk:
+                follows.append(Follow(profile=followed, follower_profile=profile))
+    bulk(Follow, follows)
+
+    posts = bulk(Post, [Post(profile=profile, caption=sentence(rng))
+                        for profile in profiles for _ in range(VOLUMES['posts_per_profile'])])
+    bulk(Photo, [Photo(post=post, image_url=f'https://picsum.photos/seed/post{post.pk}/600') for post in posts])
+    bulk(Like, [Like(post=post, profile=rng.choice(profiles))
+                for post in posts for _ in range(VOLUMES['likes_per_post'])])
+    bulk(Comment, [Comment(post=post, profile=rng.choice(profiles), text=sentence(rng, 4))
+                   for post in posts for _ in range(VOLUMES['comments_per_post'])])
+
+
+def generate_project(rng, scale, password):
+    '''Meal profiles, locations, meals (past and upcoming), join requests and chat.'''
+    locations = bulk(DiningLocation, [DiningLocation(
+        name=f'{rng.choice(WORDS).title()} Dining {i}', address=f'{i} Commonwealth Ave',
+        capacity=rng.choice([40, 80, 150]), location_type=rng.choice(['Dining Hall', 'Cafe', 'Restaurant']),
+    ) for i in range(VOLUMES['locations'])])
+
+    users = make_users('meal', scaled('meal_profiles', scale), password)
+    field_choices = {field: choices(UserProfile, field) for field in [
+        'dietary_preference', 'usual_meal_time', 'vibe', 'social_battery', 'interest', 'spice_tolerance']}
+    profiles = bulk(UserProfile, [UserProfile(
+        user=user, display_name=f'Meal User {i}', bio=sentence(rng, 8),
+        preferred_location=rng.choice(locations), major=rng.choice(['CS', 'Math', 'Biology', 'History']),
+        class_year=rng.randrange(2025, 2030),
+        **{field: rng.choice(values) for field, values in field_choices.items()},
+    ) for i, user in enumerate(users)])
+
+    now = timezone.now()
+    meals = bulk(MealPost, [MealPost(
+        host=rng.choice(profiles), title=f'{sentence(rng, 3)} meal', location=rng.choice(locations),
+        start_time=(now + timedelta(hours=rng.randrange(-24 * 30, 24 * 30))).replace(minute=rng.choice([0, 30]), second=0, microsecond=0),
+        description=sentence(rng, 12), max_guests=rng.randrange(1, 7),
+        status='open',
+    ) for _ in range(scaled('meals', scale))])
+
+    # Join requests: accepted ones never exceed the meal's seats
+    accepted = {meal.pk: 0 for meal in meals}
+    seen = set()
+    requests = []
+    for _ in range(scaled('join_requests', scale)):
+        meal, requester = rng.choice(meals), rng.choice(profiles)
+        if requester.pk == meal.host_id or (meal.pk, requester.pk) in seen:
+            continue
+        seen.add((meal.pk, requester.pk))
+        status = rng.choice(['pending', 'accepted', 'accepted', 'declined', 'waitlisted'])
+        if status == 'accepted':
+            if accepted[meal.pk] >= meal.max_guests:
+                status = 'waitlisted'
+            else:
+                accepted[meal.pk] += 1
+        requests.append(JoinRequest(meal=meal, requester=requester, message=sentence(rng, 5), status=status))
+    bulk(JoinRequest, requests)
+
+    for meal in meals:
+        meal.accepted_count = accepted[meal.pk]
+        if meal.start_time < now - timedelta(hours=1):
+            meal.status = 'completed'
+        elif accepted[meal.pk] >= meal.max_guests:
+            meal.status = 'full'
+        elif rng.random() < 0.05:
+            meal.status = 'canceled'
+    MealPost.objects.bulk_update(meals, ['accepted_count', 'status'], batch_size=BATCH_SIZE)
+
+    bulk(MealMessage, [MealMessage(meal=meal, sender=meal.host, message=sentence(rng, 6))
+                       for meal in rng.choices(meals, k=scaled('messages', scale))])
+    rebuild_occupancy()
+
+
+def generate_small_apps(rng, scale):
+    '''Jokes, pictures, and blog articles with comments.'''
+    bulk(Joke, [Joke(text=f'Why did the {rng.choice(WORDS)} cross the road? {sentence(rng, 5)}',
+                     contributor=f'User {i}') for i in range(scaled('jokes', scale))])
+    bulk(Picture, [Picture(image_url=f'https://picsum.photos/seed/joke{i}/400', contributor=f'User {i}')
+                   for i in range(scaled('pictures', scale))])
+    articles = bulk(Article, [Article(title=sentence(rng, 4), author=f'Author {i}', text=sentence(rng, 200))
+                              for i in range(scaled('articles', scale))])
+    bulk(ArticleComment, [ArticleComment(article=article, author=f'Reader {i}', text=sentence(rng, 10))
+                          for article in articles for i in range(VOLUMES['comments_per_article'])])
+
+
+def generate(scale=1.0, seed=412):
+    '''Fill every app with generated data. Returns the password of the
+    generated users (insta<n> and meal<n>).'''
+    rng = random.Random(seed)
+    password = make_password(PASSWORD)
+    generate_analytics(rng, scale)
+    with transaction.atomic():
+        generate_mini_insta(rng, scale, password)
+        generate_project(rng, scale, password)
+        generate_small_apps(rng, scale)
+    # Everything above skipped save signals
+    for model in apps.get_models():
+        bump_model_version(model)
+    cache.clear()
+    return PASSWORD
@@ -0,0 +1,127 @@
+# File: cs412/benchmarks/runner.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Times benchmark cases through the Django test client and
+# writes/compares results in a pytest-benchmark style JSON layout.
+
+import platform
+import statistics
+import subprocess
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+import django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.test import Client
+from cs412.instrumentation import QueryTimer
+
+
+def time_request(client, url, clear_cache):
+    '''Make one GET and return (seconds, queries, status code, bytes).'''
+    if clear_cache:
+        cache.clear()
+    timer = QueryTimer()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timer))
+        start = time.perf_counter()
+        response = client.get(url)
+        size = len(b''.join(response.streaming_content)) if response.streaming else len(response.content)
+        elapsed = time.perf_counter() - start
+    return elapsed, timer.count, response.status_code, size
+
+
+def run_case(case, password, rounds, warmup, clear_cache):
+    '''Time a case and return its result entry.'''
+    client = Client()
+    if case.login is not None:
+        client.login(username=case.login(), password=password)
+    url = case.url()
+    for _ in range(warmup):
+        time_request(client, url, clear_cache)
+
+    timings, queries = [], []
+    for _ in range(rounds):
+        elapsed, count, status, size = time_request(client, url, clear_cache)
+        timings.append(elapsed)
+        queries.append(count)
+
+    return {
+        'name': case.name,
+        'group': case.group,
+        'params': {'url': url, 'login': case.login is not None, 'cold_cache': clear_cache},
+        'stats': {
+            'min': min(timings),
+            'max': max(timings),
+            'mean': statistics.mean(timings),
+            'median': statistics.median(timings),
+            'stddev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            'rounds': rounds,
+            'ops': 1 / statistics.mean(timings),
+            'data': timings,
+        },
+        'extra_info': {
+            'queries': max(queries),
+            'status': status,
+            'bytes': size,
+        },
+    }
+
+
+def commit_info():
+    '''Return the current git commit, branch and dirty flag (if available).'''
+    def git(*args):
+        try:
+            return subprocess.run(['git', *args], cwd=settings.BASE_DIR, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ''
+    return {
+        'id': git('rev-parse', 'HEAD'),
+        'branch': git('rev-parse', '--abbrev-ref', 'HEAD'),
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+    }
+
+
+def run_benchmarks(cases, password, rounds=5, warmup=1, clear_cache=True, options=None):
+    '''Run all the cases and return the full JSON-ready report.'''
+    return {
+        'machine_info': {
+            'python_version': platform.python_version(),
+            'django_version': django.get_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+        },
+        'commit_info': commit_info(),
+        'datetime': datetime.now(timezone.utc).isoformat(),
+        'options': options or {},
+        'benchmarks': [run_case(case, password, rounds, warmup, clear_cache) for case in cases],
+    }
+
+
+def compare(old, new, threshold):
+    '''Compare two reports. Returns (rows, regressed): a row per benchmark in
+    both reports, and whether any median got slower than 1 + threshold times
+    the old one, or ran more queries.'''
+    old_by_name = {bench['name']: bench for bench in old['benchmarks']}
+    rows = []
+    regressed = False
+    for bench in new['benchmarks']:
+        before = old_by_name.get(bench['name'])
+        if before is None:
+            continue
+        ratio = bench['stats']['median'] / before['stats']['median'] if before['stats']['median'] else 1.0
+        query_delta = bench['extra_info']['queries'] - before['extra_info']['queries']
+        slower = ratio > 1 + threshold or query_delta > 0
+        regressed = regressed or slower
+        rows.append({
+            'name': bench['name'],
+            'old_ms': before['stats']['median'] * 1000,
+            'new_ms': bench['stats']['median'] * 1000,
+            'ratio': ratio,
+            'old_queries': before['extra_info']['queries'],
+            'new_queries': bench['extra_info']['queries'],
+            'regressed': slower,
+        })
+    return rows, regressed
@@ -0,0 +1,21 @@
+# File: cs412/cache_tags.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Template tags for fragment caching, registered as the
+# 'cache_versions' library in settings.TEMPLATES.
+#
+# Usage:
+#   {% load cache cache_versions %}
+#   {% models_version 'mini_insta.Post' 'mini_insta.Like' as version %}
+#   {% cache 300 feed_card post.pk version %} ... {% endcache %}
+
+from django import template
+from .caching import models_version as get_models_version
+
+register = template.Library()
+
+
+@register.simple_tag
+def models_version(*models):
+    '''Return a string that changes whenever any of the models changes,
+    for use as a {% cache %} vary-on argument.'''
+    return get_models_version(*models)
@@ -0,0 +1,86 @@
+# File: cs412/caching.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Full-page and template-fragment caching shared by the apps.
+# Cached pages and fragments are keyed on the versions of the models they
+# show (see cs412/api_cache.py), so save/delete signals invalidate them.
+
+import hashlib
+from functools import wraps
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from .api_cache import bump_model_version, get_model_version
+
+# Default lifetime (in seconds) of a cached page or fragment
+PAGE_CACHE_TTL = 5 * 60
+
+
+def connect_cache_invalidation(*models):
+    '''Bump the cache version of each model whenever one of its rows is
+    saved or deleted, dropping the pages/fragments keyed on it.'''
+    for model in models:
+        post_save.connect(bump_model_version, sender=model)
+        post_delete.connect(bump_model_version, sender=model)
+
+
+def models_version(*models):
+    '''Return one string that changes whenever any of the models changes.
+    Models can be classes or 'app_label.ModelName' labels.'''
+    versions = []
+    for model in models:
+        if isinstance(model, str):
+            model = apps.get_model(model)
+        versions.append(get_model_version(model)[0])
+    return '.'.join(versions)
+
+
+def cached_page(timeout=PAGE_CACHE_TTL, models=(), vary_on_user=True, vary_on_cookies=()):
+    '''Decorator caching the rendered GET/HEAD response of a view.
+
+    - models: the models the page shows; saving or deleting any of their
+      rows invalidates the page.
+    - vary_on_user: logged-in users get their own copy (anonymous visitors
+      share one). Turn off for pages that never show the user.
+    - vary_on_cookies: names of cookies whose values change the page.
+
+    Responses that set cookies, use a CSRF token, show flash messages or
+    aren't 200 are not cached. Use with method_decorator(..., name='dispatch') on class views.'''
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            user_id = request.user.pk if vary_on_user and request.user.is_authenticated else None
+            fingerprint = '|'.join([
+                view_func.__module__, view_func.__qualname__, request.get_full_path(),
+                f'user={user_id}', models_version(*models),
+                *(f'{name}={request.COOKIES.get(name, "")}' for name in vary_on_cookies),
+            ])
+            key = 'page:{}'.format(hashlib.md5(fingerprint.encode()).hexdigest())
+
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+            else:
+                response = view_func(request, *args, **kwargs)
+                if hasattr(response, 'render') and callable(response.render):
+                    response = response.render()
+                cacheable = (response.status_code == 200 and not response.streaming
+                             and not response.cookies
+                             # A CSRF token or flash messages in the page are
+                             # tied to this visitor
+                             and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+                             and not getattr(getattr(request, '_messages', None), 'used', False))
+                if cacheable:
+                    cache.set(key, (response.content, response['Content-Type']), timeout)
+
+            if vary_on_user or vary_on_cookies:
+                patch_vary_headers(response, ['Cookie'])
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,51 @@
+# File: cs412/db.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: SQLite tuning applied to every new database connection.
+# WAL lets readers keep going while a writer (a form post or a bulk load) is
+# committing, and the busy timeout makes writers queue instead of failing
+# with "database is locked".
+
+from django.conf import settings
+
+# PRAGMA name -> value, run in this order on each new SQLite connection.
+# Override (or extend) with settings.SQLITE_PRAGMAS, or per database with a
+# 'PRAGMAS' entry in its DATABASES settings (None skips a PRAGMA).
+DEFAULT_SQLITE_PRAGMAS = {
+    # Readers don't block the writer and the writer doesn't block readers
+    'journal_mode': 'WAL',
+    # Safe with WAL: a power loss can only lose the last commits, never corrupt
+    'synchronous': 'NORMAL',
+    # Milliseconds to wait for a lock before raising "database is locked"
+    'busy_timeout': 5000,
+    # Negative means KiB: a 64 MB page cache per connection
+    'cache_size': -64 * 1024,
+    # Read the database through a 256 MB memory map instead of read() calls
+    'mmap_size': 256 * 1024 * 1024,
+    # Keep temporary tables and indexes (sorts, GROUP BY) in memory
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON',
+}
+
+
+def get_sqlite_pragmas(settings_dict=None):
+    '''Return the PRAGMAs to run on new connections, with settings.SQLITE_PRAGMAS
+    and the database's own 'PRAGMAS' entry (if a settings_dict is given) applied.'''
+    pragmas = {**DEFAULT_SQLITE_PRAGMAS, **getattr(settings, 'SQLITE_PRAGMAS', {})}
+    if settings_dict:
+        pragmas.update(settings_dict.get('PRAGMAS', {}))
+    return pragmas
+
+
+def apply_pragmas(cursor, pragmas):
+    '''Run the given PRAGMAs on a DB-API cursor. None values are skipped.'''
+    for name, value in pragmas.items():
+        if value is not None:
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def tune_sqlite_connection(sender, connection, **kwargs):
+    '''connection_created receiver: apply the SQLite PRAGMAs to the new connection.'''
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor, get_sqlite_pragmas(connection.settings_dict))
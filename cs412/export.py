@@ -0,0 +1,101 @@
+# File: cs412/export.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Streaming CSV/NDJSON downloads of large querysets. Rows are
+# read with .values_list().iterator() and encoded a batch at a time, so the
+# worker's memory use doesn't grow with the number of rows exported.
+
+import csv
+import io
+import json
+import zlib
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+# Rows fetched from the database per round trip
+EXPORT_CHUNK_SIZE = 2000
+
+# Rows encoded into each chunk of the response body
+ROWS_PER_WRITE = 500
+
+# ?format= value -> (Content-Type, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+def iter_rows(queryset, fields, row_filter=None):
+    '''Yield the given fields of every row as tuples, EXPORT_CHUNK_SIZE rows
+    per query. row_filter(row) can drop rows the DB can't filter.'''
+    rows = queryset.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    if row_filter is None:
+        return rows
+    return (row for row in rows if row_filter(row))
+
+
+def batches(rows, size=ROWS_PER_WRITE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def encode_csv(fields, rows):
+    '''Yield a header line, then the rows as CSV, a batch at a time.'''
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(fields)
+    yield flush()
+    for batch in batches(rows):
+        writer.writerows(batch)
+        yield flush()
+
+
+def encode_ndjson(fields, rows):
+    '''Yield the rows as one JSON object per line, a batch at a time.'''
+    encoder = DjangoJSONEncoder()
+    for batch in batches(rows):
+        yield ''.join(encoder.encode(dict(zip(fields, row))) + '\n' for row in batch).encode()
+
+
+def gzip_stream(chunks):
+    '''Gzip a stream of byte chunks on the fly.'''
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_response(request, filename, fields, rows):
+    '''Return a StreamingHttpResponse downloading rows (tuples of the given
+    fields) as filename.csv, or as NDJSON with ?format=ndjson. ?gzip=1
+    compresses it to a .gz file.'''
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        export_format = 'csv'
+    content_type, extension = EXPORT_FORMATS[export_format]
+    encode = encode_csv if export_format == 'csv' else encode_ndjson
+    chunks = encode(fields, rows)
+    filename = f'{filename}.{extension}'
+
+    if request.GET.get('gzip'):
+        chunks = gzip_stream(chunks)
+        content_type = 'application/gzip'
+        filename += '.gz'
+
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
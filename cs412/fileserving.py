@@ -0,0 +1,151 @@
+# File: cs412/fileserving.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Serving files from disk efficiently: validators (ETag and
+# Last-Modified) so repeat requests get a bodyless 304, single byte ranges
+# (206) for partial downloads, and FileResponse so the file is streamed
+# (with sendfile under a capable server) instead of being read into memory.
+# The transfer can also be handed to a fronting server (X-Accel-Redirect /
+# X-Sendfile) so no Python worker is tied up sending bytes.
+
+import mimetypes
+import os
+import re
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+# Header handing a file off to the fronting server, by offload mode
+OFFLOAD_HEADERS = {
+    'x-accel-redirect': 'X-Accel-Redirect',  # nginx: value is an internal URL
+    'x-sendfile': 'X-Sendfile',  # Apache mod_xsendfile/lighttpd: value is the file path
+}
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFile:
+    '''File wrapper that reads at most length bytes from the current
+    position. It keeps fileno(), so servers that sendfile() the wrapped file
+    (bounded by Content-Length) still do.'''
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def file_etag(stat, suffix=''):
+    '''Return a strong ETag for a file from its modification time and size.'''
+    return f'"{int(stat.st_mtime):x}-{stat.st_size:x}{suffix}"'
+
+
+def guess_content_type(path):
+    '''Return the Content-Type to serve a file with.'''
+    content_type, _ = mimetypes.guess_type(str(path))
+    content_type = content_type or 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+        content_type += '; charset=utf-8'
+    return content_type
+
+
+def parse_range(header, size):
+    '''Return (first, last) byte positions for a single-range Range header,
+    None if the header should be ignored (missing, malformed or several
+    ranges: the whole file is sent), or False if it can't be satisfied.'''
+    match = RANGE_RE.match(header.replace(' ', '')) if header else None
+    if match is None or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            return False
+        return max(size - length, 0), size - 1
+    first = int(first)
+    last = min(int(last), size - 1) if last else size - 1
+    if first >= size or first > last:
+        return False
+    return first, last
+
+
+def if_range_matches(request, etag, mtime):
+    '''Return True if there's no If-Range header or it still matches the
+    file, i.e. a requested range may be sent.'''
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(mtime)
+
+
+def serve_file(request, path, content_type=None, headers=None, etag_suffix='', offload=None):
+    '''Serve the file at path for a GET/HEAD request. Returns a 304 if the
+    client's If-None-Match / If-Modified-Since still match, a 206/416 for a
+    byte range, else a FileResponse (with no body for HEAD). headers (e.g.
+    Cache-Control, Content-Encoding, Vary) are sent with all of them.
+
+    With offload = (mode, value), the body is left to the fronting server:
+    the response only carries the OFFLOAD_HEADERS[mode] header set to value,
+    and the server handles ranges itself.'''
+    stat = os.stat(path)
+    content_type = content_type or guess_content_type(path)
+    validators = HttpResponse(headers=headers or {})
+    validators['ETag'] = file_etag(stat, etag_suffix)
+    validators['Last-Modified'] = http_date(stat.st_mtime)
+
+    not_modified = get_conditional_response(
+        request, etag=validators['ETag'], last_modified=int(stat.st_mtime), response=validators,
+    )
+    if not_modified is not validators:
+        return not_modified
+
+    if offload is not None:
+        mode, value = offload
+        response = HttpResponse(content_type=content_type)
+        response[OFFLOAD_HEADERS[mode]] = value
+        return copy_headers(validators, response)
+
+    byte_range = None
+    if request.method == 'GET' and if_range_matches(request, validators['ETag'], stat.st_mtime):
+        byte_range = parse_range(request.headers.get('Range'), stat.st_size)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{stat.st_size}'
+        return copy_headers(validators, response)
+
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+        response['Content-Length'] = stat.st_size
+    elif byte_range is not None:
+        first, last = byte_range
+        file = open(path, 'rb')
+        file.seek(first)
+        response = FileResponse(RangeFile(file, last - first + 1), content_type=content_type, status=206)
+        response['Content-Range'] = f'bytes {first}-{last}/{stat.st_size}'
+        response['Content-Length'] = last - first + 1
+    else:
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+    response['Accept-Ranges'] = 'bytes'
+    return copy_headers(validators, response)
+
+
+def copy_headers(source, response):
+    '''Copy all headers but Content-Type from source to response.'''
+    for header, value in source.items():
+        if header != 'Content-Type':
+            response[header] = value
+    return response
@@ -0,0 +1,115 @@
+# File: cs412/instrumentation.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Per-request SQL/template/response measurements, kept as
+# in-memory samples per view so the admin stats page can show percentiles,
+# plus per-view query budgets that warn (or fail, in tests).
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per view; older ones are dropped
+SAMPLES_PER_VIEW = 1000
+
+# Metrics recorded for every request, in display order
+METRICS = ['queries', 'db_ms', 'template_ms', 'total_ms', 'bytes']
+
+
+class QueryBudgetExceeded(Exception):
+    '''Raised when a view runs more queries than its budget allows
+    (with settings.QUERY_BUDGET_MODE = 'raise').'''
+
+
+class QueryTimer:
+    '''connection.execute_wrapper that counts queries and their total time.'''
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class RequestStats:
+    '''Thread-safe store of the latest SAMPLES_PER_VIEW samples of each view.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=SAMPLES_PER_VIEW))
+
+    def record(self, view_name, sample):
+        '''Add one request's metrics (a dict with the METRICS keys).'''
+        with self._lock:
+            self._samples[view_name].append(sample)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        '''Return one row per view, slowest p95 first: the view name, the
+        sample count and p50/p95/p99 of every metric.'''
+        with self._lock:
+            samples = {view: list(values) for view, values in self._samples.items()}
+        rows = []
+        for view, values in samples.items():
+            row = {'view': view, 'count': len(values)}
+            for metric in METRICS:
+                ordered = sorted(sample[metric] for sample in values)
+                row[metric] = {f'p{p}': percentile(ordered, p / 100) for p in (50, 95, 99)}
+            rows.append(row)
+        rows.sort(key=lambda row: row['total_ms']['p95'], reverse=True)
+        return rows
+
+
+def view_key(resolver_match):
+    '''Return the key a view's samples and budget are stored under: its
+    dotted path, e.g. 'blog.views.ShowAllView'. URL names aren't namespaced
+    in this project and repeat across apps (blog and quotes both have
+    show_all), so they can't tell views apart.'''
+    view = resolver_match.func
+    # as_view() functions point back at their class
+    view = getattr(view, 'view_class', view)
+    return f'{view.__module__}.{view.__qualname__}'
+
+
+def percentile(ordered, fraction):
+    '''Return the value at the given fraction (0-1) of an already sorted list.'''
+    if not ordered:
+        return 0
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+# Process-wide store shown on the stats page
+request_stats = RequestStats()
+
+
+def check_query_budget(view_name, queries):
+    '''Warn (or raise QueryBudgetExceeded) if the view is over the query
+    budget set for its view_key() in settings.QUERY_BUDGETS.'''
+    budget = getattr(settings, 'QUERY_BUDGETS', {}).get(view_name)
+    if budget is None or queries <= budget:
+        return
+    message = f'{view_name} ran {queries} queries (budget {budget})'
+    if getattr(settings, 'QUERY_BUDGET_MODE', 'warn') == 'raise':
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+def server_timing(sample):
+    '''Return a Server-Timing header value for the sample.'''
+    return ', '.join([
+        f'db;dur={sample["db_ms"]:.1f};desc="{sample["queries"]} queries"',
+        f'tpl;dur={sample["template_ms"]:.1f}',
+        f'total;dur={sample["total_ms"]:.1f}',
+    ])
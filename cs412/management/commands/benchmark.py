@@ -0,0 +1,90 @@
+# File: cs412/management/commands/benchmark.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Management command that fills throwaway test databases with
+# generated data, times the hot views through the test client and writes a
+# JSON report (pytest-benchmark layout) that can be compared between commits.
+
+import json
+from datetime import datetime
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+from cs412.benchmarks.cases import CASES
+from cs412.benchmarks.datagen import generate
+from cs412.benchmarks.runner import compare, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the hot views against generated data in test databases.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0,
+                            help='Fraction of the full data volume (50k voters, 48k results, ...)')
+        parser.add_argument('--rounds', type=int, default=5)
+        parser.add_argument('--warmup', type=int, default=1)
+        parser.add_argument('--warm', action='store_true',
+                            help="Don't clear the cache before each request")
+        parser.add_argument('-k', dest='select', default='',
+                            help='Only run benchmarks whose name contains this')
+        parser.add_argument('--output', help='Report path (default .benchmarks/<date>-<commit>.json)')
+        parser.add_argument('--compare', help='Earlier report to compare against')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed median slowdown in --compare (0.2 = 20%%)')
+        parser.add_argument('--fail-on-regression', action='store_true')
+
+    def handle(self, *args, **options):
+        cases = [case for case in CASES if options['select'] in case.name]
+        if not cases:
+            raise CommandError(f'No benchmark matches {options["select"]!r}')
+        old = None
+        if options['compare']:
+            old = json.loads(Path(options['compare']).read_text())
+
+        # Never touch the development databases
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0)
+        old_config = runner.setup_databases()
+        try:
+            self.stdout.write(f'Generating data (scale {options["scale"]})...')
+            password = generate(scale=options['scale'])
+            report = run_benchmarks(
+                cases, password, rounds=options['rounds'], warmup=options['warmup'],
+                clear_cache=not options['warm'],
+                options={'scale': options['scale'], 'warm': options['warm']},
+            )
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        self.print_report(report)
+        output = Path(options['output'] or self.default_output(report))
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2))
+        self.stdout.write(f'Wrote {output}')
+
+        if old is not None:
+            rows, regressed = compare(old, report, options['threshold'])
+            self.print_comparison(rows)
+            if regressed and options['fail_on_regression']:
+                raise CommandError('Benchmarks regressed')
+
+    def default_output(self, report):
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        commit = report['commit_info']['id'][:8] or 'nogit'
+        return Path(settings.BASE_DIR) / '.benchmarks' / f'{stamp}-{commit}.json'
+
+    def print_report(self, report):
+        self.stdout.write(f'{"benchmark":<22} {"median ms":>10} {"min ms":>9} {"max ms":>9} {"queries":>8} {"status":>7}')
+        for bench in report['benchmarks']:
+            stats, extra = bench['stats'], bench['extra_info']
+            self.stdout.write(f'{bench["name"]:<22} {stats["median"] * 1000:>10.1f} {stats["min"] * 1000:>9.1f} '
+                              f'{stats["max"] * 1000:>9.1f} {extra["queries"]:>8} {extra["status"]:>7}')
+
+    def print_comparison(self, rows):
+        self.stdout.write(f'\n{"benchmark":<22} {"old ms":>9} {"new ms":>9} {"ratio":>6} {"queries":>10}')
+        for row in rows:
+            line = (f'{row["name"]:<22} {row["old_ms"]:>9.1f} {row["new_ms"]:>9.1f} {row["ratio"]:>6.2f} '
+                    f'{row["old_queries"]:>4} -> {row["new_queries"]:<4}')
+            self.stdout.write(self.style.ERROR(line) if row['regressed'] else line)
@@ -0,0 +1,66 @@
+# File: cs412/management/commands/setup_analytics_db.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Management command that creates the analytics database
+# (cs412/routers.py) and copies the voter_analytics/marathon_analytics rows
+# over from the default database, where they lived before the split.
+
+from django.apps import apps
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from cs412.api_cache import bump_model_version
+from cs412.routers import ANALYTICS_APPS, ANALYTICS_DB
+
+# Rows read and inserted per batch
+COPY_BATCH_SIZE = 2000
+
+
+class Command(BaseCommand):
+    help = ('Migrate the analytics database and copy the analytics apps\' rows '
+            'into it from the default database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--replace', action='store_true',
+                            help='Delete rows already in the analytics database before copying')
+
+    def handle(self, *args, **options):
+        call_command('migrate', database=ANALYTICS_DB, verbosity=options['verbosity'])
+
+        source_tables = set(connections[DEFAULT_DB_ALIAS].introspection.table_names())
+        for label in sorted(ANALYTICS_APPS):
+            for model in apps.get_app_config(label).get_models():
+                self.copy_model(model, source_tables, options['replace'])
+
+        self.stdout.write(self.style.SUCCESS(
+            'Done. If ANALYTICS_DB_IMMUTABLE is on, restart the server before it reads the new data.'
+        ))
+
+    def copy_model(self, model, source_tables, replace):
+        '''Copy one model's rows from the default database, in batches.'''
+        name = model._meta.label
+        if model._meta.db_table not in source_tables:
+            self.stdout.write(f'{name}: no table in the default database, skipped')
+            return
+
+        target = model.objects.using(ANALYTICS_DB)
+        with transaction.atomic(using=ANALYTICS_DB):
+            if target.exists():
+                if not replace:
+                    self.stdout.write(f'{name}: analytics database already has rows, skipped (use --replace)')
+                    return
+                target.all().delete()
+
+            copied = 0
+            batch = []
+            for row in model.objects.using(DEFAULT_DB_ALIAS).order_by('pk').iterator(chunk_size=COPY_BATCH_SIZE):
+                batch.append(row)
+                if len(batch) >= COPY_BATCH_SIZE:
+                    target.bulk_create(batch)
+                    copied += len(batch)
+                    batch = []
+            target.bulk_create(batch)
+            copied += len(batch)
+
+        # bulk_create doesn't send save signals, so drop cached pages by hand
+        bump_model_version(model)
+        self.stdout.write(f'{name}: copied {copied} rows')
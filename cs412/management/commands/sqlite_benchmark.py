@@ -0,0 +1,170 @@
+# File: cs412/management/commands/sqlite_benchmark.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Management command that measures read throughput and latency
+# on SQLite while a bulk load (like voter_analytics.models.load_data) writes,
+# with the tuned WAL settings from cs412/db.py versus SQLite's defaults.
+
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from django.core.management.base import BaseCommand
+from cs412.db import apply_pragmas, get_sqlite_pragmas
+
+PARTIES = ['D', 'R', 'U', 'L', 'J', 'G']
+
+# Settings compared by default: SQLite's own defaults, then our tuning
+MODES = {
+    'default': {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 5000},
+    'tuned': None,  # filled from get_sqlite_pragmas()
+}
+
+SCHEMA = '''
+CREATE TABLE voter (
+    id INTEGER PRIMARY KEY,
+    last_name TEXT, first_name TEXT, party TEXT,
+    date_of_birth TEXT, voter_score INTEGER
+);
+CREATE INDEX voter_party_idx ON voter (party);
+'''
+
+
+def make_voter(rng):
+    '''Return one random voter row (without id).'''
+    return (
+        f'Last{rng.randrange(5000)}', f'First{rng.randrange(5000)}', rng.choice(PARTIES),
+        f'{rng.randrange(1930, 2005)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}',
+        rng.randrange(6),
+    )
+
+
+def percentile(values, fraction):
+    '''Return the value at the given fraction (0-1) of the sorted values.'''
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+class Command(BaseCommand):
+    help = ('Benchmark SQLite reads during a bulk load, comparing default settings with the '
+            'tuned PRAGMAs from cs412/db.py. Uses a scratch database, never db.sqlite3.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='rows inserted by the bulk load')
+        parser.add_argument('--seed-rows', type=int, default=20000, help='rows present before the load')
+        parser.add_argument('--batch', type=int, default=1,
+                            help='rows per write transaction (1 = one save() per row, like the loaders)')
+        parser.add_argument('--readers', type=int, default=4, help='concurrent reader threads')
+        parser.add_argument('--mode', choices=list(MODES), action='append',
+                            help='settings to benchmark (default: all)')
+        parser.add_argument('--json', action='store_true', help='print results as JSON')
+
+    def handle(self, *args, **options):
+        results = {}
+        for mode in options['mode'] or list(MODES):
+            pragmas = MODES[mode] or get_sqlite_pragmas()
+            with tempfile.TemporaryDirectory() as directory:
+                results[mode] = self.run(os.path.join(directory, 'bench.sqlite3'), pragmas, options)
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        header = f"{'mode':<8} {'writes/s':>9} {'reads':>7} {'reads/s':>8} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'locked':>7}"
+        self.stdout.write(header)
+        for mode, result in results.items():
+            self.stdout.write(
+                f"{mode:<8} {result['writes_per_second']:>9.0f} {result['reads']:>7} "
+                f"{result['reads_per_second']:>8.0f} {result['read_p50_ms']:>7.2f} "
+                f"{result['read_p95_ms']:>7.2f} {result['read_p99_ms']:>7.2f} {result['lock_errors']:>7}"
+            )
+
+    def connect(self, path, pragmas):
+        connection = sqlite3.connect(path, timeout=0, isolation_level=None, check_same_thread=False)
+        apply_pragmas(connection.cursor(), pragmas)
+        return connection
+
+    def run(self, path, pragmas, options):
+        '''Seed a scratch database, then time readers against one bulk writer.'''
+        rng = random.Random(412)
+        setup = self.connect(path, pragmas)
+        setup.executescript(SCHEMA)
+        setup.execute('BEGIN')
+        setup.executemany('INSERT INTO voter (last_name, first_name, party, date_of_birth, voter_score) '
+                          'VALUES (?, ?, ?, ?, ?)', (make_voter(rng) for _ in range(options['seed_rows'])))
+        setup.execute('COMMIT')
+        setup.close()
+
+        done = threading.Event()
+        latencies = []
+        lock_errors = [0]
+        lock = threading.Lock()
+        write_time = [0.0]
+
+        def writer():
+            connection = self.connect(path, pragmas)
+            writer_rng = random.Random(1)
+            start = time.perf_counter()
+            remaining = options['rows']
+            while remaining > 0:
+                count = min(options['batch'], remaining)
+                try:
+                    connection.execute('BEGIN IMMEDIATE')
+                    connection.executemany(
+                        'INSERT INTO voter (last_name, first_name, party, date_of_birth, voter_score) '
+                        'VALUES (?, ?, ?, ?, ?)', [make_voter(writer_rng) for _ in range(count)])
+                    connection.execute('COMMIT')
+                    remaining -= count
+                except sqlite3.OperationalError:
+                    if connection.in_transaction:
+                        connection.execute('ROLLBACK')
+                    with lock:
+                        lock_errors[0] += 1
+            write_time[0] = time.perf_counter() - start
+            connection.close()
+            done.set()
+
+        def reader(seed):
+            connection = self.connect(path, pragmas)
+            reader_rng = random.Random(seed)
+            own = []
+            while not done.is_set():
+                start = time.perf_counter()
+                try:
+                    # The voter list page: a filtered count plus one page of rows
+                    party = reader_rng.choice(PARTIES)
+                    connection.execute('SELECT COUNT(*) FROM voter WHERE party = ?', (party,)).fetchone()
+                    connection.execute('SELECT * FROM voter WHERE party = ? ORDER BY id DESC LIMIT 100',
+                                       (party,)).fetchall()
+                    own.append(time.perf_counter() - start)
+                except sqlite3.OperationalError:
+                    with lock:
+                        lock_errors[0] += 1
+            connection.close()
+            with lock:
+                latencies.extend(own)
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(options['readers'])]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = write_time[0] or 1e-9
+        return {
+            'pragmas': pragmas,
+            'rows_written': options['rows'],
+            'write_seconds': round(elapsed, 3),
+            'writes_per_second': options['rows'] / elapsed,
+            'reads': len(latencies),
+            'reads_per_second': len(latencies) / elapsed,
+            'read_p50_ms': statistics.median(latencies) * 1000 if latencies else 0.0,
+            'read_p95_ms': percentile(latencies, 0.95) * 1000,
+            'read_p99_ms': percentile(latencies, 0.99) * 1000,
+            'lock_errors': lock_errors[0],
+        }
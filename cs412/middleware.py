@@ -0,0 +1,186 @@
+# File: cs412/middleware.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Project-wide middleware. Serves static files, resolves the
+# logged-in user's project/mini_insta profile once per request and caches it
+# per user, measures queries, template rendering and response size per view,
+# and profiles requests on demand.
+
+import time
+from contextlib import ExitStack
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import Http404, HttpResponseNotAllowed
+from django.utils.functional import SimpleLazyObject
+from .fileserving import guess_content_type, serve_file
+from .instrumentation import QueryTimer, check_query_budget, request_stats, server_timing, view_key
+from .profiling import profile_call, save_profile, should_profile
+from .static import build_index, find_static_file, static_prefix
+
+# How long (in seconds) a resolved profile stays in the cache.
+# Profile saves/deletes invalidate the entry immediately, so this only
+# bounds staleness across processes that don't share a cache.
+PROFILE_CACHE_TTL = 60
+
+# request attribute name -> 'app_label.ModelName' of the profile model
+PROFILE_ATTRIBUTES = {
+    'meal_profile': 'project.UserProfile',
+    'insta_profile': 'mini_insta.Profile',
+}
+
+
+def profile_cache_key(model, user_id):
+    '''Return the cache key for the given profile model and user id.'''
+    return f'profile:{model._meta.label_lower}:{user_id}'
+
+
+def get_cached_profile(model, user):
+    '''Return the profile of the given model for this user, or None.
+    Looks in the cache first and falls back to a single query.'''
+    if not user.is_authenticated:
+        return None
+
+    key = profile_cache_key(model, user.pk)
+    profile = cache.get(key)
+    if profile is None:
+        profile = model.objects.filter(user=user).order_by('pk').first()
+        # Only cache real profiles, so a newly created one shows up right away
+        if profile is not None:
+            cache.set(key, profile, PROFILE_CACHE_TTL)
+    return profile
+
+
+def profile_or_404(profile):
+    '''Return the given request.meal_profile/insta_profile, raising Http404
+    (like get_object_or_404) if the user doesn't have one.'''
+    if not profile:
+        raise Http404('No profile found for this user.')
+    return profile
+
+
+def invalidate_cached_profile(sender, instance, **kwargs):
+    '''Signal receiver: drop the cached profile when it is saved or deleted.'''
+    cache.delete(profile_cache_key(sender, instance.user_id))
+
+
+class CurrentProfileMiddleware:
+    '''Attach lazy request.meal_profile and request.insta_profile attributes.
+    Each is resolved at most once per request, and only if a view/template
+    actually uses it. Must come after AuthenticationMiddleware.'''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        for attribute, label in PROFILE_ATTRIBUTES.items():
+            model = apps.get_model(label)
+            setattr(request, attribute, SimpleLazyObject(
+                lambda model=model: get_cached_profile(model, request.user)
+            ))
+        return self.get_response(request)
+
+
+class StaticFilesMiddleware:
+    '''Serve static files in-process, before the rest of the middleware runs.
+    Picks the brotli/gzip copy the client accepts, answers revalidations with
+    304s and marks content-hashed files immutable for a year, so repeat visits
+    download nothing. Place it right after SecurityMiddleware.'''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = static_prefix()
+        # Collected files don't change while the server runs; with DEBUG the
+        # app static directories are searched on every request instead
+        self.index = None if settings.DEBUG else build_index(settings.STATIC_ROOT)
+
+    def __call__(self, request):
+        if not request.path.startswith(self.prefix):
+            return self.get_response(request)
+        name = request.path[len(self.prefix):]
+        static_file = self.index.get(name) if self.index is not None else find_static_file(name)
+        if static_file is None:
+            return self.get_response(request)
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+
+        path, encoding = static_file.choose(request.headers.get('Accept-Encoding', ''))
+        headers = {'Cache-Control': static_file.cache_control}
+        if static_file.encoded:
+            headers['Vary'] = 'Accept-Encoding'
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        return serve_file(request, path, content_type=guess_content_type(static_file.path),
+                          headers=headers, etag_suffix=f'-{encoding}' if encoding else '')
+
+
+class InstrumentationMiddleware:
+    '''Count the SQL queries and DB time of every request on all databases,
+    time template rendering (TemplateResponses) and measure the response.
+    Samples go to the in-memory stats (admin/stats/) and are checked against
+    settings.QUERY_BUDGETS. Staff users (and everyone with DEBUG on) get them
+    back as a Server-Timing header. Place it near the top of MIDDLEWARE.'''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        request._template_seconds = 0.0
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        match = request.resolver_match
+        if match is None:
+            return response
+        view_name = view_key(match)
+        sample = {
+            'queries': timer.count,
+            'db_ms': timer.seconds * 1000,
+            'template_ms': request._template_seconds * 1000,
+            'total_ms': total * 1000,
+            'bytes': 0 if response.streaming else len(response.content),
+        }
+        request_stats.record(view_name, sample)
+        check_query_budget(view_name, timer.count)
+
+        user = getattr(request, 'user', None)
+        if settings.DEBUG or (user is not None and user.is_staff):
+            response['Server-Timing'] = server_timing(sample)
+        return response
+
+    def process_template_response(self, request, response):
+        # Called right before the response is rendered; time until it's done
+        start = time.perf_counter()
+
+        def rendered(response):
+            request._template_seconds += time.perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class ProfilingMiddleware:
+    '''Run selected requests' views (and their template rendering) under
+    cProfile and a stack sampler, saving the results per view (see
+    cs412/profiling.py). A request is profiled when a staff user adds
+    ?_profile=1, or at random at settings.PROFILING_SAMPLE_RATE. Place it
+    last in MIDDLEWARE: the handler it wraps runs the view and renders
+    TemplateResponses, so the other middleware still see (and time) both.'''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not should_profile(request):
+            return self.get_response(request)
+
+        response, profiler, sampler = profile_call(lambda: self.get_response(request))
+        match = request.resolver_match
+        if match is not None:
+            save_profile(view_key(match), profiler, sampler)
+        return response
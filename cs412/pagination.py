@@ -0,0 +1,20 @@
+# File: cs412/pagination.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: REST API pagination. Cursor pagination seeks on an indexed
+# timestamp instead of counting the table and skipping with OFFSET, so every
+# page costs the same no matter how deep a client pages.
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedCursorPagination(CursorPagination):
+    '''Newest first by `created`. Clients may pick ?page_size= up to max_page_size.'''
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created'
+
+
+class PublishedCursorPagination(CreatedCursorPagination):
+    '''Newest first by `published`.'''
+    ordering = '-published'
@@ -0,0 +1,145 @@
+# File: cs412/profiling.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Opt-in profiling of single requests. A profiled view runs
+# under cProfile (saved as .prof, for pstats/snakeviz) while a sampling
+# thread records its call stacks (saved as collapsed stacks, for
+# flamegraph.pl/speedscope). Files are kept per view with rotation.
+
+import cProfile
+import io
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from django.conf import settings
+
+# Query parameter that makes staff requests get profiled, e.g. ?_profile=1
+PROFILE_QUERY_PARAM = '_profile'
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = 0.002
+
+# File names are <date>-<time>-<microseconds>.prof / .collapsed
+PROFILE_NAME_RE = re.compile(r'^\d{8}-\d{6}-\d+\.(prof|collapsed)$')
+
+
+def get_profile_dir():
+    '''Return the directory profiles are stored in (settings.PROFILING_DIR).'''
+    return Path(getattr(settings, 'PROFILING_DIR', Path(settings.BASE_DIR) / 'profiles'))
+
+
+def should_profile(request):
+    '''Return True if this request should be profiled: staff asked for it
+    with ?_profile=1, or it was picked by settings.PROFILING_SAMPLE_RATE.'''
+    if request.GET.get(PROFILE_QUERY_PARAM) and request.user.is_staff:
+        return True
+    rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0)
+    return rate > 0 and random.random() < rate
+
+
+def safe_dir_name(view_name):
+    '''Return a file-system safe directory name for a view name.'''
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', view_name).lstrip('.') or 'unnamed'
+
+
+class StackSampler:
+    '''Background thread that samples another thread's Python call stack
+    every SAMPLE_INTERVAL seconds and counts the collapsed stacks.'''
+
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})')
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def collapsed(self):
+        '''Return the samples in the collapsed stack format ("a;b;c count").'''
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+
+def profile_call(func):
+    '''Call func() under cProfile and the stack sampler.
+    Returns (result, profiler, sampler).'''
+    profiler = cProfile.Profile()
+    sampler = StackSampler(threading.get_ident())
+    sampler.start()
+    try:
+        result = profiler.runcall(func)
+    finally:
+        sampler.stop()
+    return result, profiler, sampler
+
+
+def save_profile(view_name, profiler, sampler):
+    '''Write the .prof and .collapsed files for one request and delete the
+    oldest ones beyond settings.PROFILING_KEEP for that view.'''
+    directory = get_profile_dir() / safe_dir_name(view_name)
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    profiler.dump_stats(directory / f'{stem}.prof')
+    (directory / f'{stem}.collapsed').write_text(sampler.collapsed())
+
+    keep = getattr(settings, 'PROFILING_KEEP', 20)
+    stems = sorted({path.stem for path in directory.iterdir() if PROFILE_NAME_RE.match(path.name)})
+    for old in stems[:-keep] if keep else stems:
+        for suffix in ('.prof', '.collapsed'):
+            (directory / f'{old}{suffix}').unlink(missing_ok=True)
+
+
+def list_profiles():
+    '''Return {view: [profile dicts, newest first]} for the stored profiles.'''
+    root = get_profile_dir()
+    profiles = {}
+    if not root.is_dir():
+        return profiles
+    for directory in sorted(root.iterdir()):
+        if not directory.is_dir():
+            continue
+        stems = sorted({path.stem for path in directory.iterdir() if PROFILE_NAME_RE.match(path.name)},
+                       reverse=True)
+        profiles[directory.name] = [{
+            'stem': stem,
+            'created': datetime.strptime(stem.rsplit('-', 1)[0], '%Y%m%d-%H%M%S'),
+            'files': [f'{stem}{suffix}' for suffix in ('.prof', '.collapsed')
+                      if (directory / f'{stem}{suffix}').exists()],
+        } for stem in stems]
+    return profiles
+
+
+def get_profile_path(view_dir, filename):
+    '''Return the path of a stored profile file, or None if there is no such
+    file (the names are checked, so this can't escape the profile directory).'''
+    if view_dir != safe_dir_name(view_dir) or not PROFILE_NAME_RE.match(filename):
+        return None
+    path = get_profile_dir() / view_dir / filename
+    return path if path.is_file() else None
+
+
+def summarize_profile(path, limit=30):
+    '''Return the top functions of a .prof file by cumulative time, as text.'''
+    output = io.StringIO()
+    pstats.Stats(str(path), stream=output).sort_stats('cumulative').print_stats(limit)
+    return output.getvalue()
@@ -0,0 +1,49 @@
+# File: cs412/routers.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Database router that keeps the read-heavy analytics apps in
+# their own SQLite file, so their scans and bulk loads never hold locks on
+# the database the social apps (mini_insta, project, ...) write to.
+
+from django.db import connections
+
+# Apps whose models live in the analytics database
+ANALYTICS_APPS = {'voter_analytics', 'marathon_analytics'}
+
+# Read-write connection to the analytics file: loaders and migrations
+ANALYTICS_DB = 'analytics'
+
+# Read-only connection to the same file, used for all other reads
+ANALYTICS_REPLICA_DB = 'analytics_replica'
+
+
+class AnalyticsRouter:
+    '''Send analytics reads to the read-only replica connection and writes to
+    the read-write one; leave every other app on the default database.'''
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in ANALYTICS_APPS:
+            return None
+        # Inside a write transaction, read what it wrote
+        if connections[ANALYTICS_DB].in_atomic_block:
+            return ANALYTICS_DB
+        return ANALYTICS_REPLICA_DB
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label in ANALYTICS_APPS:
+            return ANALYTICS_DB
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # No foreign keys across the two databases
+        if (obj1._meta.app_label in ANALYTICS_APPS) != (obj2._meta.app_label in ANALYTICS_APPS):
+            return False
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == ANALYTICS_REPLICA_DB:
+            return False
+        if app_label in ANALYTICS_APPS:
+            return db == ANALYTICS_DB
+        if db == ANALYTICS_DB:
+            return False
+        return None
@@ -0,0 +1,49 @@
+# File: cs412/sampling.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Pick random rows without loading whole tables. Keeps the list
+# of primary keys per model in the cache and fetches one row by pk.
+
+import random
+from django.core.cache import cache
+
+# Upper bound (in seconds) on how long a cached id list is trusted. Saves and
+# deletes invalidate it right away; this only covers writes from other
+# processes that don't share the cache.
+SAMPLED_IDS_TTL = 60 * 60
+
+
+def sampled_ids_cache_key(model):
+    '''Return the cache key holding the primary keys of the given model.'''
+    return f'sampled_ids:{model._meta.label_lower}'
+
+
+def get_sampled_ids(model):
+    '''Return the list of primary keys of the model, from the cache if possible.'''
+    key = sampled_ids_cache_key(model)
+    ids = cache.get(key)
+    if ids is None:
+        ids = list(model.objects.order_by().values_list('pk', flat=True))
+        cache.set(key, ids, SAMPLED_IDS_TTL)
+    return ids
+
+
+def random_instance(model):
+    '''Return a random instance of the model, or None if the table is empty.
+    Costs one primary key lookup once the id list is cached.'''
+    ids = get_sampled_ids(model)
+    if not ids:
+        return None
+    instance = model.objects.filter(pk=random.choice(ids)).first()
+    if instance is None:
+        # The cached ids were stale (row deleted elsewhere): rebuild and retry once
+        cache.delete(sampled_ids_cache_key(model))
+        ids = get_sampled_ids(model)
+        instance = model.objects.filter(pk=random.choice(ids)).first() if ids else None
+    return instance
+
+
+def invalidate_sampled_ids(sender, created=True, **kwargs):
+    '''Signal receiver: drop the cached id list when rows are added or deleted.
+    Connect to post_save (only creations matter) and post_delete.'''
+    if created:
+        cache.delete(sampled_ids_cache_key(sender))
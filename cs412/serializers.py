@@ -0,0 +1,21 @@
+# File: cs412/serializers.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Serializer helpers shared by the REST APIs.
+
+
+class SparseFieldsetMixin:
+    '''Serializer mixin that lets GET requests ask for a subset of fields with
+    ?fields=id,title. Unknown names are ignored; writes always use every field.'''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method != 'GET':
+            return
+        requested = request.query_params.get('fields')
+        if not requested:
+            return
+        keep = {name.strip() for name in requested.split(',')}
+        for name in list(self.fields):
+            if name not in keep:
+                self.fields.pop(name)
@@ -49,18 +49,45 @@ INSTALLED_APPS = [
     'rest_framework',
     'dadjokes',
     'project',
+    'cs412',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'cs412.middleware.StaticFilesMiddleware',
+    'cs412.middleware.InstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'cs412.middleware.CurrentProfileMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'cs412.middleware.ProfilingMiddleware',
 ]
 
+# Max SQL queries per request, by view path (see cs412/instrumentation.py).
+# Going over logs a warning; QUERY_BUDGET_MODE = 'raise' fails the request
+# instead, which cs412.test_runner.TestRunner turns on for the test run.
+# Set a little above the counts `manage.py benchmark` measured (in comments).
+QUERY_BUDGETS = {
+    'mini_insta.views.PostFeedListView': 8,  # 6
+    'mini_insta.views.SearchView': 10,  # 8
+    'mini_insta.views.ProfileListView': 5,  # 1, +2 logged in
+    'project.views.MealPostListView': 8,  # 4, +2 logged in
+    'project.views.MealPostDetailView': 10,  # 8, as the host
+    'blog.views.ShowAllView': 5,  # 2
+    'blog.views.ArticleView': 5,  # 2
+    'quotes.views.show_all': 3,  # 0
+}
+QUERY_BUDGET_MODE = 'warn'
+
+# Request profiling (see cs412/profiling.py): staff can profile any page with
+# ?_profile=1; PROFILING_SAMPLE_RATE also profiles that fraction of all requests.
+PROFILING_DIR = BASE_DIR / 'profiles'
+PROFILING_SAMPLE_RATE = 0
+PROFILING_KEEP = 20  # profiles kept per view
+
 ROOT_URLCONF = 'cs412.urls'
 
 TEMPLATES = [
@@ -75,23 +102,103 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'libraries': {
+                'cache_versions': 'cs412.cache_tags',
+            },
         },
     },
 ]
 
 WSGI_APPLICATION = 'cs412.wsgi.application'
 
+# Cache used for pages, fragments, API responses and lookups (see cs412/caching.py).
+# Local memory is per process, but cached pages are keyed on the model
+# versions in the shared 'versions' cache, so a write in any process still
+# invalidates them. Switch to Redis or memcached to share the pages too.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'cs412',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    },
+    # Model versions that cached pages/responses are keyed on (cs412/api_cache.py).
+    # Shared by every worker process and management command on the machine,
+    # so a write anywhere invalidates the per-process caches above.
+    'versions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache' / 'versions',
+        'TIMEOUT': None,
+    },
+}
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Open the analytics replica with SQLite's immutable flag (see below). Only
+# turn this on if data is only ever loaded while the site is stopped.
+ANALYTICS_DB_IMMUTABLE = False
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        # Keep connections open between requests, checking they still work
+        # before reuse. PRAGMAs are applied once per connection (cs412/db.py).
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Take the write lock when a transaction starts, so concurrent
+            # writers wait on busy_timeout instead of deadlocking on upgrade
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # voter_analytics and marathon_analytics live in their own file (see
+    # cs412/routers.py). Create it with `manage.py setup_analytics_db`, which
+    # migrates it and copies the rows over from db.sqlite3; the apps'
+    # load_data() loaders also write through this alias.
+    'analytics': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'analytics.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
+        # Per-database PRAGMA overrides (cs412/db.py). A rollback journal,
+        # since immutable read-only readers don't look at a WAL file.
+        'PRAGMAS': {
+            'journal_mode': 'DELETE',
+            'synchronous': 'OFF',  # bulk loads can simply be rerun
+        },
+    },
+    # Read-only view of the analytics file that serves all analytics reads.
+    # With ANALYTICS_DB_IMMUTABLE, immutable=1 skips locking and change
+    # detection entirely: open connections never see new data (or see it
+    # half-written), so load data while the site is stopped and restart it.
+    'analytics_replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': 'file:{}?mode=ro{}'.format(BASE_DIR / 'analytics.sqlite3',
+                                           '&immutable=1' if ANALYTICS_DB_IMMUTABLE else ''),
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'PRAGMAS': {
+            'journal_mode': None,  # can't be changed on a read-only connection
+            'foreign_keys': None,
+            'query_only': 'ON',
+            'mmap_size': 1024 * 1024 * 1024,  # map up to 1 GB of the file
+        },
+        'TEST': {
+            'MIRROR': 'analytics',
+        },
+    },
 }
 
+DATABASE_ROUTERS = ['cs412.routers.AnalyticsRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -141,9 +248,31 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]   
 
+# collectstatic writes content-hashed copies plus .br/.gz versions of every
+# file (cs412/storage.py); cs412.middleware.StaticFilesMiddleware serves them
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'cs412.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Tests run without collectstatic, so they use plain static storage
+TEST_RUNNER = 'cs412.test_runner.TestRunner'
+
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media/')
 MEDIA_URL= "media/"  # note: no leading slash!
 
+# Uploaded files are served by cs412.views.media_view. Behind nginx or Apache,
+# set MEDIA_OFFLOAD to 'x-accel-redirect' or 'x-sendfile' to let the server
+# send the file; for nginx, MEDIA_ACCEL_REDIRECT_PREFIX must be an `internal`
+# location aliased to MEDIA_ROOT.
+MEDIA_OFFLOAD = None
+MEDIA_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+MEDIA_MAX_AGE = 86400
+
 import socket
 CS_DEPLOYMENT_HOSTNAME = 'cs-webapps.bu.edu'
 
@@ -152,6 +281,12 @@ if socket.gethostname() == CS_DEPLOYMENT_HOSTNAME:
     MEDIA_URL = '/sakshamg/media/'
 
 REST_FRAMEWORK = {
-  'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+  'DEFAULT_PAGINATION_CLASS': 'cs412.pagination.CreatedCursorPagination',
   'PAGE_SIZE': 10
-}
\ No newline at end of file
+}
+# Pub/sub backend used to push live meal chat messages (see project/chat.py)
+MEAL_CHAT_BROKER = 'project.chat.InProcessChatBroker'
+
+# Minimum seconds between automatic sweeps of past meals to 'completed'
+# (see project/lifecycle.py); 0 disables the in-process sweep.
+MEAL_SWEEP_INTERVAL = 300
@@ -0,0 +1,83 @@
+# File: cs412/static.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: In-process static file lookup for StaticFilesMiddleware.
+# Collected files are indexed once at startup (with their .br/.gz copies and
+# whether their name is content-hashed); with DEBUG on, files are looked up
+# through the staticfiles finders on every request instead.
+
+import os
+import posixpath
+from pathlib import Path
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from .storage import ENCODINGS
+
+# Cache-Control of content-hashed files: their content never changes
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Cache-Control of everything else (unhashed names, DEBUG): always revalidate
+REVALIDATE_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+
+class StaticFile:
+    '''One servable static file: its path, the paths of its compressed
+    copies by Content-Encoding, and whether it can be cached forever.'''
+
+    def __init__(self, path, immutable=False):
+        self.path = path
+        self.immutable = immutable
+        self.encoded = {encoding: f'{path}{suffix}' for encoding, suffix in ENCODINGS.items()
+                        if os.path.isfile(f'{path}{suffix}')}
+
+    def choose(self, accept_encoding):
+        '''Return (path, Content-Encoding or None) of the best copy for an
+        Accept-Encoding header.'''
+        accepted = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+        for encoding, path in self.encoded.items():
+            if encoding in accepted:
+                return path, encoding
+        return self.path, None
+
+    @property
+    def cache_control(self):
+        return IMMUTABLE_CACHE_CONTROL if self.immutable else REVALIDATE_CACHE_CONTROL
+
+
+def static_prefix():
+    '''Return the URL path static files are served under, e.g. /static/.'''
+    prefix = urlsplit(settings.STATIC_URL).path
+    return '/' + prefix.strip('/') + '/'
+
+
+def hashed_names():
+    '''Return the set of content-hashed names in the staticfiles manifest.'''
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', {})
+    return {name for original, name in hashed_files.items() if name != original}
+
+
+def build_index(root):
+    '''Return {relative name: StaticFile} for every file collected in root,
+    except the compressed copies themselves.'''
+    index = {}
+    root = Path(root)
+    if not root.is_dir():
+        return index
+    hashed = hashed_names()
+    compressed_suffixes = tuple(ENCODINGS.values())
+    for path in root.rglob('*'):
+        if not path.is_file() or path.name.endswith(compressed_suffixes):
+            continue
+        name = path.relative_to(root).as_posix()
+        index[name] = StaticFile(str(path), immutable=name in hashed)
+    return index
+
+
+def find_static_file(name):
+    '''Look a name up through the staticfiles finders (for DEBUG).'''
+    name = posixpath.normpath(name).lstrip('/')
+    if name.startswith('..'):
+        return None
+    path = finders.find(name)
+    return StaticFile(path) if path else None
@@ -0,0 +1,82 @@
+# File: cs412/storage.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Static files storage that content-hashes file names (so they
+# can be cached forever) and writes gzip and brotli copies next to every
+# collected file at collectstatic time, for StaticFilesMiddleware to serve.
+
+import gzip
+import os
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only .gz files are written
+    brotli = None
+
+# Formats that are already compressed and don't shrink any further
+SKIP_EXTENSIONS = {
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'ico', 'woff', 'woff2',
+    'zip', 'gz', 'tgz', 'bz2', 'br', 'xz', 'mp3', 'mp4', 'webm', 'ogg', 'pdf',
+}
+
+# Compressed copies that don't save at least this much are not kept
+MIN_SAVING = 0.05
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+
+
+def compressors():
+    '''Return {Content-Encoding: function(bytes) -> bytes} of the available
+    compressors.'''
+    available = {}
+    if brotli is not None:
+        available['br'] = lambda data: brotli.compress(data, quality=11)
+    # mtime=0 so the same input always gives the same .gz
+    available['gzip'] = lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    return available
+
+
+def should_compress(name):
+    return name.rsplit('.', 1)[-1].lower() not in SKIP_EXTENSIONS
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    '''ManifestStaticFilesStorage that also writes <name>.br and <name>.gz
+    for the original and hashed copy of every compressible file.'''
+
+    def post_process(self, paths, dry_run=False, **options):
+        hashed_names = {}
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if hashed_name is not None:
+                hashed_names[name] = hashed_name
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+        for name, hashed_name in hashed_names.items():
+            for target in {name, hashed_name}:
+                for compressed_name in self.compress(target):
+                    yield target, compressed_name, True
+
+    def compress(self, name):
+        '''Write the compressed copies of one stored file that are worth
+        keeping and return their names.'''
+        if not should_compress(name):
+            return []
+        with self.open(name) as original:
+            data = original.read()
+        written = []
+        for encoding, compress in compressors().items():
+            compressed = compress(data)
+            compressed_name = name + ENCODINGS[encoding]
+            path = self.path(compressed_name)
+            if len(compressed) > len(data) * (1 - MIN_SAVING):
+                # Don't leave a stale copy from an earlier collectstatic
+                if os.path.exists(path):
+                    os.remove(path)
+                continue
+            with open(path, 'wb') as output:
+                output.write(compressed)
+            written.append(compressed_name)
+        return written
@@ -0,0 +1,41 @@
+# File: cs412/test_runner.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Test runner for `manage.py test` (settings.TEST_RUNNER). It
+# applies the settings tests need on top of the project's own, e.g. so pages
+# render without a collectstatic run and views fail when over budget.
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+def test_settings():
+    '''Return the settings overridden for the whole test run.'''
+    return {
+        # The manifest storage needs collectstatic to have run; look static
+        # files up unhashed instead, like DEBUG does
+        'STORAGES': {
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+        },
+        # Going over a query budget fails the request (cs412/instrumentation.py)
+        'QUERY_BUDGET_MODE': 'raise',
+        # Keep model versions away from the file cache the dev server uses
+        'CACHES': {
+            **settings.CACHES,
+            'versions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-versions'},
+        },
+    }
+
+
+class TestRunner(DiscoverRunner):
+    '''DiscoverRunner that runs the tests under test_settings().'''
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.overridden_settings = override_settings(**test_settings())
+        self.overridden_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.overridden_settings.disable()
+        super().teardown_test_environment(**kwargs)
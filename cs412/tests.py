@@ -0,0 +1,288 @@
+# File: cs412/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for the project-wide helpers and middleware: media and
+# static file serving, the analytics router and the hot views' query budgets.
+
+import gzip
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import resolve, reverse
+from blog.models import Article
+from voter_analytics.models import Voter
+from marathon_analytics.models import Result
+from .benchmarks.cases import CASES
+from .benchmarks.datagen import generate
+from .fileserving import parse_range
+from .instrumentation import QueryBudgetExceeded, view_key
+from .routers import ANALYTICS_DB, ANALYTICS_REPLICA_DB, AnalyticsRouter
+
+
+class ParseRangeTests(SimpleTestCase):
+    '''parse_range returns (first, last), None to send the whole file, or
+    False for a 416.'''
+
+    def test_closed_range(self):
+        self.assertEqual(parse_range('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(parse_range('bytes=500-500', 1000), (500, 500))
+
+    def test_open_range_runs_to_end(self):
+        self.assertEqual(parse_range('bytes=900-', 1000), (900, 999))
+
+    def test_last_is_clamped_to_size(self):
+        self.assertEqual(parse_range('bytes=900-5000', 1000), (900, 999))
+
+    def test_suffix_range(self):
+        self.assertEqual(parse_range('bytes=-100', 1000), (900, 999))
+        # Asking for more than the whole file sends the whole file
+        self.assertEqual(parse_range('bytes=-5000', 1000), (0, 999))
+
+    def test_spaces_are_ignored(self):
+        self.assertEqual(parse_range('bytes = 0 - 9', 1000), (0, 9))
+
+    def test_ignored_headers(self):
+        for header in [None, '', 'bytes=-', 'bytes=a-b', 'items=0-9', 'bytes=0-9,20-29']:
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, 1000))
+
+    def test_unsatisfiable(self):
+        for header, size in [('bytes=1000-', 1000), ('bytes=2000-3000', 1000),
+                             ('bytes=-0', 1000), ('bytes=-10', 0), ('bytes=0-', 0)]:
+            with self.subTest(header=header, size=size):
+                self.assertIs(parse_range(header, size), False)
+
+
+class MediaViewTests(SimpleTestCase):
+    '''Uploaded files are served with validators, byte ranges and 304s.'''
+
+    DATA = bytes(range(256)) * 4
+
+    def setUp(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        (root / 'photos').mkdir()
+        (root / 'photos' / 'cat.jpg').write_bytes(self.DATA)
+        self.enterContext(override_settings(MEDIA_ROOT=str(root), MEDIA_OFFLOAD=None))
+        self.url = '/media/photos/cat.jpg'
+
+    def get(self, **headers):
+        response = self.client.get(self.url, headers=headers)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, content
+
+    def test_whole_file(self):
+        response, content = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(content, self.DATA)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertTrue(response.has_header('ETag'))
+
+    def test_not_modified(self):
+        response, _ = self.get()
+        for headers in [{'if_none_match': response['ETag']}, {'if_modified_since': response['Last-Modified']}]:
+            with self.subTest(headers=headers):
+                again, content = self.get(**headers)
+                self.assertEqual(again.status_code, 304)
+                self.assertEqual(content, b'')
+
+    def test_range(self):
+        response, content = self.get(range='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(content, self.DATA[100:200])
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(self.DATA)}')
+        self.assertEqual(response['Content-Length'], '100')
+
+        response, content = self.get(range='bytes=-10')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(content, self.DATA[-10:])
+
+    def test_unsatisfiable_range(self):
+        response, _ = self.get(range=f'bytes={len(self.DATA)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.DATA)}')
+
+    def test_stale_if_range_sends_whole_file(self):
+        response, content = self.get(range='bytes=0-9', if_range='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(content, self.DATA)
+
+        current, _ = self.get()
+        response, content = self.get(range='bytes=0-9', if_range=current['ETag'])
+        self.assertEqual(response.status_code, 206)
+
+    def test_offload(self):
+        with override_settings(MEDIA_OFFLOAD='x-accel-redirect', MEDIA_ACCEL_REDIRECT_PREFIX='/protected-media/'):
+            response, content = self.get()
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/photos/cat.jpg')
+        self.assertEqual(content, b'')
+
+    def test_missing_or_outside_media_root(self):
+        self.assertEqual(self.client.get('/media/photos/dog.jpg').status_code, 404)
+        self.assertEqual(self.client.get('/media/../cs412/settings.py').status_code, 404)
+        self.assertEqual(self.client.post(self.url).status_code, 405)
+
+class StaticFilesMiddlewareTests(SimpleTestCase):
+    '''Collected files are served with their compressed copies, immutable
+    caching for hashed names and 304s for revalidations.'''
+
+    CSS = b'body { color: #333; margin: 0 auto; }\n' * 50
+
+    def setUp(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        for name in ['site.css', 'site.0123456789ab.css']:
+            (root / name).write_bytes(self.CSS)
+            (root / f'{name}.gz').write_bytes(gzip.compress(self.CSS, mtime=0))
+        (root / 'staticfiles.json').write_text(json.dumps(
+            {'version': '1.1', 'paths': {'site.css': 'site.0123456789ab.css'}}))
+        self.enterContext(override_settings(STATIC_ROOT=str(root), STORAGES={
+            'staticfiles': {'BACKEND': 'cs412.storage.CompressedManifestStaticFilesStorage'},
+        }))
+
+    def get(self, path, **headers):
+        response = self.client.get(path, headers=headers)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, content
+
+    def test_hashed_file_is_immutable(self):
+        response, content = self.get('/static/site.0123456789ab.css')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(content, self.CSS)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertTrue(response['Content-Type'].startswith('text/css'))
+
+    def test_unhashed_file_revalidates(self):
+        response, _ = self.get('/static/site.css')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=0, must-revalidate')
+        response, content = self.get('/static/site.css', if_none_match=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(content, b'')
+
+    def test_compressed_copy_is_chosen(self):
+        response, content = self.get('/static/site.css', accept_encoding='br, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(gzip.decompress(content), self.CSS)
+
+        identity, content = self.get('/static/site.css')
+        self.assertFalse(identity.has_header('Content-Encoding'))
+        self.assertEqual(content, self.CSS)
+        # Each encoding has its own validator
+        self.assertNotEqual(identity['ETag'], response['ETag'])
+
+    def test_only_get_and_head(self):
+        self.assertEqual(self.client.post('/static/site.css').status_code, 405)
+        self.assertEqual(self.client.head('/static/site.css').status_code, 200)
+
+    def test_unknown_file_falls_through(self):
+        self.assertEqual(self.client.get('/static/missing.css').status_code, 404)
+
+
+class AnalyticsRouterTests(SimpleTestCase):
+    '''Analytics reads go to the read-only replica, writes (and reads inside
+    a write transaction) to the read-write connection, and every other app
+    stays on the default database.'''
+
+    router = AnalyticsRouter()
+
+    def test_reads_and_writes(self):
+        for model in [Voter, Result]:
+            with self.subTest(model=model):
+                self.assertEqual(self.router.db_for_read(model), ANALYTICS_REPLICA_DB)
+                self.assertEqual(self.router.db_for_write(model), ANALYTICS_DB)
+        self.assertIsNone(self.router.db_for_read(Article))
+        self.assertIsNone(self.router.db_for_write(Article))
+
+    def test_reads_inside_write_transaction(self):
+        connection = connections[ANALYTICS_DB]
+        connection.in_atomic_block = True
+        try:
+            self.assertEqual(self.router.db_for_read(Voter), ANALYTICS_DB)
+        finally:
+            connection.in_atomic_block = False
+
+    def test_migrations(self):
+        self.assertTrue(self.router.allow_migrate(ANALYTICS_DB, 'voter_analytics'))
+        self.assertFalse(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'voter_analytics'))
+        self.assertFalse(self.router.allow_migrate(ANALYTICS_REPLICA_DB, 'voter_analytics'))
+        self.assertFalse(self.router.allow_migrate(ANALYTICS_DB, 'blog'))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'blog'))
+
+    def test_no_relations_across_databases(self):
+        self.assertFalse(self.router.allow_relation(Voter(), Article()))
+        self.assertIsNone(self.router.allow_relation(Voter(), Result()))
+
+
+class AnalyticsDatabaseTests(TestCase):
+    '''Analytics rows live only in the analytics database.'''
+
+    databases = {DEFAULT_DB_ALIAS, ANALYTICS_DB}
+
+    def test_rows_are_written_to_analytics_database(self):
+        Voter.objects.create(
+            last_name='Smith', first_name='Ann', street_number='1', street_name='Main St', zip_code='02458',
+            date_of_birth='1980-01-01', date_of_registration='2000-01-01', party='D', precinct='1',
+            v20state=True, v21town=False, v21primary=False, v22general=True, v23town=False, voter_score=2,
+        )
+        self.assertEqual(Voter.objects.using(ANALYTICS_DB).count(), 1)
+        # The default database doesn't even have the table
+        with self.assertRaises(OperationalError):
+            Voter.objects.using(DEFAULT_DB_ALIAS).exists()
+
+
+@override_settings(QUERY_BUDGET_MODE='raise')
+class QueryBudgetTests(TestCase):
+    '''Every hot view stays within settings.QUERY_BUDGETS on generated data
+    (the benchmark cases plus the budgeted views they don't cover).'''
+
+    databases = {DEFAULT_DB_ALIAS, ANALYTICS_DB}
+
+    @classmethod
+    def setUpTestData(cls):
+        generate(scale=0.002)
+
+    def setUp(self):
+        for alias in ['default', 'versions']:
+            caches[alias].clear()
+
+    def get(self, url, username=None):
+        if username is None:
+            self.client.logout()
+        else:
+            self.client.force_login(User.objects.get(username=username))
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return view_key(response.resolver_match)
+
+    def test_views_stay_within_budget(self):
+        seen = set()
+        for case in CASES:
+            with self.subTest(case=case.name):
+                seen.add(self.get(case.url(), case.login and case.login()))
+        article = Article.objects.order_by('pk').first()
+        seen.add(self.get(reverse('article', kwargs={'pk': article.pk})))
+        seen.add(self.get('/quotes/show_all/'))
+        self.assertLessEqual(set(settings.QUERY_BUDGETS), seen)
+
+    def test_going_over_budget_fails(self):
+        with override_settings(QUERY_BUDGETS={'blog.views.ShowAllView': 0}):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get('/blog/show_all')
+
+
+class ViewKeyTests(SimpleTestCase):
+    '''Views are keyed by their dotted path, which tells apart views with
+    the same URL name.'''
+
+    def test_view_keys(self):
+        self.assertEqual(view_key(resolve('/blog/show_all')), 'blog.views.ShowAllView')
+        self.assertEqual(view_key(resolve('/quotes/show_all/')), 'quotes.views.show_all')
@@ -19,11 +19,16 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path, include
-from django.conf.urls.static import static
+import re
+from urllib.parse import urlsplit
+from django.urls import path, re_path, include
 from django.conf import settings
+from .views import request_stats_view, profile_list_view, profile_detail_view, media_view
 
 urlpatterns = [
+    path('admin/stats/', request_stats_view, name='request_stats'),
+    path('admin/profiles/', profile_list_view, name='profile_list'),
+    path('admin/profiles/<str:view_dir>/<str:filename>', profile_detail_view, name='request_profile_detail'),
     path('admin/', admin.site.urls),
     path('hw/', include('hw.urls')),
     path('quotes/', include('quotes.urls')),
@@ -35,6 +40,6 @@ urlpatterns = [
     path('voter_analytics/', include('voter_analytics.urls')),
     path('dadjokes/', include('dadjokes.urls')),
     path('project/', include('project.urls')),
+    # Uploaded files (mini_insta photos, blog images)
+    re_path(rf'^{re.escape(urlsplit(settings.MEDIA_URL).path.lstrip("/"))}(?P<path>.+)$', media_view, name='media'),
 ] 
-urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,92 @@
+# File: cs412/views.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Project-wide admin pages, and the view serving uploaded media.
+
+import os
+from urllib.parse import quote
+from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404
+from django.shortcuts import render, redirect
+from django.conf import settings
+from django.utils._os import safe_join
+from django.views.decorators.http import require_safe
+from .fileserving import serve_file
+from .instrumentation import METRICS, request_stats
+from .profiling import PROFILE_QUERY_PARAM, get_profile_dir, get_profile_path, list_profiles, summarize_profile
+
+
+@staff_member_required
+def request_stats_view(request):
+    '''Show per-view percentiles of the request measurements taken by
+    InstrumentationMiddleware in this process. POST resets them.'''
+    if request.method == 'POST':
+        request_stats.reset()
+        return redirect('request_stats')
+    context = {
+        **admin.site.each_context(request),
+        'title': 'Request stats',
+        'rows': request_stats.summary(),
+        'metrics': METRICS,
+        'budgets': getattr(settings, 'QUERY_BUDGETS', {}),
+    }
+    return render(request, 'cs412/request_stats.html', context)
+
+
+@staff_member_required
+def profile_list_view(request):
+    '''List the stored request profiles, newest first per view.'''
+    context = {
+        **admin.site.each_context(request),
+        'title': 'Request profiles',
+        'profiles': list_profiles(),
+        'profile_dir': get_profile_dir(),
+        'query_param': PROFILE_QUERY_PARAM,
+        'sample_rate': getattr(settings, 'PROFILING_SAMPLE_RATE', 0),
+    }
+    return render(request, 'cs412/profile_list.html', context)
+
+
+@staff_member_required
+def profile_detail_view(request, view_dir, filename):
+    '''Show the top functions of a .prof file, or download it with
+    ?download=1. Collapsed stack files are always downloaded.'''
+    path = get_profile_path(view_dir, filename)
+    if path is None:
+        raise Http404('No such profile.')
+    if filename.endswith('.collapsed') or request.GET.get('download'):
+        return FileResponse(open(path, 'rb'), as_attachment=True, filename=f'{view_dir}-{filename}')
+    context = {
+        **admin.site.each_context(request),
+        'title': f'Profile of {view_dir}',
+        'view_dir': view_dir,
+        'filename': filename,
+        'summary': summarize_profile(path),
+    }
+    return render(request, 'cs412/profile_detail.html', context)
+
+
+@require_safe
+def media_view(request, path):
+    '''Serve an uploaded file from MEDIA_ROOT with validators and byte
+    ranges. With settings.MEDIA_OFFLOAD set to 'x-accel-redirect' (nginx,
+    under MEDIA_ACCEL_REDIRECT_PREFIX) or 'x-sendfile' (Apache/lighttpd), only
+    the headers are produced here and the fronting server sends the file.'''
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404('No such file.')
+    if not os.path.isfile(full_path):
+        raise Http404('No such file.')
+
+    offload = None
+    mode = getattr(settings, 'MEDIA_OFFLOAD', None)
+    if mode == 'x-accel-redirect':
+        prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+        offload = (mode, prefix + quote(os.path.relpath(full_path, settings.MEDIA_ROOT).replace(os.sep, '/')))
+    elif mode == 'x-sendfile':
+        offload = (mode, full_path)
+
+    headers = {'Cache-Control': f'public, max-age={getattr(settings, "MEDIA_MAX_AGE", 86400)}'}
+    return serve_file(request, full_path, headers=headers, offload=offload)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dadjokes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='joke',
+            name='created',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='picture',
+            name='created',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
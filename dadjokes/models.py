@@ -11,7 +11,7 @@ class Joke(models.Model):
     '''Model representing a dad joke.'''
     text = models.TextField(blank=False)
     contributor = models.TextField(blank=False)
-    created = models.DateTimeField(auto_now_add=True)
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return f'Joke by {self.contributor}'
@@ -24,7 +24,7 @@ class Picture(models.Model):
     '''Model representing a silly picture or GIF.'''
     image_url = models.URLField(blank=False)
     contributor = models.TextField(blank=False)
-    created = models.DateTimeField(auto_now_add=True)
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return f'Picture by {self.contributor}'
@@ -2,11 +2,37 @@
 # Author: Saksham Goel (sakshamg@bu.edu), 11/11/2025
 # Description: Serializers for the dadjokes application, including Joke and Picture.
 
+from django.db import transaction
 from rest_framework import serializers
 from .models import *
+from cs412.api_cache import bump_model_version
+from cs412.sampling import invalidate_sampled_ids
+from cs412.serializers import SparseFieldsetMixin
 
+# Rows per INSERT statement when bulk creating jokes
+BULK_CREATE_BATCH_SIZE = 500
 
-class JokeSerializer(serializers.ModelSerializer):
+
+class JokeListSerializer(serializers.ListSerializer):
+    '''
+    A list serializer that inserts many jokes at once.
+    '''
+
+    def create(self, validated_data):
+        '''
+        Insert all the jokes with bulk_create in one transaction.
+        '''
+        with transaction.atomic():
+            jokes = Joke.objects.bulk_create(
+                [Joke(**item) for item in validated_data], batch_size=BULK_CREATE_BATCH_SIZE,
+            )
+            # bulk_create doesn't send save signals, so invalidate by hand
+            transaction.on_commit(lambda: bump_model_version(Joke))
+            transaction.on_commit(lambda: invalidate_sampled_ids(Joke))
+        return jokes
+
+
+class JokeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     '''
     A serializer for the Joke model.
     '''
@@ -14,16 +40,16 @@ class JokeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Joke
         fields = ['id', 'text', 'contributor', 'created']
+        list_serializer_class = JokeListSerializer
     
     def create(self, validated_data):
         '''
         Override the superclass method that handles object creation.
         '''
-        print(f'JokeSerializer.create, validated_data={validated_data}.')
         return Joke.objects.create(**validated_data)
 
 
-class PictureSerializer(serializers.ModelSerializer):
+class PictureSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     '''
     A serializer for the Picture model.
     '''
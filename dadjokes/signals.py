@@ -0,0 +1,18 @@
+# File: dadjokes/signals.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Signal receivers for the dadjokes application.
+
+from django.db.models.signals import post_save, post_delete
+from cs412.sampling import invalidate_sampled_ids
+from cs412.api_cache import bump_model_version
+from .models import Joke, Picture
+
+# Keep the cached id lists used for random jokes/pictures in step with the tables
+for model in (Joke, Picture):
+    post_save.connect(invalidate_sampled_ids, sender=model)
+    post_delete.connect(invalidate_sampled_ids, sender=model)
+
+# New API response versions (ETags) whenever a joke or picture changes
+for model in (Joke, Picture):
+    post_save.connect(bump_model_version, sender=model)
+    post_delete.connect(bump_model_version, sender=model)
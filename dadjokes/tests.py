@@ -1,3 +1,133 @@
+# File: dadjokes/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for the dadjokes REST API.
+
+from django.core.cache import caches
 from django.test import TestCase
+from .models import Joke
+
+
+class APITestCase(TestCase):
+    '''Starts every test with empty caches, so responses cached by an earlier
+    test (whose rows were rolled back) can't be served.'''
+
+    def setUp(self):
+        for alias in ['default', 'versions']:
+            caches[alias].clear()
+
+
+class CachedResponseTests(APITestCase):
+    '''Cached API responses are revalidated with ETags and replaced as soon
+    as a joke is saved or deleted.'''
+
+    def setUp(self):
+        super().setUp()
+        self.joke = Joke.objects.create(text='Why did the coffee file a police report? It got mugged.',
+                                        contributor='Barista')
+
+    def test_unchanged_response_is_not_modified(self):
+        response = self.client.get('/dadjokes/api/jokes')
+        self.assertEqual(response.status_code, 200)
+        again = self.client.get('/dadjokes/api/jokes', headers={'if-none-match': response['ETag']})
+        self.assertEqual(again.status_code, 304)
+
+    def test_cached_response_runs_no_queries(self):
+        response = self.client.get('/dadjokes/api/jokes')
+        with self.assertNumQueries(0):
+            again = self.client.get('/dadjokes/api/jokes')
+        self.assertEqual(again.content, response.content)
+
+    def test_save_invalidates(self):
+        url = f'/dadjokes/api/joke/{self.joke.pk}'
+        response = self.client.get(url)
+        self.joke.text = 'I only know 25 letters of the alphabet. I don\'t know y.'
+        self.joke.save()
+        again = self.client.get(url, headers={'if-none-match': response['ETag']})
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.json()['text'], self.joke.text)
+
+    def test_delete_invalidates(self):
+        response = self.client.get('/dadjokes/api/jokes')
+        self.joke.delete()
+        again = self.client.get('/dadjokes/api/jokes', headers={'if-none-match': response['ETag']})
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.json()['results'], [])
+
+
+class CursorPaginationTests(APITestCase):
+    '''The list APIs page newest first through opaque cursors, and ?fields=
+    trims the objects returned.'''
+
+    def setUp(self):
+        super().setUp()
+        self.jokes = [Joke.objects.create(text=f'Joke {i}', contributor='Tester') for i in range(7)]
+
+    def test_pages_cover_every_joke_once(self):
+        url, seen = '/dadjokes/api/jokes?page_size=3', []
+        while url:
+            page = self.client.get(url).json()
+            self.assertLessEqual(len(page['results']), 3)
+            self.assertNotIn('count', page)
+            seen += [joke['id'] for joke in page['results']]
+            url = page['next']
+        self.assertEqual(seen, [joke.pk for joke in reversed(self.jokes)])
+
+    def test_previous_page(self):
+        first = self.client.get('/dadjokes/api/jokes?page_size=3').json()
+        second = self.client.get(first['next']).json()
+        self.assertEqual(self.client.get(second['previous']).json()['results'], first['results'])
+
+    def test_large_page_size_is_clamped(self):
+        page = self.client.get('/dadjokes/api/jokes?page_size=1000').json()
+        self.assertEqual(len(page['results']), 7)
+        self.assertIsNone(page['next'])
+
+    def test_sparse_fields(self):
+        page = self.client.get('/dadjokes/api/jokes?fields=id,text,unknown').json()
+        self.assertEqual(set(page['results'][0]), {'id', 'text'})
+        joke = self.client.get(f'/dadjokes/api/joke/{self.jokes[0].pk}?fields=contributor').json()
+        self.assertEqual(joke, {'contributor': 'Tester'})
+
+
+class BulkJokeTests(APITestCase):
+    '''Bulk creation from JSON or NDJSON, and ?ids= multi-gets.'''
+
+    def post_bulk(self, body, content_type='application/json'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/dadjokes/api/jokes/bulk', body, content_type=content_type)
+
+    def test_bulk_create_json(self):
+        jokes = [{'text': f'Joke {i}', 'contributor': 'Tester'} for i in range(3)]
+        response = self.post_bulk(jokes)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([joke['text'] for joke in response.json()], ['Joke 0', 'Joke 1', 'Joke 2'])
+        self.assertEqual(Joke.objects.count(), 3)
+
+    def test_bulk_create_ndjson(self):
+        body = '{"text": "Joke 0", "contributor": "Tester"}\n\n{"text": "Joke 1", "contributor": "Tester"}\n'
+        self.assertEqual(self.post_bulk(body, 'application/x-ndjson').status_code, 201)
+        self.assertEqual(Joke.objects.count(), 2)
+
+    def test_invalid_joke_creates_nothing(self):
+        response = self.post_bulk([{'text': 'Joke', 'contributor': 'Tester'}, {'text': ''}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Joke.objects.count(), 0)
+        self.assertEqual(self.post_bulk({'text': 'Joke', 'contributor': 'Tester'}).status_code, 400)
+        self.assertEqual(self.post_bulk([]).status_code, 400)
+
+    def test_bulk_create_invalidates_cached_list(self):
+        response = self.client.get('/dadjokes/api/jokes')
+        self.post_bulk([{'text': 'Joke', 'contributor': 'Tester'}])
+        again = self.client.get('/dadjokes/api/jokes', headers={'if-none-match': response['ETag']})
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(len(again.json()['results']), 1)
 
-# Create your tests here.
+    def test_multi_get_keeps_order_and_skips_missing(self):
+        jokes = [Joke.objects.create(text=f'Joke {i}', contributor='Tester') for i in range(3)]
+        ids = f'{jokes[2].pk},{jokes[0].pk},999999,{jokes[2].pk}'
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/dadjokes/api/joke?ids={ids}')
+        self.assertEqual([joke['id'] for joke in response.json()], [jokes[2].pk, jokes[0].pk])
+        for ids in ['', 'a,b']:
+            with self.subTest(ids=ids):
+                self.assertEqual(self.client.get(f'/dadjokes/api/joke?ids={ids}').status_code, 400)
@@ -18,8 +18,11 @@ urlpatterns = [
     path('api/', RandomJokeAPIView.as_view()),
     path('api/random', RandomJokeAPIView.as_view()),
     path('api/jokes', JokeListAPIView.as_view()),
+    path('api/jokes/bulk', JokeBulkCreateAPIView.as_view()),
+    path('api/joke', JokeDetailAPIView.as_view()),
     path('api/joke/<int:pk>', JokeDetailAPIView.as_view()),
     path('api/pictures', PictureListAPIView.as_view()),
+    path('api/picture', PictureDetailAPIView.as_view()),
     path('api/picture/<int:pk>', PictureDetailAPIView.as_view()),
     path('api/random_picture', RandomPictureAPIView.as_view()),
 ]
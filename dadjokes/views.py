@@ -3,12 +3,26 @@
 # Description: Views for the dadjokes application
 
 from django.shortcuts import render
+from django.http import Http404
+from django.utils.decorators import method_decorator
 from django.views.generic import ListView, DetailView, TemplateView
 from .models import Joke, Picture
-import random
-from rest_framework import generics
+from cs412.sampling import random_instance
+from cs412.api_cache import CachedResponseMixin
+from cs412.caching import cached_page
+from cs412.parsers import NDJSONParser
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
 from .serializers import *
 
+# Most jokes accepted by one bulk create request
+MAX_BULK_JOKES = 5000
+
+# Most objects returned by one ?ids= multi-get
+MAX_MULTI_GET_IDS = 100
+
 
 # Create your views here.
 
@@ -18,15 +32,16 @@ class RandomJokeAndPictureView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        jokes = list(Joke.objects.all())
-        pictures = list(Picture.objects.all())
-        if jokes:
-            context['joke'] = random.choice(jokes)
-        if pictures:
-            context['picture'] = random.choice(pictures)
+        joke = random_instance(Joke)
+        picture = random_instance(Picture)
+        if joke:
+            context['joke'] = joke
+        if picture:
+            context['picture'] = picture
         return context
 
 
+@method_decorator(cached_page(models=[Joke], vary_on_user=False), name='dispatch')
 class JokeListView(ListView):
     '''View to show all jokes.'''
     model = Joke
@@ -41,6 +56,7 @@ class JokeDetailView(DetailView):
     context_object_name = 'joke'
 
 
+@method_decorator(cached_page(models=[Picture], vary_on_user=False), name='dispatch')
 class PictureListView(ListView):
     '''View to show all pictures.'''
     model = Picture
@@ -63,32 +79,68 @@ class RandomJokeAPIView(generics.RetrieveAPIView):
     serializer_class = JokeSerializer
     
     def get_object(self):
-        jokes = list(Joke.objects.all())
-        if jokes:
-            return random.choice(jokes)
-        return None
+        joke = random_instance(Joke)
+        if joke is None:
+            raise Http404('No jokes yet.')
+        return joke
 
 
-class JokeListAPIView(generics.ListCreateAPIView):
+class JokeListAPIView(CachedResponseMixin, generics.ListCreateAPIView):
     '''API view to return all jokes and create a new joke.'''
     queryset = Joke.objects.all()
     serializer_class = JokeSerializer
 
 
-class JokeDetailAPIView(generics.RetrieveAPIView):
-    '''API view to return one joke by primary key.'''
+class JokeBulkCreateAPIView(generics.GenericAPIView):
+    '''API view to create many jokes at once from a JSON array or NDJSON body.'''
+    queryset = Joke.objects.all()
+    serializer_class = JokeSerializer
+    parser_classes = [JSONParser, NDJSONParser]
+
+    def post(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            raise ValidationError({'non_field_errors': ['Expected a list of jokes.']})
+        serializer = self.get_serializer(data=request.data, many=True,
+                                         allow_empty=False, max_length=MAX_BULK_JOKES)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class MultiGetMixin:
+    '''Mixin for retrieve views: without a pk in the URL, return the objects
+    listed in ?ids=1,2,3 (in that order, skipping missing ones) in one query.'''
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.lookup_field in kwargs:
+            return super().retrieve(request, *args, **kwargs)
+        try:
+            ids = list(dict.fromkeys(int(pk) for pk in request.query_params.get('ids', '').split(',') if pk.strip()))
+        except ValueError:
+            raise ValidationError({'ids': ['Expected a comma-separated list of ids.']})
+        if not ids:
+            raise ValidationError({'ids': ['This query parameter is required.']})
+        if len(ids) > MAX_MULTI_GET_IDS:
+            raise ValidationError({'ids': [f'At most {MAX_MULTI_GET_IDS} ids per request.']})
+        objects = self.filter_queryset(self.get_queryset()).in_bulk(ids)
+        serializer = self.get_serializer([objects[pk] for pk in ids if pk in objects], many=True)
+        return Response(serializer.data)
+
+
+class JokeDetailAPIView(CachedResponseMixin, MultiGetMixin, generics.RetrieveAPIView):
+    '''API view to return one joke by primary key, or several by ?ids=.'''
     queryset = Joke.objects.all()
     serializer_class = JokeSerializer
 
 
-class PictureListAPIView(generics.ListAPIView):
+class PictureListAPIView(CachedResponseMixin, generics.ListAPIView):
     '''API view to return all pictures.'''
     queryset = Picture.objects.all()
     serializer_class = PictureSerializer
 
 
-class PictureDetailAPIView(generics.RetrieveAPIView):
-    '''API view to return one picture by primary key.'''
+class PictureDetailAPIView(MultiGetMixin, generics.RetrieveAPIView):
+    '''API view to return one picture by primary key, or several by ?ids=.'''
     queryset = Picture.objects.all()
     serializer_class = PictureSerializer
 
@@ -99,7 +151,7 @@ class RandomPictureAPIView(generics.RetrieveAPIView):
     serializer_class = PictureSerializer
     
     def get_object(self):
-        pictures = list(Picture.objects.all())
-        if pictures:
-            return random.choice(pictures)
-        return None
+        picture = random_instance(Picture)
+        if picture is None:
+            raise Http404('No pictures yet.')
+        return picture
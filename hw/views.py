@@ -1,5 +1,6 @@
 from django.shortcuts import render
 from django.http import HttpResponse, HttpRequest
+from cs412.caching import cached_page
 
 import time
 
@@ -22,6 +23,8 @@ def home_page(request):
     }
     return render(request, template_name, context)
 
+# The page shows the time it was rendered, so only keep it briefly
+@cached_page(timeout=60, vary_on_user=False)
 def about(request):
     template_name = 'hw/about.html'
 
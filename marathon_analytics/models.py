@@ -1,4 +1,9 @@
-from django.db import models
+from django.db import models, transaction
+from cs412.api_cache import bump_model_version
+from cs412.routers import ANALYTICS_DB
+
+# Rows per INSERT statement in load_data()
+LOAD_BATCH_SIZE = 1000
 
 # Create your models here.
 
@@ -57,32 +62,44 @@ def load_data():
 
     f.readline()  # skip header line
 
-    for line in f:
-        fields = line.strip().split(',')
-        # show which value in each field
-        try:
-            result = Result(
-                bib=fields[0], 
-                first_name=fields[1], 
-                last_name=fields[2], 
-                ctz=fields[3], 
-                city=fields[4], 
-                state=fields[5],
-                gender=fields[6],
-                division=fields[7],
-                place_overall=fields[8],
-                place_gender=fields[9],
-                place_division=fields[10],
-                start_time_of_day=fields[11],
-                finish_time_of_day=fields[12],
-                time_finish=fields[13],
-                time_half1=fields[14],
-                time_half2=fields[15]
-            )
-            result.save()
-            print(f'Added result: {result}')
-        except:
-            print("Something went wrong")
-            print(f"line={line}")
-        
-        print(f"Created {len(Result.objects.all())} results.")
\ No newline at end of file
+    batch = []
+    # one transaction on the analytics database, inserting in batches
+    with transaction.atomic(using=ANALYTICS_DB):
+        for line in f:
+            fields = line.strip().split(',')
+            # show which value in each field
+            try:
+                result = Result(
+                    bib=fields[0], 
+                    first_name=fields[1], 
+                    last_name=fields[2], 
+                    ctz=fields[3], 
+                    city=fields[4], 
+                    state=fields[5],
+                    gender=fields[6],
+                    division=fields[7],
+                    place_overall=fields[8],
+                    place_gender=fields[9],
+                    place_division=fields[10],
+                    start_time_of_day=fields[11],
+                    finish_time_of_day=fields[12],
+                    time_finish=fields[13],
+                    time_half1=fields[14],
+                    time_half2=fields[15]
+                )
+                # catch bad values here rather than failing a whole batch insert
+                result.clean_fields()
+                batch.append(result)
+            except:
+                print("Something went wrong")
+                print(f"line={line}")
+
+            if len(batch) >= LOAD_BATCH_SIZE:
+                Result.objects.using(ANALYTICS_DB).bulk_create(batch)
+                batch = []
+        Result.objects.using(ANALYTICS_DB).bulk_create(batch)
+
+    f.close()
+    # bulk_create doesn't send save signals, so drop cached pages by hand
+    bump_model_version(Result)
+    print(f"Created {Result.objects.using(ANALYTICS_DB).count()} results.")
@@ -1,3 +1,61 @@
+# File: marathon_analytics/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for the results export and the filters it shares with the results list.
+
+import csv
+import gzip
+import io
+import json
+from django.db import DEFAULT_DB_ALIAS
 from django.test import TestCase
+from django.urls import reverse
+from cs412.routers import ANALYTICS_DB
+from .models import Result
+from .views import EXPORT_FIELDS
+
+
+class ResultExportTests(TestCase):
+    '''The export streams the filtered results in finishing order.'''
+
+    databases = {DEFAULT_DB_ALIAS, ANALYTICS_DB}
+
+    @classmethod
+    def setUpTestData(cls):
+        def result(place, city):
+            return Result.objects.create(
+                bib=place, first_name=f'Runner{place}', last_name='Smith', ctz='', city=city,
+                state='MA', gender='F', division='F18-39', place_overall=place, place_gender=place,
+                place_division=place, start_time_of_day='09:00:00', finish_time_of_day='12:00:00',
+                time_finish='03:00:00', time_half1='01:30:00', time_half2='01:30:00',
+            )
+        # Created out of order; the export sorts by place_overall
+        cls.third = result(3, 'Boston')
+        cls.first = result(1, 'Newton')
+        cls.second = result(2, 'Boston')
+
+    def export(self, query=''):
+        '''Return the export response and its full (streamed) body.'''
+        response = self.client.get(reverse('results_export') + query)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content)
+
+    def test_csv_in_place_order(self):
+        response, body = self.export()
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="results.csv"')
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        self.assertEqual(rows[0], EXPORT_FIELDS)
+        self.assertEqual([int(row[0]) for row in rows[1:]],
+                         [self.first.pk, self.second.pk, self.third.pk])
+
+    def test_city_filter(self):
+        response, body = self.export('?city=Boston')
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        self.assertEqual([int(row[0]) for row in rows[1:]], [self.second.pk, self.third.pk])
 
-# Create your tests here.
+    def test_gzipped_ndjson(self):
+        response, body = self.export('?format=ndjson&gzip=1&city=Newton')
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="results.ndjson.gz"')
+        records = [json.loads(line) for line in gzip.decompress(body).decode().splitlines()]
+        self.assertEqual([record['id'] for record in records], [self.first.pk])
+        self.assertEqual(records[0]['time_finish'], '03:00:00')
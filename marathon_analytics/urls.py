@@ -5,6 +5,7 @@ urlpatterns = [
     # map the URL (empty string) to the view
 	path(r'', views.ResultsListView.as_view(), name='home'),
     path(r'results', views.ResultsListView.as_view(), name='results_list'),
+    path(r'results/export', views.export_results, name='results_export'),
     path(r'result/<int:pk>/', views.ResultDetailView.as_view(), name='result_detail'),
 ]
  
\ No newline at end of file
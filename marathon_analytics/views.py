@@ -3,6 +3,32 @@ from django.views.generic import ListView, DetailView
 from . models import Result
 import plotly
 import plotly.graph_objs as go
+from cs412.export import export_response, iter_rows
+
+# Columns of the results export, in order
+EXPORT_FIELDS = [
+    'id', 'bib', 'first_name', 'last_name', 'ctz', 'city', 'state', 'gender', 'division',
+    'place_overall', 'place_gender', 'place_division',
+    'start_time_of_day', 'finish_time_of_day', 'time_finish', 'time_half1', 'time_half2',
+]
+
+
+def filter_results(results, params):
+    '''Apply the results search filters in a QueryDict (request.GET).'''
+    if 'city' in params:
+        city = params['city']
+
+        if city:
+            results = results.filter(city=city)
+    return results
+
+
+def export_results(request):
+    '''Stream the results matching the ResultsListView filters as CSV
+    (or NDJSON with ?format=ndjson, gzipped with ?gzip=1).'''
+    results = filter_results(Result.objects.order_by('place_overall', 'pk'), request.GET)
+    return export_response(request, 'results', EXPORT_FIELDS, iter_rows(results, EXPORT_FIELDS))
+
  
 class ResultsListView(ListView):
     '''View to display marathon results'''
@@ -16,13 +42,7 @@ class ResultsListView(ListView):
         # limit results to first 25 records (for now)
         results = super().get_queryset()
         # return results[:25]
-
-        if 'city' in self.request.GET:
-            city = self.request.GET['city']
-
-            if city:    
-                results = results.filter(city=city)
-        return results
+        return filter_results(results, self.request.GET)
 
 class ResultDetailView(DetailView):
     '''View to show detail page for one result.'''
@@ -0,0 +1,15 @@
+# File: mini_insta/signals.py
+# Author: Saksham Goel (saksham@bu.edu), 10/19/2026
+# Description: Signal receivers for the Mini Insta application.
+
+from django.db.models.signals import post_save, post_delete
+from cs412.caching import connect_cache_invalidation
+from cs412.middleware import invalidate_cached_profile
+from .models import Profile, Post, Photo, Follow, Comment, Like
+
+# Keep the per-user profile cache used by CurrentProfileMiddleware fresh
+post_save.connect(invalidate_cached_profile, sender=Profile)
+post_delete.connect(invalidate_cached_profile, sender=Profile)
+
+# Drop cached pages and feed cards when their content changes
+connect_cache_invalidation(Profile, Post, Photo, Follow, Comment, Like)
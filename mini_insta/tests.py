@@ -1,3 +1,36 @@
+# File: mini_insta/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for the views that act on the logged-in user's profile.
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+from .models import Profile, Post
+
+
+class CurrentProfileViewTests(TestCase):
+    '''Views using request.insta_profile 404 for users without a profile.'''
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='viewer', password='password')
+        self.client.force_login(self.user)
+
+    def test_views_404_without_profile(self):
+        author = Profile.objects.create(user=User.objects.create_user(username='author'),
+                                        username='author', display_name='Author')
+        post = Post.objects.create(profile=author, caption='Hello')
+        for url in [reverse('my_profile'), reverse('show_feed'), '/mini_insta/profile/update',
+                    reverse('create_post'), reverse('search') + '?query=hello']:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 404)
+        for url in [reverse('follow_profile', kwargs={'pk': author.pk}),
+                    reverse('like_post', kwargs={'pk': post.pk})]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.post(url).status_code, 404)
 
-# Create your tests here.
+    def test_views_use_profile(self):
+        profile = Profile.objects.create(user=self.user, username='viewer', display_name='Viewer')
+        response = self.client.get(reverse('my_profile'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['profile'], profile)
+        self.assertEqual(self.client.get(reverse('show_feed')).status_code, 200)
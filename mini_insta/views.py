@@ -12,8 +12,27 @@ from django.contrib.auth import login
 from .models import *
 from .forms import CreatePostForm, UpdateProfileForm, UpdatePostForm, CreateProfileForm
 from django.urls import reverse
+from django.db.models import Count, Prefetch
+from django.utils.decorators import method_decorator
+from cs412.caching import cached_page
+from cs412.middleware import profile_or_404
 
 
+def with_card_data(posts):
+    '''Load everything a post card shows (author, photos, like and comment
+    counts, comments with their authors) in a fixed number of queries,
+    instead of several per post. Templates use post.card_photos,
+    post.card_comments, post.num_likes and post.num_comments.'''
+    return (posts.select_related('profile')
+            .annotate(num_likes=Count('like', distinct=True), num_comments=Count('comment', distinct=True))
+            .prefetch_related(
+                Prefetch('photo_set', queryset=Photo.objects.order_by('-timestamp'), to_attr='card_photos'),
+                Prefetch('comment_set', queryset=Comment.objects.select_related('profile').order_by('-timestamp'),
+                         to_attr='card_comments'),
+            ))
+
+
+@method_decorator(cached_page(models=[Profile]), name='dispatch')
 class ProfileListView(ListView):
     """List all Profile records for display on the index page."""
     model = Profile
@@ -35,7 +54,7 @@ class MyProfileView(LoginRequiredMixin, DetailView):
     
     def get_object(self):
         """Return the profile for the logged-in user."""
-        return Profile.objects.get(user=self.request.user)
+        return profile_or_404(self.request.insta_profile)
 
 class PostDetailView(DetailView):
     """Display a single Post selected by its primary key."""
@@ -54,7 +73,7 @@ class CreatePostView(LoginRequiredMixin, CreateView):
     
     def get_object(self):
         """Return the profile for the logged-in user."""
-        return Profile.objects.get(user=self.request.user)
+        return profile_or_404(self.request.insta_profile)
     
     def get_context_data(self):
         """Add profile to context."""
@@ -98,7 +117,7 @@ class UpdateProfileView(LoginRequiredMixin, UpdateView):
     
     def get_object(self):
         """Return the profile for the logged-in user."""
-        return Profile.objects.get(user=self.request.user)
+        return profile_or_404(self.request.insta_profile)
 
 class DeletePostView(LoginRequiredMixin, DeleteView):
     """Delete an existing Post."""
@@ -112,14 +131,13 @@ class DeletePostView(LoginRequiredMixin, DeleteView):
     def get_context_data(self, **kwargs):
         """Add post and profile to context."""
         context = super().get_context_data(**kwargs)
-        context['post'] = self.get_object()
-        context['profile'] = self.get_object().profile
+        context['post'] = self.object
+        context['profile'] = self.object.profile
         return context
     
     def get_success_url(self):
         """Redirect to the profile page of the deleted post."""
-        post = self.get_object()
-        return reverse('show_profile', kwargs={'pk': post.profile.pk})
+        return reverse('show_profile', kwargs={'pk': self.object.profile_id})
 
 class UpdatePostView(LoginRequiredMixin, UpdateView):
     """Update an existing Post."""
@@ -155,12 +173,12 @@ class PostFeedListView(LoginRequiredMixin, ListView):
     
     def get_object(self):
         """Return the profile for the logged-in user."""
-        return Profile.objects.get(user=self.request.user)
+        return profile_or_404(self.request.insta_profile)
     
     def get_queryset(self):
         """Return posts from profiles that this profile follows."""
         profile = self.get_object()
-        return profile.get_post_feed()
+        return with_card_data(profile.get_post_feed())
     
     def get_context_data(self, **kwargs):
         """Add profile to context."""
@@ -178,7 +196,7 @@ class SearchView(LoginRequiredMixin, ListView):
     
     def get_object(self):
         """Return the profile for the logged-in user."""
-        return Profile.objects.get(user=self.request.user)
+        return profile_or_404(self.request.insta_profile)
     
     def dispatch(self, request, *args, **kwargs):
         """Handle GET requests - show search form if no query, otherwise show results."""
@@ -194,7 +212,7 @@ class SearchView(LoginRequiredMixin, ListView):
         """Return posts that match the search query."""
         query = self.request.GET.get('query', '')
         if query:
-            return Post.objects.filter(caption__icontains=query).order_by('-timestamp')
+            return with_card_data(Post.objects.filter(caption__icontains=query).order_by('-timestamp'))
         return Post.objects.none()
     
     def get_context_data(self, **kwargs):
@@ -301,7 +319,7 @@ class FollowProfileView(LoginRequiredMixin, TemplateView):
             profile_to_follow = get_object_or_404(Profile, pk=kwargs['pk'])
             
             # Get the current user's profile
-            current_profile = Profile.objects.get(user=request.user)
+            current_profile = profile_or_404(request.insta_profile)
             
             # Don't allow following yourself
             if current_profile != profile_to_follow:
@@ -331,7 +349,7 @@ class UnfollowProfileView(LoginRequiredMixin, TemplateView):
             profile_to_unfollow = get_object_or_404(Profile, pk=kwargs['pk'])
             
             # Get the current user's profile
-            current_profile = Profile.objects.get(user=request.user)
+            current_profile = profile_or_404(request.insta_profile)
             
             # Delete the follow relationship if it exists
             Follow.objects.filter(
@@ -359,7 +377,7 @@ class LikePostView(LoginRequiredMixin, TemplateView):
             post_to_like = get_object_or_404(Post, pk=kwargs['pk'])
             
             # Get the current user's profile
-            current_profile = Profile.objects.get(user=request.user)
+            current_profile = profile_or_404(request.insta_profile)
             
             # Don't allow liking your own post
             if current_profile != post_to_like.profile:
@@ -389,7 +407,7 @@ class UnlikePostView(LoginRequiredMixin, TemplateView):
             post_to_unlike = get_object_or_404(Post, pk=kwargs['pk'])
             
             # Get the current user's profile
-            current_profile = Profile.objects.get(user=request.user)
+            current_profile = profile_or_404(request.insta_profile)
             
             # Delete the like relationship if it exists
             Like.objects.filter(
@@ -3,7 +3,7 @@
 # Description: Register models for the admin interface.
 
 from django.contrib import admin
-from .models import DiningLocation, UserProfile, MealPost, JoinRequest, Review, MealMessage
+from .models import DiningLocation, UserProfile, MealPost, JoinRequest, Review, MealMessage, SlotOccupancy
 
 # Register your models here.
 admin.site.register(DiningLocation)
@@ -12,3 +12,4 @@ admin.site.register(MealPost)
 admin.site.register(JoinRequest)
 admin.site.register(Review)
 admin.site.register(MealMessage)
+admin.site.register(SlotOccupancy)
@@ -0,0 +1,103 @@
+# File: project/calendar.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: iCalendar (.ics) generation for meals, and the signed tokens
+# that let calendar apps subscribe to a user's meal feed without logging in.
+
+import hashlib
+from datetime import timedelta, timezone as dt_timezone
+from django.core import signing
+from django.utils import timezone
+
+# Default event length, since meals don't have an end time
+EVENT_DURATION = timedelta(hours=1)
+
+CALENDAR_TOKEN_SALT = 'project.calendar'
+
+# The feeds a user can subscribe to
+FEED_KINDS = ['all', 'hosted', 'joined']
+
+
+def make_calendar_token(user_profile):
+    '''Return the signed token identifying a profile's calendar feeds.'''
+    return signing.Signer(salt=CALENDAR_TOKEN_SALT).sign(str(user_profile.pk))
+
+
+def read_calendar_token(token):
+    '''Return the profile id in a calendar token, or None if it was tampered with.'''
+    try:
+        return int(signing.Signer(salt=CALENDAR_TOKEN_SALT).unsign(token))
+    except (signing.BadSignature, ValueError):
+        return None
+
+
+def feed_fingerprint(meals):
+    '''Return a hash of the ids and update times of the meals in a feed. It
+    changes whenever a meal joins, leaves or is edited; sums and maxima
+    can stay the same when one meal replaces another.'''
+    digest = hashlib.sha1()
+    for pk, updated_at in meals.order_by('pk').values_list('pk', 'updated_at').iterator(chunk_size=2000):
+        digest.update(f'{pk}:{updated_at.timestamp()};'.encode())
+    return digest.hexdigest()
+
+
+def format_utc(value):
+    '''Format an aware datetime as an iCalendar UTC timestamp (YYYYMMDDTHHMMSSZ).'''
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def escape_text(value):
+    '''Escape a TEXT property value (RFC 5545 section 3.3.11).'''
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n').replace('\r', '\\n'))
+
+
+def fold_line(line):
+    '''Fold a content line into CRLF-terminated chunks of at most 75 octets.'''
+    encoded = line.encode('utf-8')
+    chunks = []
+    while len(encoded) > 75:
+        cut = 75 if not chunks else 74  # continuation lines start with a space
+        # Don't split a multi-byte UTF-8 character
+        while cut and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        chunks.append(encoded[:cut])
+        encoded = encoded[cut:]
+    chunks.append(encoded)
+    return '\r\n '.join(chunk.decode('utf-8') for chunk in chunks) + '\r\n'
+
+
+def event_lines(meal, dtstamp):
+    '''Yield the content lines of a VEVENT for the meal. Expects the meal's
+    host and location to be loaded already (select_related).'''
+    description = f'Host: {meal.host.display_name}\n{meal.description}'
+    yield 'BEGIN:VEVENT'
+    yield f'UID:meal-{meal.pk}@campus-meal-matching'
+    yield f'DTSTAMP:{format_utc(dtstamp)}'
+    yield f'LAST-MODIFIED:{format_utc(meal.updated_at)}'
+    yield f'DTSTART:{format_utc(meal.start_time)}'
+    yield f'DTEND:{format_utc(meal.start_time + EVENT_DURATION)}'
+    yield f'SUMMARY:{escape_text(meal.title)}'
+    yield f'DESCRIPTION:{escape_text(description)}'
+    yield f'LOCATION:{escape_text(meal.location.name)}'
+    if meal.status == 'canceled':
+        yield 'STATUS:CANCELLED'
+    yield 'END:VEVENT'
+
+
+def calendar_stream(meals, name='Campus Meals'):
+    '''Yield a whole VCALENDAR for the meals, one folded line at a time,
+    so long feeds can be streamed without building them in memory.'''
+    dtstamp = timezone.now()
+    header = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Campus Meal Matching//EN',
+        'CALSCALE:GREGORIAN',
+        f'X-WR-CALNAME:{escape_text(name)}',
+    ]
+    for line in header:
+        yield fold_line(line)
+    for meal in meals:
+        for line in event_lines(meal, dtstamp):
+            yield fold_line(line)
+    yield fold_line('END:VCALENDAR')
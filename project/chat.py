@@ -0,0 +1,111 @@
+# File: project/chat.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Live meal chat support: a pub/sub broker that fans new
+# MealMessages out to connected clients, plus history/permission helpers.
+
+import asyncio
+import threading
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.utils.module_loading import import_string
+from .models import JoinRequest, MealMessage
+
+# Number of messages rendered with the page / returned per history request
+CHAT_PAGE_SIZE = 50
+
+# Max number of undelivered messages buffered per connected client
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def can_chat(meal, user_profile):
+    '''Return True if this profile may read and post in the meal's chat
+    (only the host and accepted guests can).'''
+    if not user_profile:
+        return False
+    if meal.host_id == user_profile.pk:
+        return True
+    return JoinRequest.objects.filter(meal=meal, requester=user_profile, status='accepted').exists()
+
+
+def can_stream_chat(request):
+    '''Return True if live chat can be streamed to this request. Under WSGI
+    a streaming response is read to the end before anything is sent, so an
+    endless event stream would hold a worker forever; only ASGI can serve it.'''
+    return isinstance(request, ASGIRequest)
+
+
+def get_chat_history(meal, before=None, limit=CHAT_PAGE_SIZE):
+    '''Return up to `limit` messages of the meal older than the message id
+    `before` (or the latest ones), oldest first. Ordered by id like the
+    cursor, so pages never skip or repeat a message.'''
+    messages = MealMessage.objects.filter(meal=meal).select_related('sender')
+    if before is not None:
+        messages = messages.filter(pk__lt=before)
+    page = list(messages.order_by('-pk')[:limit])
+    page.reverse()
+    return page
+
+
+def serialize_message(message):
+    '''Return a JSON-friendly dict for a MealMessage.'''
+    return {
+        'id': message.pk,
+        'meal': message.meal_id,
+        'sender': message.sender.display_name,
+        'sender_id': message.sender_id,
+        'message': message.message,
+        'timestamp': message.timestamp.isoformat(),
+    }
+
+
+class InProcessChatBroker:
+    '''Pub/sub broker that keeps subscribers in this process's memory.
+    Publishing is thread-safe, so sync views can publish to subscribers
+    that live on the ASGI event loop. Only works with a single server
+    process; swap in a shared broker through MEAL_CHAT_BROKER otherwise.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # meal id -> {queue: event loop}
+
+    def subscribe(self, meal_id):
+        '''Register a new subscriber for the meal and return its queue.
+        Must be called from the event loop that will read the queue.'''
+        queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(meal_id, {})[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, meal_id, queue):
+        '''Remove a queue previously returned by subscribe().'''
+        with self._lock:
+            subscribers = self._subscribers.get(meal_id, {})
+            subscribers.pop(queue, None)
+            if not subscribers:
+                self._subscribers.pop(meal_id, None)
+
+    def publish(self, meal_id, payload):
+        '''Send the payload to every subscriber of the meal.'''
+        with self._lock:
+            subscribers = list(self._subscribers.get(meal_id, {}).items())
+        for queue, loop in subscribers:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._deliver, queue, payload)
+
+    @staticmethod
+    def _deliver(queue, payload):
+        # Slow clients drop messages instead of growing memory without bound;
+        # they can catch up from the history endpoint.
+        if not queue.full():
+            queue.put_nowait(payload)
+
+
+_broker = None
+
+def get_broker():
+    '''Return the chat broker configured by settings.MEAL_CHAT_BROKER.'''
+    global _broker
+    if _broker is None:
+        path = getattr(settings, 'MEAL_CHAT_BROKER', 'project.chat.InProcessChatBroker')
+        _broker = import_string(path)()
+    return _broker
@@ -0,0 +1,44 @@
+# File: project/lifecycle.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Moves meals whose time has passed out of the open/full states,
+# so the upcoming meal listing only ever has to look at live meals.
+
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from .models import MealPost
+
+# How long a meal is assumed to last (same default as the calendar export)
+MEAL_DURATION = timedelta(hours=1)
+
+# Statuses of meals that are still happening
+ACTIVE_STATUSES = ['open', 'full']
+
+
+def past_meals(now):
+    '''Return the open/full meals that ended before `now`.'''
+    return MealPost.objects.filter(status__in=ACTIVE_STATUSES, start_time__lt=now - MEAL_DURATION)
+
+
+def complete_past_meals(now=None):
+    '''Mark every open/full meal that ended before `now` as completed, in a
+    single UPDATE over the (status, start_time) index. Returns the row count.'''
+    now = now or timezone.now()
+    return past_meals(now).update(status='completed', updated_at=now)
+
+
+def maybe_complete_past_meals():
+    '''Run complete_past_meals() at most once per MEAL_SWEEP_INTERVAL seconds
+    across all requests sharing the cache. Lets the site keep itself tidy
+    without a cron job; the management command does the same on a schedule.
+    Called on GETs, so it only writes (and takes SQLite's write lock) when
+    an index-only read finds meals to complete.'''
+    interval = getattr(settings, 'MEAL_SWEEP_INTERVAL', 300)
+    # cache.add only succeeds for the first caller until the key expires
+    if not interval or not cache.add('project:meal_sweep', True, interval):
+        return 0
+    now = timezone.now()
+    if not past_meals(now).exists():
+        return 0
+    return complete_past_meals(now)
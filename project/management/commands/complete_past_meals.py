@@ -0,0 +1,14 @@
+# File: project/management/commands/complete_past_meals.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Management command that marks meals whose time has passed as completed.
+
+from django.core.management.base import BaseCommand
+from project.lifecycle import complete_past_meals
+
+
+class Command(BaseCommand):
+    help = 'Mark open and full meals whose start time has passed as completed. Safe to run from cron.'
+
+    def handle(self, *args, **options):
+        completed = complete_past_meals()
+        self.stdout.write(self.style.SUCCESS(f'Marked {completed} meal(s) as completed.'))
@@ -0,0 +1,25 @@
+# File: project/management/commands/promote_waitlists.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Management command that fills free meal seats from the waitlists.
+
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from project.models import MealPost
+from project.seating import promote_waitlist
+
+
+class Command(BaseCommand):
+    help = 'Accept the oldest waitlisted join requests of every meal that has free seats.'
+
+    def handle(self, *args, **options):
+        # Only meals that have both free seats and someone waiting
+        meal_ids = (MealPost.objects
+                    .filter(status__in=['open', 'full'], accepted_count__lt=F('max_guests'),
+                            joinrequest__status='waitlisted')
+                    .values_list('pk', flat=True).distinct())
+
+        promoted = 0
+        for meal_id in meal_ids.iterator():
+            promoted += promote_waitlist(meal_id)
+
+        self.stdout.write(self.style.SUCCESS(f'Promoted {promoted} waitlisted request(s).'))
@@ -0,0 +1,14 @@
+# File: project/management/commands/rebuild_occupancy.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Management command that recomputes dining location occupancy from the meals.
+
+from django.core.management.base import BaseCommand
+from project.occupancy import rebuild_occupancy
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-slot dining location occupancy counts from scratch.'
+
+    def handle(self, *args, **options):
+        slots = rebuild_occupancy()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt occupancy for {slots} slot(s).'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0007_remove_dininglocation_campus_area_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mealmessage',
+            index=models.Index(fields=['meal', 'id'], name='mealmessage_meal_id_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:35
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def count_accepted_guests(apps, schema_editor):
+    '''Backfill accepted_count from the existing accepted join requests.'''
+    MealPost = apps.get_model('project', 'MealPost')
+    meals = MealPost.objects.annotate(accepted=Count('joinrequest', filter=Q(joinrequest__status='accepted')))
+    for meal in meals:
+        if meal.accepted:
+            MealPost.objects.filter(pk=meal.pk).update(accepted_count=meal.accepted)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0008_mealmessage_meal_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mealpost',
+            name='accepted_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_accepted_guests, migrations.RunPython.noop),
+    ]
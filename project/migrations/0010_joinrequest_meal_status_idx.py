@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0009_mealpost_accepted_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='joinrequest',
+            index=models.Index(fields=['meal', 'status', 'created_at'], name='joinrequest_meal_status_idx'),
+        ),
+    ]
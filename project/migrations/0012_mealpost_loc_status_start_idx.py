@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0011_mealpost_status_start_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mealpost',
+            index=models.Index(fields=['location', 'status', 'start_time'], name='mealpost_loc_status_start_idx'),
+        ),
+    ]
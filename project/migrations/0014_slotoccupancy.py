@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncHour
+
+
+def count_slot_occupancy(apps, schema_editor):
+    '''Fill the occupancy table from the existing meals.'''
+    MealPost = apps.get_model('project', 'MealPost')
+    SlotOccupancy = apps.get_model('project', 'SlotOccupancy')
+    rows = (MealPost.objects.exclude(status='canceled')
+            .annotate(slot=TruncHour('start_time'))
+            .values('location_id', 'slot')
+            .annotate(guests=Sum('accepted_count') + Count('pk'))
+            .order_by())
+    SlotOccupancy.objects.bulk_create([
+        SlotOccupancy(location_id=row['location_id'], slot_start=row['slot'], guests=row['guests'])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0013_mealpost_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlotOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot_start', models.DateTimeField()),
+                ('guests', models.IntegerField(default=0)),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='project.dininglocation')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['slot_start', 'location'], name='slotoccupancy_slot_loc_idx')],
+                'unique_together': {('location', 'slot_start')},
+            },
+        ),
+        migrations.RunPython(count_slot_occupancy, migrations.RunPython.noop),
+    ]
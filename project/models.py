@@ -93,6 +93,8 @@ class MealPost(models.Model):
     start_time = models.DateTimeField()
     description = models.TextField(blank=True)
     max_guests = models.IntegerField(default=1)
+    # Denormalized number of accepted join requests, maintained by project/seating.py
+    accepted_count = models.IntegerField(default=0, editable=False)
     
     STATUS_CHOICES = [
         ('open', 'Open'),
@@ -102,6 +104,16 @@ class MealPost(models.Model):
     ]
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open')
     created_at = models.DateTimeField(auto_now_add=True)
+    # Also bumped by the bulk .update() calls in seating.py and lifecycle.py
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Serves the upcoming meal listing and the past meal sweeper
+            models.Index(fields=['status', 'start_time'], name='mealpost_status_start_idx'),
+            # Serves meal searches filtered by location
+            models.Index(fields=['location', 'status', 'start_time'], name='mealpost_loc_status_start_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} at {self.location.name}"
@@ -111,7 +123,11 @@ class MealPost(models.Model):
 
     def get_accepted_guests(self):
         '''Return the number of accepted guests for this meal.'''
-        return self.joinrequest_set.filter(status='accepted').count()
+        return self.accepted_count
+
+    def get_seats_left(self):
+        '''Return the number of guest seats still available.'''
+        return max(self.max_guests - self.accepted_count, 0)
 
 class JoinRequest(models.Model):
     '''Represents a request from a user to join a meal.'''
@@ -128,6 +144,12 @@ class JoinRequest(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Serves the waitlist promotion query (meal=X, status='waitlisted', oldest first)
+            models.Index(fields=['meal', 'status', 'created_at'], name='joinrequest_meal_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.requester.display_name} -> {self.meal.title}"
 
@@ -155,6 +177,28 @@ class Review(models.Model):
     def __str__(self):
         return f'{self.reviewer.display_name} -> {self.reviewed_user.display_name} ({self.rating}*)'
 
+class SlotOccupancy(models.Model):
+    '''Running headcount (hosts plus accepted guests) of the meals at a
+    dining location within one hourly time slot. Maintained incrementally
+    by project/occupancy.py.'''
+    location = models.ForeignKey(DiningLocation, on_delete=models.CASCADE, related_name='occupancy')
+    slot_start = models.DateTimeField()
+    guests = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('location', 'slot_start')
+        indexes = [
+            # Serves the heatmap and crowded slot lookups over a time range
+            models.Index(fields=['slot_start', 'location'], name='slotoccupancy_slot_loc_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.location.name} @ {self.slot_start}: {self.guests}"
+
+    def get_load(self):
+        '''Return the fraction of the location's capacity in use during this slot.'''
+        return self.guests / self.location.capacity if self.location.capacity else 0
+
 class MealMessage(models.Model):
     '''Represents a chat message within a meal group.'''
     meal = models.ForeignKey(MealPost, on_delete=models.CASCADE, related_name='messages')
@@ -164,6 +208,10 @@ class MealMessage(models.Model):
 
     class Meta:
         ordering = ['timestamp']
+        indexes = [
+            # Serves the chat history/polling cursors (meal=X, id >/< cursor)
+            models.Index(fields=['meal', 'id'], name='mealmessage_meal_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.sender.display_name}: {self.message[:20]}"
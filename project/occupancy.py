@@ -0,0 +1,96 @@
+# File: project/occupancy.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Per-location, per-hour occupancy counts for dining locations.
+# Counts are adjusted incrementally as meals and seats change, so forecasts
+# and warnings read a small table instead of aggregating meals every time.
+
+from datetime import timedelta
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+from .models import MealPost, SlotOccupancy
+
+# Share of a location's capacity at which a slot counts as crowded
+CROWDED_LOAD = 0.8
+
+
+def slot_for(start_time):
+    '''Return the start of the hourly slot a meal starting at start_time falls
+    in (in the current time zone, like TruncHour).'''
+    return timezone.localtime(start_time).replace(minute=0, second=0, microsecond=0)
+
+
+def headcount(status, accepted_count):
+    '''Return how many people a meal brings to its location: the host plus
+    the accepted guests, or nobody if it was canceled.'''
+    return 0 if status == 'canceled' else accepted_count + 1
+
+
+def adjust(location_id, start_time, delta):
+    '''Add delta people to the slot of the given location and start time.'''
+    if not delta:
+        return
+    slot = slot_for(start_time)
+    slots = SlotOccupancy.objects.filter(location_id=location_id, slot_start=slot)
+    if slots.update(guests=F('guests') + delta):
+        return
+    try:
+        with transaction.atomic():
+            SlotOccupancy.objects.create(location_id=location_id, slot_start=slot, guests=delta)
+    except IntegrityError:
+        # Someone else created the slot in the meantime
+        slots.update(guests=F('guests') + delta)
+
+
+def adjust_meal(meal_id, delta):
+    '''Add delta people to the slot of the given meal (e.g. after seats change).'''
+    meal = MealPost.objects.filter(pk=meal_id).values('location_id', 'start_time', 'status').first()
+    if meal and meal['status'] != 'canceled':
+        adjust(meal['location_id'], meal['start_time'], delta)
+
+
+def rebuild_occupancy():
+    '''Recompute every slot from the meals with one GROUP BY, replacing the
+    incremental counts. Returns the number of slots written.'''
+    rows = (MealPost.objects.exclude(status='canceled')
+            .annotate(slot=TruncHour('start_time'))
+            .values('location_id', 'slot')
+            .annotate(guests=Sum('accepted_count') + Count('pk'))
+            .order_by())
+    with transaction.atomic():
+        SlotOccupancy.objects.all().delete()
+        SlotOccupancy.objects.bulk_create([
+            SlotOccupancy(location_id=row['location_id'], slot_start=row['slot'], guests=row['guests'])
+            for row in rows
+        ])
+    return len(rows)
+
+
+def get_heatmap(start, days=7, location_id=None):
+    '''Return the non-empty slots in [start, start + days) as a list of
+    dicts with location, slot, guests, capacity and load, oldest first.'''
+    slots = (SlotOccupancy.objects
+             .filter(slot_start__gte=slot_for(start), slot_start__lt=start + timedelta(days=days), guests__gt=0)
+             .select_related('location')
+             .order_by('slot_start', 'location_id'))
+    if location_id:
+        slots = slots.filter(location_id=location_id)
+    return [{
+        'location': slot.location_id,
+        'location_name': slot.location.name,
+        'slot_start': slot.slot_start.isoformat(),
+        'guests': slot.guests,
+        'capacity': slot.location.capacity,
+        'load': round(slot.get_load(), 2),
+    } for slot in slots]
+
+
+def get_crowded_slots(days=7):
+    '''Return the upcoming SlotOccupancy rows at or above CROWDED_LOAD of capacity.'''
+    now = timezone.now()
+    return (SlotOccupancy.objects
+            .filter(slot_start__gte=slot_for(now), slot_start__lt=now + timedelta(days=days),
+                    guests__gte=F('location__capacity') * CROWDED_LOAD)
+            .select_related('location')
+            .order_by('slot_start'))
@@ -0,0 +1,156 @@
+# File: project/recommendations.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Compatibility scoring shared by people matching, and ranking of
+# open upcoming meals for a viewer based on host, seats, time, and location.
+
+from types import SimpleNamespace
+from django.core.cache import cache
+from django.utils import timezone
+from .models import MealPost, JoinRequest
+
+# Max raw compatibility score from compare_profiles()
+MAX_COMPATIBILITY = 13
+
+# Hour windows [start, end) for each usual meal time choice
+MEAL_TIME_WINDOWS = {
+    'Breakfast': (7, 10),
+    'Lunch': (11, 14),
+    'Dinner': (17, 20),
+    'Late Night': (21, 24),
+}
+
+# How much each factor counts towards a meal's recommendation score
+MEAL_SCORE_WEIGHTS = {
+    'host': 0.5,
+    'time': 0.2,
+    'location': 0.15,
+    'seats': 0.15,
+}
+
+# Seconds the snapshot of open meals is reused between recommendation requests
+OPEN_MEAL_SNAPSHOT_TTL = 60
+OPEN_MEAL_SNAPSHOT_KEY = 'project:open_meal_snapshot'
+
+# Host preference fields copied into the snapshot
+HOST_FIELDS = ['display_name', 'preferred_location_id', 'usual_meal_time', 'dietary_preference',
+               'vibe', 'social_battery', 'interest', 'spice_tolerance']
+
+
+def compare_profiles(viewer, other):
+    '''Return (raw score out of MAX_COMPATIBILITY, list of reasons) for how well
+    `other` matches the viewer's preferences. `other` can be a UserProfile or
+    anything with the same preference attributes.'''
+    score = 0
+    reasons = []
+
+    # Same preferred location (3 points)
+    if viewer.preferred_location_id and viewer.preferred_location_id == other.preferred_location_id:
+        score += 3
+        reasons.append(f"Same preferred location: {viewer.preferred_location.name}")
+
+    # Same meal time (2 points)
+    if viewer.usual_meal_time == other.usual_meal_time:
+        score += 2
+        reasons.append(f"Same meal time: {viewer.usual_meal_time}")
+
+    # Compatible dietary preferences (2 points)
+    if viewer.dietary_preference == other.dietary_preference:
+        score += 2
+        if viewer.dietary_preference != 'None':
+            reasons.append(f"Same dietary preference: {viewer.dietary_preference}")
+
+    # Same vibe (1 point)
+    if viewer.vibe == other.vibe:
+        score += 1
+        reasons.append(f"Same vibe: {viewer.vibe}")
+
+    # Same social battery (2 points)
+    if viewer.social_battery == other.social_battery:
+        score += 2
+        reasons.append(f"Same social battery: {viewer.social_battery}")
+
+    # Same interest (2 points)
+    if viewer.interest == other.interest:
+        score += 2
+        reasons.append(f"Same interest: {viewer.interest}")
+
+    # Same spice tolerance (1 point)
+    if viewer.spice_tolerance == other.spice_tolerance:
+        score += 1
+        if viewer.spice_tolerance != 'None':
+            reasons.append(f"Same spice tolerance: {viewer.spice_tolerance}")
+
+    return score, reasons
+
+
+def get_open_meal_snapshot():
+    '''Return a cached list of upcoming open meals, each a
+    SimpleNamespace with the meal fields plus a `host` namespace of the host's
+    preferences. Built with one query and reused for OPEN_MEAL_SNAPSHOT_TTL.'''
+    snapshot = cache.get(OPEN_MEAL_SNAPSHOT_KEY)
+    if snapshot is None:
+        rows = (MealPost.objects
+                .filter(status='open', start_time__gte=timezone.now())
+                .order_by('start_time')
+                .values('pk', 'title', 'start_time', 'max_guests', 'accepted_count',
+                        'location_id', 'location__name', 'host_id',
+                        *[f'host__{field}' for field in HOST_FIELDS]))
+        snapshot = []
+        for row in rows:
+            host = SimpleNamespace(pk=row['host_id'], **{field: row[f'host__{field}'] for field in HOST_FIELDS})
+            snapshot.append(SimpleNamespace(
+                pk=row['pk'], title=row['title'], start_time=row['start_time'],
+                location_id=row['location_id'], location_name=row['location__name'],
+                seats_left=max(row['max_guests'] - row['accepted_count'], 0), host=host,
+            ))
+        cache.set(OPEN_MEAL_SNAPSHOT_KEY, snapshot, OPEN_MEAL_SNAPSHOT_TTL)
+    return snapshot
+
+
+def time_fit(start_time, usual_meal_time):
+    '''Return 1.0 if the meal starts within the usual meal time window,
+    falling off linearly to 0 at 6 hours outside it.'''
+    window = MEAL_TIME_WINDOWS.get(usual_meal_time)
+    if window is None:
+        return 0.0
+    local = timezone.localtime(start_time)
+    hour = local.hour + local.minute / 60
+    start, end = window
+    distance = max(start - hour, hour - end, 0)
+    return max(0.0, 1 - distance / 6)
+
+
+def recommend_meals(viewer, limit=20):
+    '''Rank the open upcoming meals for the viewer in one pass over the cached
+    snapshot. Skips meals that are full, hosted by the viewer, or already
+    requested. Returns dicts with the meal, a score out of 10, and reasons.'''
+    now = timezone.now()
+    requested = set(JoinRequest.objects.filter(requester=viewer).values_list('meal_id', flat=True))
+
+    recommendations = []
+    for meal in get_open_meal_snapshot():
+        if meal.seats_left == 0 or meal.host.pk == viewer.pk or meal.pk in requested or meal.start_time < now:
+            continue
+
+        host_score, reasons = compare_profiles(viewer, meal.host)
+        time_score = time_fit(meal.start_time, viewer.usual_meal_time)
+        location_score = 1.0 if meal.location_id == viewer.preferred_location_id else 0.0
+        seats_score = min(meal.seats_left, 3) / 3
+
+        score = (MEAL_SCORE_WEIGHTS['host'] * host_score / MAX_COMPATIBILITY
+                 + MEAL_SCORE_WEIGHTS['time'] * time_score
+                 + MEAL_SCORE_WEIGHTS['location'] * location_score
+                 + MEAL_SCORE_WEIGHTS['seats'] * seats_score)
+        if location_score:
+            reasons.append(f"At your preferred location: {meal.location_name}")
+        if time_score == 1.0:
+            reasons.append(f"Fits your usual meal time ({viewer.usual_meal_time})")
+
+        recommendations.append({
+            'meal': meal,
+            'score': round(score * 10, 1),
+            'reasons': reasons,
+        })
+
+    recommendations.sort(key=lambda x: x['score'], reverse=True)
+    return recommendations[:limit]
@@ -0,0 +1,63 @@
+# File: project/search.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Meal search service shared by the meal list and search views.
+# Turns request parameters into one index-friendly MealPost queryset.
+
+from datetime import datetime, time, timedelta
+from django.db.models import Q
+from django.utils import timezone
+from .models import MealPost
+
+
+def parse_date(value):
+    '''Parse a YYYY-MM-DD string, returning None if it is missing or invalid.'''
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def start_of_day(day):
+    '''Return the aware datetime at which the given date starts.'''
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def parse_meal_filters(params):
+    '''Pull the supported meal filters out of a QueryDict (request.GET).
+    Invalid values are dropped instead of raising.'''
+    location = params.get('location', '')
+    return {
+        'location': int(location) if location.isdigit() else None,
+        'status': params.get('status') if params.get('status') in dict(MealPost.STATUS_CHOICES) else None,
+        'date_from': parse_date(params.get('date_from')),
+        'date_to': parse_date(params.get('date_to')),
+        'q': params.get('q', '').strip(),
+    }
+
+
+def search_meals(filters, upcoming_by_default=False):
+    '''Return the meals matching the filters from parse_meal_filters(),
+    soonest first. Dates become half-open start_time ranges rather than
+    date casts, so the (location, status, start_time) index stays usable.
+    With upcoming_by_default and no status filter, only upcoming open
+    meals are returned.'''
+    meals = MealPost.objects.select_related('location', 'host').order_by('start_time', 'pk')
+
+    if filters['location']:
+        meals = meals.filter(location_id=filters['location'])
+
+    if filters['status']:
+        meals = meals.filter(status=filters['status'])
+    elif upcoming_by_default:
+        meals = meals.filter(status='open', start_time__gte=timezone.now())
+
+    # [date_from 00:00, date_to + 1 day 00:00)
+    if filters['date_from']:
+        meals = meals.filter(start_time__gte=start_of_day(filters['date_from']))
+    if filters['date_to']:
+        meals = meals.filter(start_time__lt=start_of_day(filters['date_to'] + timedelta(days=1)))
+
+    if filters['q']:
+        meals = meals.filter(Q(title__icontains=filters['q']) | Q(description__icontains=filters['q']))
+
+    return meals
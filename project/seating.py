@@ -0,0 +1,110 @@
+# File: project/seating.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Seat accounting for meals. Every join request status change
+# goes through here so MealPost.accepted_count never exceeds max_guests,
+# even when hosts accept requests concurrently.
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import MealPost, JoinRequest
+from . import occupancy
+
+
+def sync_meal_status(meal_id):
+    '''Flip an open meal to full once its seats are taken, and a full meal
+    back to open when seats free up. Completed/canceled meals are left alone.'''
+    MealPost.objects.filter(
+        pk=meal_id, status='open', accepted_count__gte=F('max_guests'),
+    ).update(status='full', updated_at=timezone.now())
+    MealPost.objects.filter(
+        pk=meal_id, status='full', accepted_count__lt=F('max_guests'),
+    ).update(status='open', updated_at=timezone.now())
+
+
+def update_join_requests(meal_id, request_ids, status):
+    '''Set the status of the given join requests of one meal, in one transaction.
+    Accepting only fills the seats that are left, oldest requests first; the rest
+    keep their status. Seats freed by declining or waitlisting go to the
+    waitlist. Returns the number of requests whose status changed.'''
+    request_ids = list(request_ids)
+    with transaction.atomic():
+        requests = (JoinRequest.objects.select_for_update()
+                    .filter(meal_id=meal_id, pk__in=request_ids)
+                    .exclude(status=status)
+                    .order_by('created_at', 'pk'))
+        changes = list(requests.values_list('pk', 'status'))
+
+        if status == 'accepted':
+            meal = MealPost.objects.select_for_update().get(pk=meal_id)
+            seats_left = max(meal.max_guests - meal.accepted_count, 0)
+            changes = changes[:seats_left]
+            seat_delta = len(changes)
+        else:
+            seat_delta = -sum(1 for _, old_status in changes if old_status == 'accepted')
+
+        if not changes:
+            return 0
+
+        # Only update rows still in the status we read, so a concurrent
+        # change can't be counted twice
+        changed = 0
+        for old_status in {old_status for _, old_status in changes}:
+            changed += JoinRequest.objects.filter(
+                pk__in=[pk for pk, s in changes if s == old_status], status=old_status,
+            ).update(status=status)
+        if changed != len(changes):
+            transaction.set_rollback(True)
+            return 0
+
+        if seat_delta:
+            seats = MealPost.objects.filter(pk=meal_id)
+            if seat_delta > 0:
+                # Refuse to go past max_guests even if another accept got in first
+                seats = seats.filter(accepted_count__lte=F('max_guests') - seat_delta)
+            if not seats.update(accepted_count=F('accepted_count') + seat_delta, updated_at=timezone.now()):
+                transaction.set_rollback(True)
+                return 0
+            sync_meal_status(meal_id)
+            occupancy.adjust_meal(meal_id, seat_delta)
+            if seat_delta < 0:
+                # Not to the requests that were just moved off their seats
+                promote_waitlist(meal_id, exclude=[pk for pk, _ in changes])
+
+    return changed
+
+
+def promote_waitlist(meal_id, exclude=()):
+    '''Fill a meal's free seats with its oldest waitlisted requests, except
+    the request ids in exclude. Returns the number of requests accepted.'''
+    with transaction.atomic():
+        meal = (MealPost.objects.select_for_update()
+                .filter(pk=meal_id, status__in=['open', 'full']).first())
+        if meal is None or meal.get_seats_left() == 0:
+            sync_meal_status(meal_id)
+            return 0
+        waitlisted = (JoinRequest.objects
+                      .filter(meal_id=meal_id, status='waitlisted')
+                      .exclude(pk__in=exclude)
+                      .order_by('created_at', 'pk')
+                      .values_list('pk', flat=True)[:meal.get_seats_left()])
+        promoted = update_join_requests(meal_id, list(waitlisted), 'accepted')
+        sync_meal_status(meal_id)
+    return promoted
+
+
+def cancel_join_request(join_request):
+    '''Delete a join request, giving its seat back (to the waitlist, if
+    anyone is on it) if it was accepted.'''
+    with transaction.atomic():
+        status = (JoinRequest.objects.select_for_update()
+                  .filter(pk=join_request.pk).values_list('status', flat=True).first())
+        if status is None:
+            return
+        JoinRequest.objects.filter(pk=join_request.pk).delete()
+        if status == 'accepted':
+            MealPost.objects.filter(pk=join_request.meal_id, accepted_count__gt=0).update(
+                accepted_count=F('accepted_count') - 1, updated_at=timezone.now(),
+            )
+            occupancy.adjust_meal(join_request.meal_id, -1)
+            promote_waitlist(join_request.meal_id)
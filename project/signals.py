@@ -0,0 +1,51 @@
+# File: project/signals.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Signal receivers for the meal matching application.
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from cs412.middleware import invalidate_cached_profile
+from .chat import get_broker, serialize_message
+from .models import UserProfile, MealPost, MealMessage
+from . import occupancy
+
+# Keep the per-user profile cache used by CurrentProfileMiddleware fresh
+post_save.connect(invalidate_cached_profile, sender=UserProfile)
+post_delete.connect(invalidate_cached_profile, sender=UserProfile)
+
+
+def publish_meal_message(sender, instance, created, **kwargs):
+    '''Push newly created chat messages to live chat subscribers.'''
+    if created:
+        payload = serialize_message(instance)
+        transaction.on_commit(lambda: get_broker().publish(instance.meal_id, payload))
+
+post_save.connect(publish_meal_message, sender=MealMessage)
+
+
+def remember_meal_slot(sender, instance, **kwargs):
+    '''Before a meal is saved, note which slot it occupied and with how many people.'''
+    instance._occupancy_before = None
+    if instance.pk:
+        instance._occupancy_before = (MealPost.objects.filter(pk=instance.pk)
+                                      .values('location_id', 'start_time', 'status', 'accepted_count').first())
+
+def update_meal_slot(sender, instance, **kwargs):
+    '''After a meal is saved, move its people to its (possibly new) slot.'''
+    before = getattr(instance, '_occupancy_before', None)
+    accepted_count = before['accepted_count'] if before else instance.accepted_count
+    if before:
+        occupancy.adjust(before['location_id'], before['start_time'],
+                         -occupancy.headcount(before['status'], accepted_count))
+    occupancy.adjust(instance.location_id, instance.start_time,
+                     occupancy.headcount(instance.status, accepted_count))
+
+def release_meal_slot(sender, instance, **kwargs):
+    '''When a meal is deleted, take its people out of its slot.'''
+    occupancy.adjust(instance.location_id, instance.start_time,
+                     -occupancy.headcount(instance.status, instance.accepted_count))
+
+# Keep the per-slot occupancy counts in step with meals
+pre_save.connect(remember_meal_slot, sender=MealPost)
+post_save.connect(update_meal_slot, sender=MealPost)
+post_delete.connect(release_meal_slot, sender=MealPost)
@@ -1,3 +1,306 @@
-from django.test import TestCase
+# File: project/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for seat accounting (project/seating.py), the past
+# meal sweep, the meal chat history endpoint and the iCalendar feeds.
 
-# Create your tests here.
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from .calendar import escape_text, fold_line, make_calendar_token
+from .chat import CHAT_PAGE_SIZE
+from .models import DiningLocation, UserProfile, MealPost, JoinRequest, MealMessage
+from .seating import update_join_requests, promote_waitlist, cancel_join_request
+
+
+class MealTestCase(TestCase):
+    '''Creates a location and an upcoming meal with two guest seats.'''
+
+    def setUp(self):
+        self.location = DiningLocation.objects.create(name='Warren Dining', address='700 Commonwealth Ave')
+        self.host = self.make_profile('host')
+        self.meal = MealPost.objects.create(
+            host=self.host, title='Lunch', location=self.location,
+            start_time=timezone.now() + timedelta(days=1), max_guests=2,
+        )
+
+    def make_profile(self, username):
+        user = User.objects.create_user(username=username, password='password')
+        return UserProfile.objects.create(user=user, display_name=username)
+
+
+class SeatingTests(MealTestCase):
+    '''accepted_count must always equal the number of accepted requests
+    and never exceed max_guests, whatever happens to the requests.'''
+
+    def make_request(self, username, status='pending'):
+        return JoinRequest.objects.create(meal=self.meal, requester=self.make_profile(username), status=status)
+
+    def assertSeatsConsistent(self):
+        self.meal.refresh_from_db()
+        accepted = JoinRequest.objects.filter(meal=self.meal, status='accepted').count()
+        self.assertEqual(self.meal.accepted_count, accepted)
+        self.assertLessEqual(self.meal.accepted_count, self.meal.max_guests)
+
+    def test_accept_decline_and_cancel(self):
+        first, second = self.make_request('first'), self.make_request('second')
+
+        self.assertEqual(update_join_requests(self.meal.pk, [first.pk, second.pk], 'accepted'), 2)
+        self.assertSeatsConsistent()
+        self.assertEqual(self.meal.accepted_count, 2)
+        self.assertEqual(self.meal.status, 'full')
+
+        self.assertEqual(update_join_requests(self.meal.pk, [first.pk], 'declined'), 1)
+        self.assertSeatsConsistent()
+        self.assertEqual(self.meal.accepted_count, 1)
+        self.assertEqual(self.meal.status, 'open')
+
+        cancel_join_request(second)
+        self.assertSeatsConsistent()
+        self.assertEqual(self.meal.accepted_count, 0)
+        self.assertFalse(JoinRequest.objects.filter(pk=second.pk).exists())
+
+    def test_accepting_twice_counts_once(self):
+        join_request = self.make_request('guest')
+        update_join_requests(self.meal.pk, [join_request.pk], 'accepted')
+        self.assertEqual(update_join_requests(self.meal.pk, [join_request.pk], 'accepted'), 0)
+        self.assertSeatsConsistent()
+        self.assertEqual(self.meal.accepted_count, 1)
+
+    def test_accepting_into_full_meal_is_rejected(self):
+        self.make_request('first', 'accepted')
+        self.make_request('second', 'accepted')
+        MealPost.objects.filter(pk=self.meal.pk).update(accepted_count=2, status='full')
+        late = self.make_request('late')
+
+        self.assertEqual(update_join_requests(self.meal.pk, [late.pk], 'accepted'), 0)
+        late.refresh_from_db()
+        self.assertEqual(late.status, 'pending')
+        self.assertSeatsConsistent()
+
+    def test_accepting_more_than_seats_left_fills_oldest_first(self):
+        requests = [self.make_request(f'guest{i}') for i in range(3)]
+        self.assertEqual(update_join_requests(self.meal.pk, [r.pk for r in requests], 'accepted'), 2)
+        self.assertSeatsConsistent()
+        requests[2].refresh_from_db()
+        self.assertEqual(requests[2].status, 'pending')
+
+    def test_cancel_promotes_waitlist(self):
+        first, second = self.make_request('first'), self.make_request('second')
+        update_join_requests(self.meal.pk, [first.pk, second.pk], 'accepted')
+        waiting = [self.make_request(f'waiting{i}', 'waitlisted') for i in range(2)]
+
+        cancel_join_request(first)
+        self.assertSeatsConsistent()
+        self.assertEqual(self.meal.accepted_count, 2)
+        self.assertEqual(self.meal.status, 'full')
+        statuses = [JoinRequest.objects.get(pk=r.pk).status for r in waiting]
+        self.assertEqual(statuses, ['accepted', 'waitlisted'])
+
+    def test_promote_waitlist_fills_free_seats_only(self):
+        waiting = [self.make_request(f'waiting{i}', 'waitlisted') for i in range(3)]
+        self.assertEqual(promote_waitlist(self.meal.pk), 2)
+        self.assertSeatsConsistent()
+        self.assertEqual(self.meal.status, 'full')
+        self.assertEqual(promote_waitlist(self.meal.pk), 0)
+        waiting[2].refresh_from_db()
+        self.assertEqual(waiting[2].status, 'waitlisted')
+
+    def test_promote_waitlist_skips_canceled_meal(self):
+        self.make_request('waiting', 'waitlisted')
+        MealPost.objects.filter(pk=self.meal.pk).update(status='canceled')
+        self.assertEqual(promote_waitlist(self.meal.pk), 0)
+        self.assertSeatsConsistent()
+
+    def test_decline_promotes_waitlist(self):
+        first, second = self.make_request('first'), self.make_request('second')
+        update_join_requests(self.meal.pk, [first.pk, second.pk], 'accepted')
+        waiting = self.make_request('waiting', 'waitlisted')
+
+        self.client.force_login(self.host.user)
+        self.client.post(reverse('decline_join_request', kwargs={'pk': first.pk}))
+        self.assertSeatsConsistent()
+        waiting.refresh_from_db()
+        self.assertEqual(waiting.status, 'accepted')
+        self.assertEqual(self.meal.status, 'full')
+
+    def test_waitlisting_a_guest_promotes_someone_else(self):
+        guest = self.make_request('guest', 'waitlisted')
+        other = self.make_request('other')
+        promote_waitlist(self.meal.pk)
+        update_join_requests(self.meal.pk, [other.pk], 'accepted')
+        later = self.make_request('later', 'waitlisted')
+
+        self.assertEqual(update_join_requests(self.meal.pk, [guest.pk], 'waitlisted'), 1)
+        self.assertSeatsConsistent()
+        guest.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual(guest.status, 'waitlisted')
+        self.assertEqual(later.status, 'accepted')
+
+
+class MealSweepTests(MealTestCase):
+    '''The meal list completes past meals at most once per interval, and
+    doesn't write at all when there's nothing to complete.'''
+
+    def setUp(self):
+        super().setUp()
+        cache.delete('project:meal_sweep')
+
+    def make_past_meal(self):
+        return MealPost.objects.create(host=self.host, title='Breakfast', location=self.location,
+                                       start_time=timezone.now() - timedelta(hours=3))
+
+    def test_list_without_past_meals_does_not_write(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(reverse('meal_list')).status_code, 200)
+        writes = [query['sql'] for query in queries if not query['sql'].startswith('SELECT')]
+        self.assertEqual(writes, [])
+
+    def test_list_completes_past_meals_once_per_interval(self):
+        past = self.make_past_meal()
+        self.client.get(reverse('meal_list'))
+        past.refresh_from_db()
+        self.assertEqual(past.status, 'completed')
+
+        later = self.make_past_meal()
+        self.client.get(reverse('meal_list'))
+        later.refresh_from_db()
+        self.assertEqual(later.status, 'open')
+
+
+class ChatHistoryTests(MealTestCase):
+    '''History pages and polls walk the chat by message id, so every message
+    is returned exactly once, whatever its timestamp.'''
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.host.user)
+        self.url = reverse('meal_chat_history', kwargs={'pk': self.meal.pk})
+        now = timezone.now()
+        self.messages = [MealMessage.objects.create(meal=self.meal, sender=self.host, message=f'Message {i}')
+                         for i in range(CHAT_PAGE_SIZE + 10)]
+        # Timestamps out of id order, e.g. from clock skew between servers
+        for i, message in enumerate(self.messages):
+            MealMessage.objects.filter(pk=message.pk).update(timestamp=now - timedelta(seconds=i % 7))
+
+    def ids(self, response):
+        return [message['id'] for message in response.json()['messages']]
+
+    def test_pages_backwards_without_gaps(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        latest = self.ids(first)
+        self.assertEqual(latest, [m.pk for m in self.messages[-CHAT_PAGE_SIZE:]])
+
+        older = self.client.get(self.url, {'before': first.json()['before']})
+        self.assertEqual(self.ids(older), [m.pk for m in self.messages[:-CHAT_PAGE_SIZE]])
+        self.assertIsNone(older.json()['before'])
+
+    def test_since_returns_only_newer_messages(self):
+        since = self.messages[-5].pk
+        response = self.client.get(self.url, {'since': since})
+        self.assertEqual(self.ids(response), [m.pk for m in self.messages[-4:]])
+        self.assertEqual(response.json()['since'], self.messages[-1].pk)
+
+        idle = self.client.get(self.url, {'since': self.messages[-1].pk})
+        self.assertEqual(self.ids(idle), [])
+        self.assertEqual(idle.json()['since'], self.messages[-1].pk)
+
+    def test_unchanged_poll_is_not_modified(self):
+        response = self.client.get(self.url, {'since': self.messages[-1].pk})
+        again = self.client.get(self.url, {'since': self.messages[-1].pk}, headers={'if-none-match': response['ETag']})
+        self.assertEqual(again.status_code, 304)
+
+        MealMessage.objects.create(meal=self.meal, sender=self.host, message='New')
+        changed = self.client.get(self.url, {'since': self.messages[-1].pk}, headers={'if-none-match': response['ETag']})
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(len(self.ids(changed)), 1)
+
+    def test_only_participants_can_read(self):
+        self.client.force_login(self.make_profile('outsider').user)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class CalendarFeedTests(MealTestCase):
+    '''The feed's ETag changes whenever the set of meals in it changes.'''
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('calendar_feed', kwargs={'token': make_calendar_token(self.host), 'kind': 'hosted'})
+
+    def get(self, **headers):
+        response = self.client.get(self.url, headers=headers)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        return response, content.decode()
+
+    def test_feed_lists_hosted_meals(self):
+        response, content = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(content.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertIn(f'UID:meal-{self.meal.pk}@', content)
+        self.assertFalse(response.has_header('Last-Modified'))
+
+    def test_unchanged_feed_is_not_modified(self):
+        response, _ = self.get()
+        again, content = self.get(if_none_match=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(content, '')
+
+    def test_etag_changes_when_meals_are_swapped(self):
+        other_host = self.make_profile('other')
+        meals = [self.meal] + [MealPost.objects.create(host=other_host, title=f'Meal {i}', location=self.location,
+                                                       start_time=self.meal.start_time) for i in range(3)]
+        first, second, third, fourth = meals
+        MealPost.objects.filter(pk__in=[m.pk for m in meals]).update(updated_at=timezone.now())
+        MealPost.objects.filter(pk=fourth.pk).update(host=self.host)
+        response, _ = self.get()
+
+        # The middle two meals replace the outer two: same count, id sum and
+        # newest update time, and none of the meals was edited
+        MealPost.objects.filter(pk__in=[first.pk, fourth.pk]).update(host=other_host)
+        MealPost.objects.filter(pk__in=[second.pk, third.pk]).update(host=self.host)
+        again, content = self.get(if_none_match=response['ETag'])
+        self.assertEqual(again.status_code, 200)
+        self.assertIn(f'UID:meal-{second.pk}@', content)
+        self.assertNotIn(f'UID:meal-{first.pk}@', content)
+
+    def test_bad_token_is_404(self):
+        url = reverse('calendar_feed', kwargs={'token': f'{self.host.pk}:forged', 'kind': 'hosted'})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class CalendarTextTests(SimpleTestCase):
+    '''Escaping and line folding of .ics content lines (RFC 5545).'''
+
+    def test_escape_text(self):
+        self.assertEqual(escape_text('a,b;c\\d'), 'a\\,b\\;c\\\\d')
+        self.assertEqual(escape_text('one\r\ntwo\nthree\rfour'), 'one\\ntwo\\nthree\\nfour')
+
+    def test_short_line_is_not_folded(self):
+        self.assertEqual(fold_line('SUMMARY:Lunch'), 'SUMMARY:Lunch\r\n')
+        line = 'X' * 75
+        self.assertEqual(fold_line(line), line + '\r\n')
+
+    def test_long_line_is_folded_at_75_octets(self):
+        line = 'DESCRIPTION:' + 'abcdefghij' * 20
+        folded = fold_line(line)
+        physical = folded[:-2].split('\r\n')
+        self.assertGreater(len(physical), 1)
+        for part in physical:
+            self.assertLessEqual(len(part.encode('utf-8')), 75)
+        for part in physical[1:]:
+            self.assertTrue(part.startswith(' '))
+        # Unfolding gives back the original line
+        self.assertEqual(folded[:-2].replace('\r\n ', ''), line)
+
+    def test_folding_keeps_multibyte_characters_whole(self):
+        line = 'SUMMARY:' + 'é🍜' * 40
+        folded = fold_line(line)
+        for part in folded[:-2].split('\r\n'):
+            self.assertLessEqual(len(part.encode('utf-8')), 75)
+        self.assertEqual(folded[:-2].replace('\r\n ', ''), line)
@@ -10,10 +10,13 @@ urlpatterns = [
     # Meal related URLs
     path('', MealPostListView.as_view(), name='meal_list'),
     path('search', MealSearchView.as_view(), name='meal_search'),
+    path('archive', ArchivedMealListView.as_view(), name='meal_archive'),
     path('meal/<int:pk>', MealPostDetailView.as_view(), name='meal_detail'),
     path('meal/create', CreateMealPostView.as_view(), name='create_meal'),
     path('meal/<int:pk>/update', UpdateMealPostView.as_view(), name='update_meal'),
     path('meal/<int:pk>/delete', DeleteMealPostView.as_view(), name='delete_meal'),
+    path('meal/<int:pk>/chat', meal_chat_history, name='meal_chat_history'),
+    path('meal/<int:pk>/chat/stream', meal_chat_stream, name='meal_chat_stream'),
     
     # Join Request URLs
     path('meal/<int:pk>/join', CreateJoinRequestView.as_view(), name='create_join_request'),
@@ -22,6 +25,7 @@ urlpatterns = [
     path('join_request/<int:pk>/accept', accept_join_request, name='accept_join_request'),
     path('join_request/<int:pk>/decline', decline_join_request, name='decline_join_request'),
     path('join_request/<int:pk>/waitlist', waitlist_join_request, name='waitlist_join_request'),
+    path('meal/<int:pk>/join_requests', bulk_update_join_requests, name='bulk_update_join_requests'),
     
     # User Dashboard URLs
     path('my_hosted_meals', MyHostedMealsView.as_view(), name='my_hosted_meals'),
@@ -29,7 +33,9 @@ urlpatterns = [
     
     # Matching and Features
     path('find_matches', find_meal_matches, name='find_matches'),
+    path('locations/heatmap', location_heatmap, name='location_heatmap'),
     path('meal/<int:pk>/calendar', download_calendar_event, name='download_calendar'),
+    path('calendar/<str:token>/<str:kind>.ics', calendar_feed, name='calendar_feed'),
     path('review/<int:pk>/add', add_review, name='add_review'),
     
     # Authentication & Profile
@@ -2,110 +2,116 @@
 # Author: Saksham Goel (sakshamg@bu.edu), 11/27/2025
 # Description: Views for the final project application. Handles logic for meals, profiles, matching, and chat.
 
+import asyncio
+import json
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpResponse
-from datetime import datetime, timedelta
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse, Http404
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils import timezone
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views.decorators.http import require_POST
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import Q, Count, Exists, OuterRef
 from .models import MealPost, UserProfile, JoinRequest, DiningLocation, Review, MealMessage
 from .forms import CreateMealPostForm, UpdateMealPostForm, CreateUserProfileForm, UpdateUserProfileForm, CreateReviewForm, MealMessageForm
+from .seating import update_join_requests, cancel_join_request, promote_waitlist
+from .lifecycle import maybe_complete_past_meals
+from .search import parse_date, parse_meal_filters, search_meals, start_of_day
+from . import occupancy
+from .recommendations import MAX_COMPATIBILITY, compare_profiles, recommend_meals
+from .calendar import FEED_KINDS, calendar_stream, feed_fingerprint, make_calendar_token, read_calendar_token
+from .chat import CHAT_PAGE_SIZE, can_chat, can_stream_chat, get_broker, get_chat_history, serialize_message
+from cs412.middleware import get_cached_profile
 
 # Create your views here.
 
 class MealPostListView(ListView):
-    '''Displays a list of all meal posts, with search and filtering.'''
+    '''Displays a list of meal posts, with search and filtering.'''
     model = MealPost
     template_name = 'project/meal_list.html'
     context_object_name = 'meals'
+    paginate_by = 20
+    # Without a status filter, only list upcoming open meals
+    upcoming_by_default = True
 
     def get_queryset(self):
-        '''Return a queryset of all meal posts, filtered by location, status, and date range.'''
-        queryset = MealPost.objects.all()
-        
-        # Filter by location
-        location_id = self.request.GET.get('location')
-        if location_id:
-            queryset = queryset.filter(location_id=location_id)
-        
-        # Filter by status
-        status = self.request.GET.get('status')
-        if status:
-            queryset = queryset.filter(status=status)
-        
-        # Filter by date range
-        date_from = self.request.GET.get('date_from')
-        if date_from:
-            try:
-                date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
-                queryset = queryset.filter(start_time__date__gte=date_from_obj.date())
-            except:
-                pass
-        
-        date_to = self.request.GET.get('date_to')
-        if date_to:
-            try:
-                date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
-                queryset = queryset.filter(start_time__date__lte=date_to_obj.date())
-            except:
-                pass
-        
-        return queryset
+        '''Return a queryset of meal posts, filtered by location, status, date range, and keyword.'''
+        maybe_complete_past_meals()
+        self.filters = parse_meal_filters(self.request.GET)
+        return search_meals(self.filters, upcoming_by_default=self.upcoming_by_default)
 
     def get_context_data(self, **kwargs):
         '''Return the context data for the meal list view.'''
         context = super().get_context_data(**kwargs)
         context['locations'] = DiningLocation.objects.all()
         context['status_choices'] = MealPost.STATUS_CHOICES
+        context['archived'] = False
+        context['filters'] = self.filters
+        # Current filters, so pagination links keep them
+        params = self.request.GET.copy()
+        params.pop('page', None)
+        context['querystring'] = params.urlencode()
+        return context
+
+class ArchivedMealListView(ListView):
+    '''Displays past, completed and canceled meals, most recent first.'''
+    model = MealPost
+    template_name = 'project/meal_list.html'
+    context_object_name = 'meals'
+    paginate_by = 20
+
+    def get_queryset(self):
+        '''Return meals that are over or called off.'''
+        return MealPost.objects.filter(
+            Q(status__in=['completed', 'canceled']) | Q(start_time__lt=timezone.now())
+        ).select_related('location', 'host').order_by('-start_time')
+
+    def get_context_data(self, **kwargs):
+        '''Return the context data for the archived meal list view.'''
+        context = super().get_context_data(**kwargs)
+        context['archived'] = True
+        context['querystring'] = ''
         return context
 
 class MealPostDetailView(DetailView):
     '''Displays details of a single meal, including join requests and chat.'''
     model = MealPost
+    queryset = MealPost.objects.select_related('host__user', 'location')
     template_name = 'project/meal_detail.html'
     context_object_name = 'meal'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        meal = self.get_object()
-        context['join_requests'] = JoinRequest.objects.filter(meal=meal)
+        meal = self.object
+        # The template shows each requester and compares their user to request.user
+        context['join_requests'] = JoinRequest.objects.filter(meal=meal).select_related('requester__user')
+        user_profile = self.request.meal_profile
         
         # Check permission to chat (only host and accepted guests)
-        can_chat = False
-        if self.request.user.is_authenticated:
-            try:
-                user_profile = UserProfile.objects.get(user=self.request.user)
-                is_host = (meal.host == user_profile)
-                is_guest = JoinRequest.objects.filter(meal=meal, requester=user_profile, status='accepted').exists()
-                if is_host or is_guest:
-                    can_chat = True
-            except UserProfile.DoesNotExist:
-                pass
-        
-        context['can_chat'] = can_chat
-        if can_chat:
-            context['chat_messages'] = meal.messages.all()
+        context['can_chat'] = can_chat(meal, user_profile)
+        if context['can_chat']:
+            # Only render the latest page; older messages load from meal_chat_history
+            context['chat_messages'] = get_chat_history(meal)
             context['chat_form'] = MealMessageForm()
+            # Without ASGI the page polls meal_chat_history instead
+            context['chat_streaming'] = can_stream_chat(self.request)
 
         # Get list of users the current user has already reviewed for this meal
-        if self.request.user.is_authenticated:
-            try:
-                user_profile = UserProfile.objects.get(user=self.request.user)
-                reviewed_user_ids = Review.objects.filter(
-                    reviewer=user_profile, 
-                    meal=meal
-                ).values_list('reviewed_user_id', flat=True)
-                context['reviewed_user_ids'] = list(reviewed_user_ids)
-                
-                # Check if current user has already requested
-                context['has_requested'] = JoinRequest.objects.filter(meal=meal, requester=user_profile).exists()
-            except UserProfile.DoesNotExist:
-                context['reviewed_user_ids'] = []
-                context['has_requested'] = False
+        if user_profile:
+            reviewed_user_ids = Review.objects.filter(
+                reviewer=user_profile, 
+                meal=meal
+            ).values_list('reviewed_user_id', flat=True)
+            context['reviewed_user_ids'] = list(reviewed_user_ids)
+            
+            # Check if current user has already requested
+            context['has_requested'] = JoinRequest.objects.filter(meal=meal, requester=user_profile).exists()
         else:
             context['reviewed_user_ids'] = []
             context['has_requested'] = False
@@ -121,24 +127,125 @@ class MealPostDetailView(DetailView):
         meal = self.object
         
         # Verify permission
-        try:
-            user_profile = UserProfile.objects.get(user=request.user)
-            is_host = (meal.host == user_profile)
-            is_guest = JoinRequest.objects.filter(meal=meal, requester=user_profile, status='accepted').exists()
-            
-            if is_host or is_guest:
-                form = MealMessageForm(request.POST)
-                if form.is_valid():
-                    message = form.save(commit=False)
-                    message.meal = meal
-                    message.sender = user_profile
-                    message.save()
-                    return redirect('meal_detail', pk=meal.pk)
-        except UserProfile.DoesNotExist:
-            pass
+        user_profile = request.meal_profile
+        if can_chat(meal, user_profile):
+            form = MealMessageForm(request.POST)
+            if form.is_valid():
+                message = form.save(commit=False)
+                message.meal = meal
+                message.sender = user_profile
+                message.save()
             
         return redirect('meal_detail', pk=meal.pk)
 
+# Live Chat Views
+# Seconds between keepalive comments on an idle chat stream
+CHAT_KEEPALIVE = 15
+
+def meal_chat_history(request, pk):
+    '''Return a page of a meal's chat history as JSON, oldest first.
+    Pass ?before=<message id> to page backwards through older messages, or
+    ?since=<message id> to poll for only the messages newer than that.
+    Supports ETag/Last-Modified, so an idle poll gets a bodiless 304.'''
+    meal = get_object_or_404(MealPost, pk=pk)
+    if not can_chat(meal, request.meal_profile):
+        return JsonResponse({'error': 'Only the host and accepted guests can view this chat.'}, status=403)
+
+    try:
+        before = int(request.GET['before']) if request.GET.get('before') else None
+        since = int(request.GET['since']) if request.GET.get('since') else None
+    except ValueError:
+        return JsonResponse({'error': 'before and since must be message ids.'}, status=400)
+
+    # The newest message identifies the state of the chat (one index lookup)
+    latest = MealMessage.objects.filter(meal=meal).order_by('-pk').values_list('pk', 'timestamp').first()
+    latest_id, last_modified = latest if latest else (0, None)
+    etag = f'"chat-{meal.pk}-{latest_id}-{before or 0}-{since or 0}"'
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+    if response is None:
+        if since is not None:
+            messages = list(
+                MealMessage.objects.filter(meal=meal, pk__gt=since)
+                .select_related('sender').order_by('pk')[:CHAT_PAGE_SIZE]
+            )
+            cursor = {'since': messages[-1].pk if messages else since}
+        else:
+            messages = get_chat_history(meal, before=before)
+            # Cursor for the next (older) page, if there may be one
+            cursor = {'before': messages[0].pk if len(messages) == CHAT_PAGE_SIZE else None}
+        response = JsonResponse({
+            'messages': [serialize_message(message) for message in messages],
+            **cursor,
+        })
+
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    # Let clients keep the copy but revalidate it on every poll
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+async def meal_chat_stream(request, pk):
+    '''Stream new chat messages for a meal as Server-Sent Events.
+    Permissions are checked once when the client connects; messages then
+    arrive from the chat broker without touching the database. Clients that
+    reconnect with Last-Event-ID get the messages they missed first.
+    Only served under ASGI (see chat.can_stream_chat).'''
+    if not can_stream_chat(request):
+        return HttpResponse('Live chat needs the ASGI server; poll the chat history instead.', status=404)
+
+    meal = await MealPost.objects.filter(pk=pk).afirst()
+    if meal is None:
+        raise Http404('No meal found matching the query')
+
+    user = await request.auser()
+    user_profile = await sync_to_async(get_cached_profile)(UserProfile, user)
+    if not await sync_to_async(can_chat)(meal, user_profile):
+        return HttpResponse('Only the host and accepted guests can view this chat.', status=403)
+
+    try:
+        last_id = int(request.headers.get('Last-Event-ID', ''))
+    except ValueError:
+        last_id = None
+
+    async def event_stream():
+        broker = get_broker()
+        # Subscribe before catching up so nothing is lost in between
+        queue = broker.subscribe(meal.pk)
+        sent_id = last_id or 0
+        try:
+            if last_id is not None:
+                missed = await sync_to_async(list)(
+                    MealMessage.objects.filter(meal=meal, pk__gt=last_id)
+                    .select_related('sender').order_by('pk')[:CHAT_PAGE_SIZE]
+                )
+                for message in missed:
+                    payload = serialize_message(message)
+                    sent_id = payload['id']
+                    yield f"id: {sent_id}\ndata: {json.dumps(payload)}\n\n"
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=CHAT_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                if payload['id'] <= sent_id:
+                    continue
+                sent_id = payload['id']
+                yield f"id: {sent_id}\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            broker.unsubscribe(meal.pk, queue)
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 class CreateMealPostView(LoginRequiredMixin, CreateView):
     '''View for creating a new meal.'''
     form_class = CreateMealPostForm
@@ -147,10 +254,15 @@ class CreateMealPostView(LoginRequiredMixin, CreateView):
     def get_login_url(self):
         return reverse('login')
 
+    def get_context_data(self, **kwargs):
+        '''Add the upcoming crowded location slots, so hosts can avoid them.'''
+        context = super().get_context_data(**kwargs)
+        context['crowded_slots'] = occupancy.get_crowded_slots()
+        return context
+
     def form_valid(self, form):
-        try:
-            user_profile = UserProfile.objects.get(user=self.request.user)
-        except UserProfile.DoesNotExist:
+        user_profile = self.request.meal_profile
+        if not user_profile:
             return redirect('create_profile')
         form.instance.host = user_profile
         return super().form_valid(form)
@@ -171,6 +283,14 @@ class UpdateMealPostView(LoginRequiredMixin, UpdateView):
         # Only allow host to edit
         return MealPost.objects.filter(host__user=self.request.user)
 
+    def form_valid(self, form):
+        '''Save the meal, then fill any seats freed by a higher max_guests from the waitlist.'''
+        # Only write the form's fields, so a concurrent change to accepted_count isn't overwritten
+        self.object = form.save(commit=False)
+        self.object.save(update_fields=[*form.fields, 'updated_at'])
+        promote_waitlist(self.object.pk)
+        return redirect(self.get_success_url())
+
     def get_success_url(self):
         return reverse('meal_detail', kwargs={'pk': self.object.pk})
 
@@ -227,21 +347,24 @@ class UpdateUserProfileView(LoginRequiredMixin, UpdateView):
 
     def dispatch(self, request, *args, **kwargs):
         '''Dispatch the request to the view. This is so that if the user does not have a profile, they are redirected to the create profile page.'''
-        try:
-            UserProfile.objects.get(user=request.user)
-        except UserProfile.DoesNotExist:
+        if request.user.is_authenticated and not request.meal_profile:
             return redirect('create_profile')
         return super().dispatch(request, *args, **kwargs)
 
     def get_object(self):
-        return UserProfile.objects.get(user=self.request.user)
+        return self.request.meal_profile
 
     def get_context_data(self, **kwargs):
         '''Return the context data for the update profile view.'''
         context = super().get_context_data(**kwargs)
-        user_profile = self.get_object()
+        user_profile = self.object
         context['reviews'] = Review.objects.filter(reviewed_user=user_profile).order_by('-created_at')
         context['karma'] = calculate_karma(user_profile)
+        token = make_calendar_token(user_profile)
+        context['calendar_feeds'] = {
+            kind: self.request.build_absolute_uri(reverse('calendar_feed', kwargs={'token': token, 'kind': kind}))
+            for kind in FEED_KINDS
+        }
         return context
 
     def get_success_url(self):
@@ -256,7 +379,7 @@ class UserProfileDetailView(DetailView):
     def get_context_data(self, **kwargs):
         '''Return the context data for the user profile detail view.'''
         context = super().get_context_data(**kwargs)
-        user_profile = self.get_object()
+        user_profile = self.object
         context['reviews'] = Review.objects.filter(reviewed_user=user_profile).order_by('-created_at')
         context['karma'] = calculate_karma(user_profile)
         return context
@@ -280,9 +403,8 @@ class CreateJoinRequestView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         '''Save the form and set the meal and requester to the current user.'''
         meal = MealPost.objects.get(pk=self.kwargs['pk'])
-        try:
-            user_profile = UserProfile.objects.get(user=self.request.user)
-        except UserProfile.DoesNotExist:
+        user_profile = self.request.meal_profile
+        if not user_profile:
             return redirect('create_profile')
         form.instance.meal = meal
         form.instance.requester = user_profile
@@ -319,130 +441,117 @@ class DeleteJoinRequestView(LoginRequiredMixin, DeleteView):
         '''Return a queryset of all join requests for the current user.'''
         return JoinRequest.objects.filter(requester__user=self.request.user)
 
+    def form_valid(self, form):
+        '''Delete the request through seat accounting, so an accepted guest's seat is freed.'''
+        success_url = self.get_success_url()
+        cancel_join_request(self.object)
+        return redirect(success_url)
+
     def get_success_url(self):
-        return reverse('meal_detail', kwargs={'pk': self.object.meal.pk})
+        return reverse('meal_detail', kwargs={'pk': self.object.meal_id})
 
 # Host Actions (Function-Based Views)
-def accept_join_request(request, pk):
-    '''Host action to accept a join request.'''
-    join_request = get_object_or_404(JoinRequest, pk=pk)
+def _set_join_request_status(request, pk, status):
+    '''Shared logic for the single-request host actions below.'''
+    join_request = get_object_or_404(JoinRequest.objects.select_related('meal__host'), pk=pk)
     meal = join_request.meal
     
-    if request.user.is_authenticated and meal.host.user == request.user:
-        join_request.status = 'accepted'
-        join_request.save()
-        
-        # If the meal is full, set the status to full
-        accepted_count = meal.get_accepted_guests()
-        if accepted_count >= meal.max_guests:
-            meal.status = 'full'
-            meal.save()
+    if request.user.is_authenticated and meal.host.user_id == request.user.pk:
+        # Accepting refuses (leaves the request as is) once the meal is full
+        update_join_requests(meal.pk, [join_request.pk], status)
     
     return redirect('meal_detail', pk=meal.pk)
 
+@require_POST
+def accept_join_request(request, pk):
+    '''Host action to accept a join request.'''
+    return _set_join_request_status(request, pk, 'accepted')
+
+@require_POST
 def decline_join_request(request, pk):
     '''Host action to decline a join request.'''
-    join_request = get_object_or_404(JoinRequest, pk=pk)
-    meal = join_request.meal
-    
-    if request.user.is_authenticated and meal.host.user == request.user:
-        join_request.status = 'declined'
-        join_request.save()
-    
-    return redirect('meal_detail', pk=meal.pk)
+    return _set_join_request_status(request, pk, 'declined')
 
+@require_POST
 def waitlist_join_request(request, pk):
     '''Host action to waitlist a join request.'''
-    join_request = get_object_or_404(JoinRequest, pk=pk)
-    meal = join_request.meal
+    return _set_join_request_status(request, pk, 'waitlisted')
+
+# Maps the bulk form's action to the join request status it sets
+BULK_JOIN_REQUEST_ACTIONS = {
+    'accept': 'accepted',
+    'decline': 'declined',
+    'waitlist': 'waitlisted',
+}
+
+@require_POST
+def bulk_update_join_requests(request, pk):
+    '''Host action to accept, decline or waitlist many join requests at once.
+    Expects an `action` and a list of `join_requests` ids. When accepting more
+    requests than there are seats left, the oldest ones get the seats.'''
+    if not request.user.is_authenticated:
+        return redirect('login')
+    meal = get_object_or_404(MealPost, pk=pk, host__user=request.user)
     
-    if request.user.is_authenticated and meal.host.user == request.user:
-        join_request.status = 'waitlisted'
-        join_request.save()
+    status = BULK_JOIN_REQUEST_ACTIONS.get(request.POST.get('action'))
+    request_ids = [pk for pk in request.POST.getlist('join_requests') if pk.isdigit()]
+    if status and request_ids:
+        update_join_requests(meal.pk, request_ids, status)
     
     return redirect('meal_detail', pk=meal.pk)
 
 # Dashboard Views
+def annotate_request_counts(meals):
+    '''Annotate meals with accepted_guests, pending_requests and waitlisted_requests
+    counts, computed in the same query (one conditional COUNT each).'''
+    return meals.annotate(
+        accepted_guests=Count('joinrequest', filter=Q(joinrequest__status='accepted')),
+        pending_requests=Count('joinrequest', filter=Q(joinrequest__status='pending')),
+        waitlisted_requests=Count('joinrequest', filter=Q(joinrequest__status='waitlisted')),
+    )
+
 class MyHostedMealsView(LoginRequiredMixin, ListView):
     '''Displays meals hosted by the current user.'''
     model = MealPost
     template_name = 'project/my_hosted_meals.html'
     context_object_name = 'meals'
+    paginate_by = 20
 
     def get_login_url(self):
         return reverse('login')
 
     def get_queryset(self):
-        try:
-            user_profile = UserProfile.objects.get(user=self.request.user)
-            return MealPost.objects.filter(host=user_profile)
-        except UserProfile.DoesNotExist:
+        user_profile = self.request.meal_profile
+        if not user_profile:
             return MealPost.objects.none()
+        meals = MealPost.objects.filter(host=user_profile).select_related('location', 'host')
+        return annotate_request_counts(meals).order_by('-start_time')
 
 class MyJoinedMealsView(LoginRequiredMixin, ListView):
     '''Displays meals joined by the current user.'''
     model = MealPost
     template_name = 'project/my_joined_meals.html'
     context_object_name = 'meals'
+    paginate_by = 20
 
     def get_login_url(self):
         return reverse('login')
 
     def get_queryset(self):
         '''Return a queryset of all meals joined by the current user.'''
-        try:
-            user_profile = UserProfile.objects.get(user=self.request.user)
-            accepted_requests = JoinRequest.objects.filter(requester=user_profile, status='accepted')
-            meal_ids = accepted_requests.values_list('meal_id', flat=True)
-            return MealPost.objects.filter(pk__in=meal_ids)
-        except UserProfile.DoesNotExist:
+        user_profile = self.request.meal_profile
+        if not user_profile:
             return MealPost.objects.none()
+        # EXISTS rather than a join, so the join doesn't skew the counts
+        accepted = JoinRequest.objects.filter(meal=OuterRef('pk'), requester=user_profile, status='accepted')
+        meals = MealPost.objects.filter(Exists(accepted)).select_related('location', 'host')
+        return annotate_request_counts(meals).order_by('-start_time')
 
 # Search & Filter View
-class MealSearchView(ListView):
-    '''Standalone search view (reuses meal list template).'''
-    model = MealPost
-    template_name = 'project/meal_list.html'
-    context_object_name = 'meals'
-
-    def get_queryset(self):
-        queryset = MealPost.objects.all()
-        
-        # Helper logic same as MealPostListView
-        location_id = self.request.GET.get('location')
-        if location_id:
-            queryset = queryset.filter(location_id=location_id)
-        
-        status = self.request.GET.get('status')
-        if status:
-            queryset = queryset.filter(status=status)
-        
-        # Filter by date range from
-        date_from = self.request.GET.get('date_from')
-        if date_from:
-            try:
-                date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
-                queryset = queryset.filter(start_time__date__gte=date_from_obj.date())
-            except:
-                pass
-        
-        # Filter by date range to
-        date_to = self.request.GET.get('date_to')
-        if date_to:
-            try:
-                date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
-                queryset = queryset.filter(start_time__date__lte=date_to_obj.date())
-            except:
-                pass
-        
-        return queryset
-
-    def get_context_data(self, **kwargs):
-        '''Return the context data for the meal search view.'''
-        context = super().get_context_data(**kwargs)
-        context['locations'] = DiningLocation.objects.all()
-        context['status_choices'] = MealPost.STATUS_CHOICES
-        return context
+class MealSearchView(MealPostListView):
+    '''Standalone search view (reuses meal list template). Unlike the meal
+    list, it searches all meals when no status is given.'''
+    upcoming_by_default = False
 
 # Meal Matching View
 def calculate_karma(user_profile):
@@ -455,66 +564,33 @@ def calculate_karma(user_profile):
     return None
 
 def find_meal_matches(request):
-    '''Find compatible users for meal matching based on preferences.'''
+    '''Find compatible users for meal matching based on preferences.
+    With ?mode=meals, recommend open upcoming meals instead.'''
     if not request.user.is_authenticated:
         return redirect('login')
     
-    try:
-        user_profile = UserProfile.objects.get(user=request.user)
-    except UserProfile.DoesNotExist:
+    user_profile = request.meal_profile
+    if not user_profile:
         return redirect('create_profile')
     
+    if request.GET.get('mode') == 'meals':
+        return render(request, 'project/meal_recommendations.html', {
+            'recommendations': recommend_meals(user_profile),
+            'user_profile': user_profile
+        })
+    
     # Get all other user profiles
     all_profiles = UserProfile.objects.exclude(user=request.user)
     
     # Score matches based on compatibility
     matches = []
     for profile in all_profiles:
-        score = 0
-        match_reasons = []
-        
-        # Same preferred location (3 points)
-        if user_profile.preferred_location and profile.preferred_location:
-            if user_profile.preferred_location == profile.preferred_location:
-                score += 3
-                match_reasons.append(f"Same preferred location: {user_profile.preferred_location.name}")
-        
-        # Same meal time (2 points)
-        if user_profile.usual_meal_time == profile.usual_meal_time:
-            score += 2
-            match_reasons.append(f"Same meal time: {user_profile.usual_meal_time}")
-        
-        # Compatible dietary preferences (2 points)
-        if user_profile.dietary_preference == profile.dietary_preference:
-            score += 2
-            if user_profile.dietary_preference != 'None':
-                match_reasons.append(f"Same dietary preference: {user_profile.dietary_preference}")
-        
-        # Same vibe (1 point)
-        if user_profile.vibe == profile.vibe:
-            score += 1
-            match_reasons.append(f"Same vibe: {user_profile.vibe}")
-
-        # Same social battery (2 points)
-        if user_profile.social_battery == profile.social_battery:
-            score += 2
-            match_reasons.append(f"Same social battery: {user_profile.social_battery}")
-
-        # Same interest (2 points)
-        if user_profile.interest == profile.interest:
-            score += 2
-            match_reasons.append(f"Same interest: {user_profile.interest}")
-
-        # Same spice tolerance (1 point)
-        if user_profile.spice_tolerance == profile.spice_tolerance:
-            score += 1
-            if user_profile.spice_tolerance != 'None':
-                match_reasons.append(f"Same spice tolerance: {user_profile.spice_tolerance}")
+        score, match_reasons = compare_profiles(user_profile, profile)
         
         # Only include profiles with at least some compatibility
         if score > 0:
             # Scale score to be out of 10 (max raw score is 13)
-            scaled_score = round((score / 13) * 10, 1)
+            scaled_score = round((score / MAX_COMPATIBILITY) * 10, 1)
             
             # Add karma
             karma = calculate_karma(profile)
@@ -534,35 +610,58 @@ def find_meal_matches(request):
         'user_profile': user_profile
     })
 
+def location_heatmap(request):
+    '''Return the forecast occupancy of dining locations per hourly slot as JSON.
+    Optional filters: ?location=<id>, ?date=YYYY-MM-DD (default today), ?days=N (max 31).'''
+    start_date = parse_date(request.GET.get('date')) or timezone.localdate()
+    days = request.GET.get('days', '7')
+    days = min(int(days), 31) if days.isdigit() and int(days) > 0 else 7
+    location = request.GET.get('location', '')
+    
+    return JsonResponse({
+        'start': start_of_day(start_date).isoformat(),
+        'days': days,
+        'slots': occupancy.get_heatmap(
+            start_of_day(start_date), days=days,
+            location_id=int(location) if location.isdigit() else None,
+        ),
+    })
+
 def download_calendar_event(request, pk):
     '''Generate and download an .ics calendar file for a meal.'''
-    meal = get_object_or_404(MealPost, pk=pk)
+    meal = get_object_or_404(MealPost.objects.select_related('host', 'location'), pk=pk)
     
-    # Format dates for ICS (YYYYMMDDTHHMMSSZ)
-    start = meal.start_time.strftime('%Y%m%dT%H%M%S')
+    response = HttpResponse(''.join(calendar_stream([meal], name=meal.title)), content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="meal_{pk}.ics"'
+    return response
+
+def calendar_feed(request, token, kind):
+    '''Subscribable .ics feed of a user's hosted and/or accepted meals.
+    The signed token in the URL stands in for a login, since calendar apps
+    can't sign in. Supports ETag so clients polling every few minutes usually
+    get a 304, and streams the feed when it did change. There's no
+    Last-Modified: the newest updated_at doesn't move when a meal leaves the
+    feed, so If-Modified-Since alone would keep removed meals.'''
+    profile_id = read_calendar_token(token)
+    if profile_id is None or kind not in FEED_KINDS:
+        raise Http404('No calendar feed found matching the query')
     
-    # Default duration 1 hour if we don't have end time
-    end_time = meal.start_time + timedelta(hours=1)
-    end = end_time.strftime('%Y%m%dT%H%M%S')
+    hosted = Q(host_id=profile_id)
+    joined = Q(joinrequest__requester_id=profile_id, joinrequest__status='accepted')
+    meals = MealPost.objects.filter({'all': hosted | joined, 'hosted': hosted, 'joined': joined}[kind]).distinct()
     
-    # Construct ICS content
-    ics_content = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Campus Meal Matching//EN",
-        "BEGIN:VEVENT",
-        f"SUMMARY:{meal.title}",
-        f"DTSTART:{start}",
-        f"DTEND:{end}",
-        f"DESCRIPTION:Host: {meal.host.display_name}\\n{meal.description}",
-        f"LOCATION:{meal.location.name}",
-        "END:VEVENT",
-        "END:VCALENDAR"
-    ]
+    # Any meal edit, seat change, or join/leave changes the fingerprint
+    etag = '"feed-{}-{}-{}"'.format(profile_id, kind, feed_fingerprint(meals))
+    response = get_conditional_response(request, etag=etag)
     
-    # Generate the ICS content and return the response
-    response = HttpResponse('\n'.join(ics_content), content_type='text/calendar')
-    response['Content-Disposition'] = f'attachment; filename="meal_{pk}.ics"'
+    if response is None:
+        meals = meals.select_related('host', 'location').order_by('start_time')
+        response = StreamingHttpResponse(
+            calendar_stream(meals.iterator(chunk_size=200), name=f'Campus Meals ({kind})'),
+            content_type='text/calendar; charset=utf-8',
+        )
+    
+    response['ETag'] = etag
     return response
 
 def add_review(request, pk):
@@ -575,9 +674,8 @@ def add_review(request, pk):
     meal = get_object_or_404(MealPost, pk=meal_id)
     
     # Check if review already exists
-    try:
-        reviewer_profile = UserProfile.objects.get(user=request.user)
-    except UserProfile.DoesNotExist:
+    reviewer_profile = request.meal_profile
+    if not reviewer_profile:
         return redirect('create_profile')
 
     existing_review = Review.objects.filter(reviewer=reviewer_profile, reviewed_user=reviewed_user, meal=meal).exists()
@@ -6,6 +6,7 @@
 
 from django.shortcuts import render
 from django.http import HttpResponse, HttpRequest
+from cs412.caching import cached_page
 
 """Views for the quotes app."""
 
@@ -42,6 +43,7 @@ def quote(request):
     }
     return render(request, 'quotes/quote.html', context)
 
+@cached_page(timeout=60 * 60, vary_on_user=False)
 def show_all(request):
     context = {
         'quotes': QUOTES,
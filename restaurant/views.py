@@ -5,6 +5,7 @@
 # the order to display a confirmation page.
 
 from django.shortcuts import render
+from cs412.caching import cached_page
 import random
 import time
 
@@ -23,6 +24,7 @@ SPECIALS = [
 ]
 
 
+@cached_page(timeout=60 * 60, vary_on_user=False)
 def main(request):
     """Render the main/landing page."""
     return render(request, "restaurant/main.html")
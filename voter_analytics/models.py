@@ -2,7 +2,12 @@
 # Author: Saksham Goel (sakshamg@bu.edu), 10/27/2025
 # Description: Models for the voter_analytics application, including Voter model.
 
-from django.db import models
+from django.db import models, transaction
+from cs412.api_cache import bump_model_version
+from cs412.routers import ANALYTICS_DB
+
+# Rows per INSERT statement in load_data()
+LOAD_BATCH_SIZE = 1000
 
 # Create your models here.
 
@@ -65,43 +70,52 @@ def load_data():
 	header = f.readline()  # skip header
 
 	created = 0
-	for line in f:
-		fields = [s.strip() for s in line.strip().split(',')]
-
-		# guard against short/malformed lines
-		if len(fields) < 16:
-			print(f"Skipping malformed line (fields={len(fields)}): {line}")
-			continue
-
-		# create a Voter object and save it to the database
-		try:
-			voter = Voter(
-				last_name=fields[1],
-				first_name=fields[2],
-				street_number=fields[3] or None,
-				street_name=fields[4] or None,
-				apt_number=fields[5] or None,
-				zip_code=fields[6] or None,
-				date_of_birth=fields[7] or None,
-				date_of_registration=fields[8] or None,
-				party=fields[9] or None,
-				precinct=fields[10] or None,
-				v20state=1 if fields[11].upper() == 'TRUE' else 0,
-				v21town=1 if fields[12].upper() == 'TRUE' else 0,
-				v21primary=1 if fields[13].upper() == 'TRUE' else 0,
-				v22general=1 if fields[14].upper() == 'TRUE' else 0,
-				v23town=1 if fields[15].upper() == 'TRUE' else 0,
-				voter_score=int(fields[16]) if len(fields) > 16 and fields[16].isdigit() else 0,
-			)
-			voter.save()
-			created += 1
-			if created % 5000 == 0:
-				print(f"Created {created} voters so far...")
-		except Exception as e:
-			print("Failed to create Voter for line:")
-			print(line)
-			print(e)
+	batch = []
+	# one transaction on the analytics database, inserting in batches
+	with transaction.atomic(using=ANALYTICS_DB):
+		for line in f:
+			fields = [s.strip() for s in line.strip().split(',')]
+
+			# guard against short/malformed lines
+			if len(fields) < 16:
+				print(f"Skipping malformed line (fields={len(fields)}): {line}")
+				continue
+
+			# create a Voter object and queue it for the next batch insert
+			try:
+				batch.append(Voter(
+					last_name=fields[1],
+					first_name=fields[2],
+					street_number=fields[3] or None,
+					street_name=fields[4] or None,
+					apt_number=fields[5] or None,
+					zip_code=fields[6] or None,
+					date_of_birth=fields[7] or None,
+					date_of_registration=fields[8] or None,
+					party=fields[9] or None,
+					precinct=fields[10] or None,
+					v20state=1 if fields[11].upper() == 'TRUE' else 0,
+					v21town=1 if fields[12].upper() == 'TRUE' else 0,
+					v21primary=1 if fields[13].upper() == 'TRUE' else 0,
+					v22general=1 if fields[14].upper() == 'TRUE' else 0,
+					v23town=1 if fields[15].upper() == 'TRUE' else 0,
+					voter_score=int(fields[16]) if len(fields) > 16 and fields[16].isdigit() else 0,
+				))
+				created += 1
+			except Exception as e:
+				print("Failed to create Voter for line:")
+				print(line)
+				print(e)
+
+			if len(batch) >= LOAD_BATCH_SIZE:
+				Voter.objects.using(ANALYTICS_DB).bulk_create(batch)
+				batch = []
+				if created % 5000 == 0:
+					print(f"Created {created} voters so far...")
+		Voter.objects.using(ANALYTICS_DB).bulk_create(batch)
 
 	f.close()
-	total = Voter.objects.count()
+	# bulk_create doesn't send save signals, so drop cached voter pages by hand
+	bump_model_version(Voter)
+	total = Voter.objects.using(ANALYTICS_DB).count()
 	print(f"Done. Created ~{created} new records. Total voters in DB: {total}")
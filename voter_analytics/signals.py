@@ -0,0 +1,9 @@
+# File: voter_analytics/signals.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Signal receivers for the voter_analytics application.
+
+from cs412.caching import connect_cache_invalidation
+from .models import Voter
+
+# Drop the cached filter choices and filter form when voters change
+connect_cache_invalidation(Voter)
@@ -1,3 +1,87 @@
+# File: voter_analytics/tests.py
+# Author: Saksham Goel (sakshamg@bu.edu), 10/19/2026
+# Description: Tests for the voter export and the filters it shares with the voters list.
+
+import csv
+import gzip
+import io
+import json
+from django.db import DEFAULT_DB_ALIAS
 from django.test import TestCase
+from django.urls import reverse
+from cs412.routers import ANALYTICS_DB
+from .models import Voter
+from .views import EXPORT_FIELDS
+
+
+class VoterExportTests(TestCase):
+	"""The export streams exactly the voters the filters select."""
+
+	databases = {DEFAULT_DB_ALIAS, ANALYTICS_DB}
+
+	@classmethod
+	def setUpTestData(cls):
+		def voter(first_name, party, dob, voter_score, v22general):
+			return Voter.objects.create(
+				last_name='Smith', first_name=first_name, street_number='1', street_name='Main St',
+				zip_code='02458', date_of_birth=dob, date_of_registration='2000-01-01', party=party,
+				precinct='1', v20state=1, v21town=0, v21primary=0, v22general=v22general, v23town=0,
+				voter_score=voter_score,
+			)
+		cls.ann = voter('Ann', 'D', '1980-01-01', 2, 1)
+		cls.bob = voter('Bob', 'D', '1950-06-15', 2, 1)
+		cls.cat = voter('Cat', 'R', '1985-03-03', 1, 0)
+		cls.dan = voter('Dan', 'D', '1990-12-31', 1, 0)
+		# DOBs without a year never match a year filter
+		cls.eve = voter('Eve', 'D', '', 1, 1)
+
+	def export(self, query=''):
+		"""Return the export response and its full (streamed) body."""
+		response = self.client.get(reverse('voters_export') + query)
+		self.assertEqual(response.status_code, 200)
+		return response, b''.join(response.streaming_content)
+
+	def exported_ids(self, query):
+		response, body = self.export(query)
+		rows = list(csv.reader(io.StringIO(body.decode())))
+		self.assertEqual(rows[0], EXPORT_FIELDS)
+		return {int(row[0]) for row in rows[1:]}
+
+	def test_csv(self):
+		response, body = self.export()
+		self.assertTrue(response['Content-Type'].startswith('text/csv'))
+		self.assertEqual(response['Content-Disposition'], 'attachment; filename="voters.csv"')
+		rows = list(csv.reader(io.StringIO(body.decode())))
+		self.assertEqual(rows[0], EXPORT_FIELDS)
+		self.assertEqual(len(rows), 6)
+		self.assertEqual(rows[1][:3], [str(self.ann.pk), 'Smith', 'Ann'])
+
+	def test_filters(self):
+		cases = {
+			'?party=R': {self.cat},
+			'?voter_score=2': {self.ann, self.bob},
+			'?v22general=on': {self.ann, self.bob, self.eve},
+			'?min_dob=1980': {self.ann, self.cat, self.dan},
+			'?max_dob=1980': {self.ann, self.bob},
+			'?min_dob=1960&max_dob=1989': {self.ann, self.cat},
+			'?party=D&min_dob=1960&max_dob=1990&v22general=on': {self.ann},
+		}
+		for query, voters in cases.items():
+			with self.subTest(query=query):
+				self.assertEqual(self.exported_ids(query), {v.pk for v in voters})
+
+	def test_ndjson(self):
+		response, body = self.export('?format=ndjson&party=R')
+		self.assertEqual(response['Content-Disposition'], 'attachment; filename="voters.ndjson"')
+		records = [json.loads(line) for line in body.decode().splitlines()]
+		self.assertEqual(len(records), 1)
+		self.assertEqual(list(records[0]), EXPORT_FIELDS)
+		self.assertEqual(records[0]['id'], self.cat.pk)
+		self.assertEqual(records[0]['first_name'], 'Cat')
 
-# Create your tests here.
+	def test_gzip(self):
+		response, body = self.export('?gzip=1&min_dob=1980')
+		self.assertEqual(response['Content-Type'], 'application/gzip')
+		self.assertEqual(response['Content-Disposition'], 'attachment; filename="voters.csv.gz"')
+		rows = list(csv.reader(io.StringIO(gzip.decompress(body).decode())))
+		self.assertEqual({int(row[0]) for row in rows[1:]}, {self.ann.pk, self.cat.pk, self.dan.pk})
@@ -1,12 +1,13 @@
 # File: voter_analytics/urls.py
 # Author: Saksham Goel (sakshamg@bu.edu), 10/27/2025
-# Description: URL routes for the voter_analytics application, including voters and graphs views.
+# Description: URL routes for the voter_analytics application, including voters, export and graphs views.
 
 from django.urls import path
 from . import views 
 
 urlpatterns = [
 	path('', views.VoterListView.as_view(), name='voters'),
+	path('export', views.export_voters, name='voters_export'),
 	path('voter/<int:pk>/', views.VoterDetailView.as_view(), name='voter'),
 	path('graphs/', views.GraphsListView.as_view(), name='graphs'),
 ]
\ No newline at end of file
@@ -4,11 +4,23 @@
 
 from django.shortcuts import render
 from django.views.generic import ListView, DetailView
+from django.core.cache import cache
 from .models import Voter
+from cs412.caching import PAGE_CACHE_TTL, models_version
 import re
 import plotly
 import plotly.graph_objs as go
 from collections import Counter
+from cs412.export import export_response, iter_rows
+
+ELECTIONS = ['v20state', 'v21town', 'v21primary', 'v22general', 'v23town']
+
+# Columns of the voter export, in order
+EXPORT_FIELDS = [
+	'id', 'last_name', 'first_name', 'street_number', 'street_name', 'apt_number',
+	'zip_code', 'date_of_birth', 'date_of_registration', 'party', 'precinct',
+	*ELECTIONS, 'voter_score',
+]
 
 
 def _extract_year(dob_text):
@@ -27,6 +39,75 @@ def _extract_year(dob_text):
 	return None
 
 
+def filter_voters(params):
+	"""Apply the voter filters in a QueryDict (request.GET).
+
+	Returns the queryset with the filters that can be done in the DB, and
+	the (min, max) year of birth filter, or None. Years need the text DOB
+	parsed, so callers check them per row with dob_in_range().
+	"""
+	qs = Voter.objects.all()
+
+	# apply simple filters that can be done in the DB
+	party = params.get('party')
+	if party:
+		qs = qs.filter(party=party)
+
+	score = params.get('voter_score')
+	if score and score.isdigit():
+		qs = qs.filter(voter_score=int(score))
+
+	# election flags: if present and value is 'on' filter v==1
+	for e in ELECTIONS:
+		if params.get(e) == 'on':
+			qs = qs.filter(**{e: 1})
+
+	# date-of-birth year min/max need parsing of text field; done per row
+	min_year = params.get('min_dob')
+	max_year = params.get('max_dob')
+	years = None
+	if min_year or max_year:
+		min_y = int(min_year) if (min_year and min_year.isdigit()) else None
+		max_y = int(max_year) if (max_year and max_year.isdigit()) else None
+		years = (min_y, max_y)
+	return qs, years
+
+
+def dob_in_range(dob_text, min_y, max_y):
+	"""Return True if the year in a text DOB is within [min_y, max_y]
+	(either may be None). DOBs without a year never match."""
+	y = _extract_year(dob_text)
+	if y is None:
+		return False
+	if min_y and y < min_y:
+		return False
+	if max_y and y > max_y:
+		return False
+	return True
+
+
+def get_filter_choices():
+	"""Return the party, year of birth and voter score choices for the
+	filter form. Scanning every DOB is slow, so the result is cached until
+	a voter is saved or deleted."""
+	key = f'voter_filter_choices:{models_version(Voter)}'
+	choices = cache.get(key)
+	if choices is None:
+		# derive years from DOBs
+		years = set()
+		for dob in Voter.objects.values_list('date_of_birth', flat=True):
+			y = _extract_year(dob)
+			if y:
+				years.add(y)
+		choices = {
+			'parties': list(Voter.objects.values_list('party', flat=True).distinct().order_by('party')),
+			'years': sorted(years),
+			'scores': list(Voter.objects.values_list('voter_score', flat=True).distinct().order_by('-voter_score')),
+		}
+		cache.set(key, choices, PAGE_CACHE_TTL)
+	return choices
+
+
 class VoterListView(ListView):
 	"""View to display list of voters"""
 	model = Voter
@@ -36,44 +117,10 @@ class VoterListView(ListView):
 
 	def get_queryset(self):
 		"""Get the queryset of voters."""
-		qs = Voter.objects.all()
-
-		# apply simple filters that can be done in the DB
-		party = self.request.GET.get('party')
-		if party:
-			qs = qs.filter(party=party)
-
-		score = self.request.GET.get('voter_score')
-		if score and score.isdigit():
-			qs = qs.filter(voter_score=int(score))
-
-		# election flags: if present and value is 'on' filter v==1
-		elections = ['v20state', 'v21town', 'v21primary', 'v22general', 'v23town']
-		for e in elections:
-			if self.request.GET.get(e) == 'on':
-				qs = qs.filter(**{e: 1})
-
-		# date-of-birth year min/max need parsing of text field; do in Python
-		min_year = self.request.GET.get('min_dob')
-		max_year = self.request.GET.get('max_dob')
-
-		if min_year or max_year:
-			min_y = int(min_year) if (min_year and min_year.isdigit()) else None
-			max_y = int(max_year) if (max_year and max_year.isdigit()) else None
-
+		qs, years = filter_voters(self.request.GET)
+		if years:
 			# convert queryset to list and filter by extracted year
-			filtered = []
-			for v in qs:
-				y = _extract_year(v.date_of_birth)
-				if y is None:
-					continue
-				if min_y and y < min_y:
-					continue
-				if max_y and y > max_y:
-					continue
-				filtered.append(v)
-			return filtered
-
+			return [v for v in qs if dob_in_range(v.date_of_birth, *years)]
 		return qs
 
 	def get_context_data(self, **kwargs):
@@ -83,17 +130,7 @@ class VoterListView(ListView):
 		ctx = super().get_context_data(**kwargs)
 
 		# choices for filters
-		ctx['parties'] = Voter.objects.values_list('party', flat=True).distinct().order_by('party')
-		# derive years from DOBs
-		years = set()
-		for dob in Voter.objects.values_list('date_of_birth', flat=True):
-			y = _extract_year(dob)
-			if y:
-				years.add(y)
-		ctx['years'] = sorted(years)
-
-		# voter_score choices
-		ctx['scores'] = Voter.objects.values_list('voter_score', flat=True).distinct().order_by('-voter_score')
+		ctx.update(get_filter_choices())
 
 		# keep query params for navigation links
 		ctx['querystring'] = '&'.join([f"{k}={v}" for k, v in self.request.GET.items() if k != 'page'])
@@ -101,6 +138,18 @@ class VoterListView(ListView):
 		return ctx
 
 
+def export_voters(request):
+	"""Stream the voters matching the VoterListView filters as CSV
+	(or NDJSON with ?format=ndjson, gzipped with ?gzip=1)."""
+	qs, years = filter_voters(request.GET)
+	row_filter = None
+	if years:
+		dob = EXPORT_FIELDS.index('date_of_birth')
+		row_filter = lambda row: dob_in_range(row[dob], *years)
+	rows = iter_rows(qs.order_by('pk'), EXPORT_FIELDS, row_filter)
+	return export_response(request, 'voters', EXPORT_FIELDS, rows)
+
+
 class VoterDetailView(DetailView):
 	"""View to display details of a single voter"""
 	model = Voter
@@ -116,44 +165,10 @@ class GraphsListView(ListView):
 
 	def get_queryset(self):
 		"""Apply the same filtering logic as VoterListView"""
-		qs = Voter.objects.all()
-
-		# apply simple filters that can be done in the DB
-		party = self.request.GET.get('party')
-		if party:
-			qs = qs.filter(party=party)
-
-		score = self.request.GET.get('voter_score')
-		if score and score.isdigit():
-			qs = qs.filter(voter_score=int(score))
-
-		# election flags: if present and value is 'on' filter v==1
-		elections = ['v20state', 'v21town', 'v21primary', 'v22general', 'v23town']
-		for e in elections:
-			if self.request.GET.get(e) == 'on':
-				qs = qs.filter(**{e: 1})
-
-		# date-of-birth year min/max need parsing of text field; do in Python
-		min_year = self.request.GET.get('min_dob')
-		max_year = self.request.GET.get('max_dob')
-
-		if min_year or max_year:
-			min_y = int(min_year) if (min_year and min_year.isdigit()) else None
-			max_y = int(max_year) if (max_year and max_year.isdigit()) else None
-
+		qs, years = filter_voters(self.request.GET)
+		if years:
 			# convert queryset to list and filter by extracted year
-			filtered = []
-			for v in qs:
-				y = _extract_year(v.date_of_birth)
-				if y is None:
-					continue
-				if min_y and y < min_y:
-					continue
-				if max_y and y > max_y:
-					continue
-				filtered.append(v)
-			return filtered
-
+			return [v for v in qs if dob_in_range(v.date_of_birth, *years)]
 		return qs
 
 	def get_context_data(self, **kwargs):
@@ -192,7 +207,7 @@ class GraphsListView(ListView):
 		context['graph_div_party'] = graph_div_party
 
 		# Graph 3: Histogram of election participation
-		election_names = ['v20state', 'v21town', 'v21primary', 'v22general', 'v23town']
+		election_names = ELECTIONS
 		election_labels = ['2020 State', '2021 Town', '2021 Primary', '2022 General', '2023 Town']
 		election_counts = []
 		
@@ -208,14 +223,7 @@ class GraphsListView(ListView):
 		context['graph_div_elections'] = graph_div_elections
 
 		# Add filter choices (reuse from VoterListView)
-		context['parties'] = Voter.objects.values_list('party', flat=True).distinct().order_by('party')
-		years = set()
-		for dob in Voter.objects.values_list('date_of_birth', flat=True):
-			y = _extract_year(dob)
-			if y:
-				years.add(y)
-		context['years'] = sorted(years)
-		context['scores'] = Voter.objects.values_list('voter_score', flat=True).distinct().order_by('-voter_score')
+		context.update(get_filter_choices())
 
 		return context
 